@@ -28,16 +28,16 @@ def fmt_us(us):
 
 
 def print_snapshot(snap, slots, pass_num):
-    budget = snap["buffer_duration_us"]
-    avg = snap["callback_avg_us"]
-    peak = snap["callback_peak_us"]
-    cpu = snap["cpu_load_percent"]
-    xruns = snap["xrun_count"]
-    callbacks = snap["callback_count"]
+    budget = snap.buffer_duration_us
+    avg = snap.callback_avg_us
+    peak = snap.callback_peak_us
+    cpu = snap.cpu_load_percent
+    xruns = snap.xrun_count
+    callbacks = snap.callback_count
 
     print(f"\n{'=' * 56}")
     print(f"  Pass {pass_num}  |  {callbacks} callbacks  |  "
-          f"{snap['sample_rate']:.0f} Hz / {snap['block_size']} samples")
+          f"{snap.sample_rate:.0f} Hz / {snap.block_size} samples")
     print(f"{'=' * 56}")
     print(f"  Budget:    {fmt_us(budget)}")
     print(f"  Avg:       {fmt_us(avg):>10}   ({avg / budget * 100:.1f}% of budget)" if budget > 0 else "")
@@ -48,9 +48,9 @@ def print_snapshot(snap, slots, pass_num):
     if slots:
         print(f"\n  {'Slot':>6}  {'Handle':>8}  {'Avg':>12}  {'Peak':>12}")
         print(f"  {'-' * 6}  {'-' * 8}  {'-' * 12}  {'-' * 12}")
-        for slot in slots:
-            print(f"  {slots.index(slot):>6}  {slot['handle']:>8}  "
-                  f"{fmt_us(slot['avg_us']):>12}  {fmt_us(slot['peak_us']):>12}")
+        for i, slot in enumerate(slots):
+            print(f"  {i:>6}  {slot.handle:>8}  "
+                  f"{fmt_us(slot.avg_us):>12}  {fmt_us(slot.peak_us):>12}")
 
 
 def main():
@@ -136,12 +136,12 @@ def main():
             s.render(BLOCK_SIZE)
 
         snap = s.perf.snapshot()
-        threshold_us = s.perf.xrun_threshold * snap["buffer_duration_us"]
+        threshold_us = s.perf.xrun_threshold * snap.buffer_duration_us
         print(f"  Threshold:  {fmt_us(threshold_us)} "
-              f"({s.perf.xrun_threshold:.1f}x of {fmt_us(snap['buffer_duration_us'])} budget)")
-        print(f"  Avg:        {fmt_us(snap['callback_avg_us'])}")
-        print(f"  Xruns:      {snap['xrun_count']}"
-              f"{'  (callbacks too fast to exceed even 10% of budget!)' if snap['xrun_count'] == 0 else ''}")
+              f"({s.perf.xrun_threshold:.1f}x of {fmt_us(snap.buffer_duration_us)} budget)")
+        print(f"  Avg:        {fmt_us(snap.callback_avg_us)}")
+        print(f"  Xruns:      {snap.xrun_count}"
+              f"{'  (callbacks too fast to exceed even 10% of budget!)' if snap.xrun_count == 0 else ''}")
 
         # ── final summary ────────────────────────────────────────
         t.stop()
@@ -2,21 +2,67 @@
 
 from __future__ import annotations
 
+import importlib as _importlib
 import pathlib as _pathlib
+from typing import TYPE_CHECKING
 
-from squeeze.buffer import Buffer
-from squeeze.squeeze import Squeeze
-from squeeze.source import Source
-from squeeze.bus import Bus
-from squeeze.chain import Chain
-from squeeze.clock import Clock
-from squeeze.perf import Perf
-from squeeze.processor import Processor
-from squeeze.send import Send
-from squeeze.transport import Transport
-from squeeze.midi import Midi, MidiDevice, MidiRouteInfo
-from squeeze.types import BufferInfo, ParamDescriptor, PluginInfo
-
-from squeeze._helpers import SqueezeError, set_log_level, set_log_callback
+from squeeze.types import (
+    BufferInfo, ParamDescriptor, PerfSnapshot, PluginInfo, SlotPerf, Tap,
+)
+
+if TYPE_CHECKING:
+    from squeeze._helpers import SqueezeError, set_log_level, set_log_callback
+    from squeeze.buffer import Buffer
+    from squeeze.bus import Bus
+    from squeeze.chain import Chain
+    from squeeze.clock import Clock
+    from squeeze.midi import Midi, MidiDevice, MidiRouteInfo
+    from squeeze.perf import Perf
+    from squeeze.processor import Processor
+    from squeeze.send import Send
+    from squeeze.source import Source
+    from squeeze.squeeze import Squeeze
+    from squeeze.transport import Transport
 
 INTEGRATION_GUIDE = str(_pathlib.Path(__file__).parent / "INTEGRATION.md")
+
+# Everything that reaches the C library is loaded on first access (PEP 562),
+# so `import squeeze` and the plain data types in squeeze.types don't load
+# libsqueeze_ffi until an engine class or helper is actually used.
+_LAZY = {
+    "Buffer": "squeeze.buffer",
+    "Bus": "squeeze.bus",
+    "Chain": "squeeze.chain",
+    "Processor": "squeeze.processor",
+    "Send": "squeeze.send",
+    "Source": "squeeze.source",
+    "Squeeze": "squeeze.squeeze",
+    "SqueezeError": "squeeze._helpers",
+    "set_log_level": "squeeze._helpers",
+    "set_log_callback": "squeeze._helpers",
+    "Clock": "squeeze.clock",
+    "Midi": "squeeze.midi",
+    "MidiDevice": "squeeze.midi",
+    "MidiRouteInfo": "squeeze.midi",
+    "Perf": "squeeze.perf",
+    "Transport": "squeeze.transport",
+}
+
+# `from squeeze import *` resolves each lazy name through __getattr__.
+__all__ = [
+    "BufferInfo", "ParamDescriptor", "PerfSnapshot", "PluginInfo", "SlotPerf",
+    "Tap", "INTEGRATION_GUIDE", *_LAZY,
+]
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module 'squeeze' has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
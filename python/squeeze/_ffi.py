@@ -60,6 +60,15 @@ class SqParamDescriptorList(ctypes.Structure):
         ("count", ctypes.c_int),
     ]
 
+class SqParamDescriptorBlock(ctypes.Structure):
+    _fields_ = [
+        ("strings", ctypes.c_void_p),   # NUL-separated blob, not one C string
+        ("strings_size", ctypes.c_int),
+        ("floats", ctypes.POINTER(ctypes.c_float)),
+        ("ints", ctypes.POINTER(ctypes.c_int)),
+        ("count", ctypes.c_int),
+    ]
+
 class SqStringList(ctypes.Structure):
     _fields_ = [
         ("items", ctypes.POINTER(ctypes.c_char_p)),
@@ -161,6 +170,8 @@ _EP = ctypes.POINTER(ctypes.c_char_p)
 
 def _load_lib():
     """Load the shared library and declare all function signatures."""
+    # CDLL, not PyDLL: ctypes releases the GIL for the length of every call,
+    # so blocking calls (sq_process_events) don't stall other Python threads.
     lib = ctypes.cdll.LoadLibrary(_find_lib())
 
     def _sig(name, restype, argtypes):
@@ -187,14 +198,15 @@ def _load_lib():
 
     # --- Source management ---
     _sig("sq_add_source", _I, [_V, _S])
+    _sig("sq_add_sources", _I, [_V, _I, ctypes.POINTER(_S), ctypes.POINTER(_I)])
     _sig("sq_remove_source", _B, [_V, _I])
     _sig("sq_source_count", _I, [_V])
     _sig("sq_source_generator", _I, [_V, _I])
     _sig("sq_source_name", _V, [_V, _I])  # returns char* (must free)
     _sig("sq_source_gain", _F, [_V, _I])
-    _sig("sq_source_set_gain", None, [_V, _I, _F])
+    _sig("sq_source_set_gain", _F, [_V, _I, _F])
     _sig("sq_source_pan", _F, [_V, _I])
-    _sig("sq_source_set_pan", None, [_V, _I, _F])
+    _sig("sq_source_set_pan", _F, [_V, _I, _F])
     _sig("sq_source_bypassed", _B, [_V, _I])
     _sig("sq_source_set_bypassed", None, [_V, _I, _B])
     _sig("sq_source_midi_assign", None, [_V, _I, _S, _I, _I, _I])
@@ -206,9 +218,9 @@ def _load_lib():
     _sig("sq_master", _I, [_V])
     _sig("sq_bus_name", _V, [_V, _I])  # returns char* (must free)
     _sig("sq_bus_gain", _F, [_V, _I])
-    _sig("sq_bus_set_gain", None, [_V, _I, _F])
+    _sig("sq_bus_set_gain", _F, [_V, _I, _F])
     _sig("sq_bus_pan", _F, [_V, _I])
-    _sig("sq_bus_set_pan", None, [_V, _I, _F])
+    _sig("sq_bus_set_pan", _F, [_V, _I, _F])
     _sig("sq_bus_bypassed", _B, [_V, _I])
     _sig("sq_bus_set_bypassed", None, [_V, _I, _B])
 
@@ -229,18 +241,24 @@ def _load_lib():
     _sig("sq_source_insert_proc", _I, [_V, _I, _I])
     _sig("sq_source_remove_proc", None, [_V, _I, _I])
     _sig("sq_source_chain_size", _I, [_V, _I])
+    _sig("sq_source_chain_handles", _I, [_V, _I, ctypes.POINTER(_I), _I])
 
     # --- Bus chain ---
     _sig("sq_bus_append_proc", _I, [_V, _I])
     _sig("sq_bus_insert_proc", _I, [_V, _I, _I])
     _sig("sq_bus_remove_proc", None, [_V, _I, _I])
     _sig("sq_bus_chain_size", _I, [_V, _I])
+    _sig("sq_bus_chain_handles", _I, [_V, _I, ctypes.POINTER(_I), _I])
 
     # --- Parameters ---
     _sig("sq_get_param", _F, [_V, _I, _S])
     _sig("sq_set_param", _B, [_V, _I, _S, _F])
+    _sig("sq_set_param_many", _I, [_V, _I, _I, ctypes.POINTER(_S), ctypes.POINTER(_F)])
+    _sig("sq_get_param_many", _I, [_V, _I, _I, ctypes.POINTER(_S), ctypes.POINTER(_F)])
     _sig("sq_param_text", _V, [_V, _I, _S])  # returns char* (must free)
     _sig("sq_param_descriptors", SqParamDescriptorList, [_V, _I])
+    _sig("sq_param_descriptors_packed", SqParamDescriptorBlock, [_V, _I])
+    _sig("sq_free_param_descriptor_block", None, [SqParamDescriptorBlock])
 
     # --- Metering ---
     _sig("sq_bus_peak", _F, [_V, _I])
@@ -271,6 +289,8 @@ def _load_lib():
     _sig("sq_schedule_cc", _B, [_V, _I, _D, _I, _I, _I])
     _sig("sq_schedule_pitch_bend", _B, [_V, _I, _D, _I, _I])
     _sig("sq_schedule_param_change", _B, [_V, _I, _D, _S, _F])
+    _sig("sq_schedule_events", _I, [_V, _I, _I, ctypes.POINTER(_D), ctypes.POINTER(_I),
+                                    ctypes.POINTER(_I), ctypes.POINTER(_I), ctypes.POINTER(_F)])
 
     # --- Plugin manager ---
     _sig("sq_load_plugin_cache", _B, [_V, _S, _EP])
@@ -282,6 +302,8 @@ def _load_lib():
 
     # --- MIDI device management ---
     _sig("sq_midi_devices", SqStringList, [_V])
+    _sig("sq_midi_devices_version", ctypes.c_uint64, [_V])
+    _sig("sq_midi_prefetch_devices", None, [_V])
     _sig("sq_midi_open", _B, [_V, _S, _EP])
     _sig("sq_midi_close", None, [_V, _S])
     _sig("sq_midi_open_devices", SqStringList, [_V])
@@ -321,11 +343,13 @@ def _load_lib():
     _sig("sq_perf_reset", None, [_V])
     _sig("sq_perf_slots", SqSlotPerfList, [_V])
     _sig("sq_free_slot_perf_list", None, [SqSlotPerfList])
+    _sig("sq_perf_slots_into", _I, [_V, ctypes.POINTER(SqSlotPerf), _I])
 
     # --- Buffer management ---
     _sig("sq_free_buffer_info", None, [SqBufferInfo])
     _sig("sq_free_id_name_list", None, [SqIdNameList])
     _sig("sq_load_buffer", _I, [_V, _S, _EP])
+    _sig("sq_load_buffers", _I, [_V, _I, ctypes.POINTER(_S), ctypes.POINTER(_I), _EP])
     _sig("sq_create_buffer", _I, [_V, _I, _I, _D, _S, _EP])
     _sig("sq_remove_buffer", _B, [_V, _I])
     _sig("sq_buffer_count", _I, [_V])
@@ -342,6 +366,8 @@ def _load_lib():
     _sig("sq_buffer_set_tempo", None, [_V, _I, _D])
     _sig("sq_buffer_read", _I, [_V, _I, _I, _I, ctypes.POINTER(ctypes.c_float), _I])
     _sig("sq_buffer_write", _I, [_V, _I, _I, _I, ctypes.POINTER(ctypes.c_float), _I])
+    _sig("sq_buffer_write_all", _I, [_V, _I, _I, ctypes.POINTER(ctypes.c_float), _I, _I])
+    _sig("sq_buffer_data", ctypes.POINTER(ctypes.c_float), [_V, _I, _I, ctypes.POINTER(_I)])
     _sig("sq_buffer_clear", None, [_V, _I])
 
     # --- Source with PlayerProcessor ---
@@ -350,6 +376,7 @@ def _load_lib():
 
     # --- Testing ---
     _sig("sq_render", None, [_V, _I])
+    _sig("sq_render_blocks", None, [_V, _I, _I])
 
     return lib
 
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import ctypes
-from typing import Callable
+import functools
+from typing import Any, Callable
 
 from squeeze._ffi import lib, LogCallbackType, SqStringList
 
@@ -17,6 +18,7 @@ def check_error(error_ptr: ctypes.c_char_p) -> None:
     if error_ptr.value is not None:
         msg = error_ptr.value.decode()
         lib.sq_free_string(error_ptr)
+        error_ptr.value = None
         raise SqueezeError(msg)
 
 
@@ -25,6 +27,25 @@ def make_error_ptr() -> ctypes.c_char_p:
     return ctypes.c_char_p(None)
 
 
+# struct format codes a buffer must have to be passed as that C type.
+_C_FORMATS = {ctypes.c_double: "d", ctypes.c_int: "il", ctypes.c_float: "f"}
+
+
+def as_c_array(ctype: Any, data: Any, n: int) -> Any:
+    """A ctypes array of *n* items over *data*: zero-copy for a matching
+    writable contiguous buffer (array.array, NumPy array), else a
+    converted copy."""
+    try:
+        mv = memoryview(data)
+    except TypeError:
+        return (ctype * n)(*data)
+    if (mv.ndim == 1 and mv.c_contiguous and not mv.readonly
+            and mv.itemsize == ctypes.sizeof(ctype)
+            and mv.format[-1:] in _C_FORMATS[ctype]):
+        return (ctype * n).from_buffer(mv)
+    return (ctype * n)(*mv.tolist())
+
+
 def decode_string(ptr: ctypes.c_void_p | None) -> str:
     """Decode a C string (void* pointer) returned by sq_*, free it, return Python str."""
     if ptr is None:
@@ -38,22 +59,34 @@ def decode_string(ptr: ctypes.c_void_p | None) -> str:
     return result
 
 
+def decode_cstr(raw: bytes | None) -> str:
+    """Decode a c_char_p struct field (bytes, or None for NULL) to str."""
+    return raw.decode() if raw else ""
+
+
 def string_list_to_python(sq_list: SqStringList) -> list[str]:
     """Convert SqStringList to Python list[str] and free the C list."""
-    result: list[str] = []
-    for i in range(sq_list.count):
-        result.append(sq_list.items[i].decode())
+    result = [item.decode() for item in sq_list.items[:sq_list.count]]
     lib.sq_free_string_list(sq_list)
     return result
 
 
 def encode(s: str | bytes | None) -> bytes | None:
-    """Encode a Python string for C ABI (bytes or None)."""
+    """Encode a Python string for C ABI (bytes or None).
+
+    Used for file paths, which rarely repeat; names go through encode_cached.
+    """
     if s is None:
         return None
     return s.encode() if isinstance(s, str) else s
 
 
+@functools.lru_cache(maxsize=4096)
+def encode_cached(s: str) -> bytes:
+    """Encode a name for C ABI, memoized — param/device/plugin names repeat."""
+    return s.encode()
+
+
 # --- Logging ---
 
 _active_callback: object | None = None  # prevent GC of the ctypes callback
@@ -2,22 +2,36 @@
 
 from __future__ import annotations
 
+import array
 import ctypes
+import weakref
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from squeeze._ffi import lib
-from squeeze._helpers import decode_string
+from squeeze._helpers import as_c_array, decode_string
+from squeeze.types import BufferInfo
 
 if TYPE_CHECKING:
     from squeeze.squeeze import Squeeze
 
 
+class _Keepalive:
+    """Token held by every live ``Buffer.view()`` array; a finalizer on it
+    frees engine storage once the last view is dropped."""
+
+    __slots__ = ("__weakref__",)
+
+
 class Buffer:
     """A handle to an audio buffer in the engine."""
 
+    __slots__ = ("_engine", "_buffer_id", "_hash")
+
     def __init__(self, engine: Squeeze, buffer_id: int):
         self._engine = engine
         self._buffer_id = buffer_id
+        self._hash = buffer_id  # an int hashes to itself
 
     @property
     def buffer_id(self) -> int:
@@ -47,6 +61,15 @@ class Buffer:
             return ""
         return decode_string(ptr)
 
+    @property
+    def info(self) -> BufferInfo:
+        """All of this buffer's metadata from one FFI call.
+
+        Cheaper than reading several of the individual properties, which
+        each cross the FFI boundary.
+        """
+        return self._engine.buffer_info(self._buffer_id)
+
     @property
     def length_seconds(self) -> float:
         """Length in seconds."""
@@ -95,40 +118,118 @@ class Buffer:
         )
         return list(dest[:nread])
 
-    def write(self, channel: int, data: list[float],
+    def write(self, channel: int, data: Sequence[float],
               offset: int = 0) -> int:
         """Write samples into the buffer.
 
         Args:
             channel: Channel index.
-            data: List of float sample values to write.
+            data: Float sample values to write. A contiguous writable
+                float32 buffer (``array.array("f")``, a NumPy float32
+                array) is passed to the engine without conversion.
             offset: Sample offset to start writing at.
 
         Returns:
             Number of samples actually written.
         """
         n = len(data)
-        src = (ctypes.c_float * n)(*data)
+        src = as_c_array(ctypes.c_float, data, n)
         return lib.sq_buffer_write(
             self._engine._ptr, self._buffer_id, channel,
             offset, src, n
         )
 
+    def write_all(self, data: Sequence[Sequence[float]],
+                  offset: int = 0) -> int:
+        """Write every channel in one call.
+
+        Args:
+            data: One equal-length sample sequence per channel, i.e. a
+                (channels, length) array. A C-contiguous writable float32
+                NumPy array is passed to the engine without conversion.
+                Rows beyond the buffer's channel count are ignored.
+            offset: Sample offset to start writing at.
+
+        Returns:
+            Number of samples written per channel.
+
+        Raises:
+            ValueError: If the channels differ in length.
+        """
+        channels = len(data)
+        n = len(data[0]) if channels else 0
+        try:
+            mv = memoryview(data)  # type: ignore[arg-type]
+        except TypeError:
+            mv = None
+        flat: memoryview[float] | array.array[float]
+        if (mv is not None and mv.ndim == 2 and mv.c_contiguous
+                and mv.format == "f"):
+            flat = mv.cast("B").cast("f")
+        else:
+            flat = array.array("f")
+            for row in data:
+                if len(row) != n:
+                    raise ValueError("all channels must have the same length")
+                flat.extend(float(x) for x in row)
+        src = as_c_array(ctypes.c_float, flat, channels * n)
+        return lib.sq_buffer_write_all(
+            self._engine._ptr, self._buffer_id, offset,
+            src, channels, n
+        )
+
+    def view(self, channel: int) -> memoryview[float]:
+        """Writable zero-copy view of one channel's samples (format "f").
+
+        The view aliases engine memory: writes land in the buffer directly,
+        and ``numpy.asarray(view)`` wraps it without copying. While the view
+        (or anything derived from it) is alive its storage stays valid:
+        ``remove()`` and ``Squeeze.close()`` defer freeing it until the last
+        view is released or dropped. An unknown channel gives an empty view.
+        """
+        length = ctypes.c_int(0)
+        ptr = lib.sq_buffer_data(
+            self._engine._ptr, self._buffer_id, channel, ctypes.byref(length)
+        )
+        n = length.value
+        if not ptr or n <= 0:
+            return memoryview(bytearray()).cast("f")
+        samples = (ctypes.c_float * n).from_address(ctypes.addressof(ptr.contents))
+        # Every view and slice of the memoryview keeps `samples` alive, and
+        # `samples` keeps the engine alive, so it can't be collected under it.
+        samples._engine = self._engine  # type: ignore[attr-defined]
+        self._engine._buffer_views.setdefault(self._buffer_id, []).append(
+            weakref.ref(samples))
+        return memoryview(samples).cast("B").cast("f")
+
     def clear(self) -> None:
         """Zero all samples and reset write_position to 0."""
         lib.sq_buffer_clear(self._engine._ptr, self._buffer_id)
 
     def remove(self) -> bool:
-        """Remove this buffer from the engine."""
-        return lib.sq_remove_buffer(self._engine._ptr, self._buffer_id)
+        """Remove this buffer from the engine.
+
+        If a ``view()`` of it is still alive, the removal happens when the
+        last view is dropped, and True is returned now.
+        """
+        views = self._engine._live_views(self._buffer_id)
+        if views:
+            token = _Keepalive()
+            weakref.finalize(token, self._engine._remove_buffer, self._buffer_id)
+            for samples in views:
+                samples._pending_remove = token
+            return True
+        return self._engine._remove_buffer(self._buffer_id)
 
     def __repr__(self) -> str:
         return f"Buffer({self._buffer_id}, {self.name!r})"
 
     def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
         if isinstance(other, Buffer):
             return self._buffer_id == other._buffer_id
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self._buffer_id)
+        return self._hash
@@ -7,107 +7,152 @@ from typing import TYPE_CHECKING
 from squeeze._ffi import lib
 from squeeze._helpers import decode_string
 from squeeze.chain import Chain
-from squeeze.send import Send
+from squeeze.send import Send, _TAP_NAMES, _pre_fader
+from squeeze.types import Tap
 
 if TYPE_CHECKING:
     from squeeze.squeeze import Squeeze
 
+# Hot-path FFI functions bound once, so each call skips the lib lookup.
+_sq_bus_gain = lib.sq_bus_gain
+_sq_bus_set_gain = lib.sq_bus_set_gain
+_sq_bus_pan = lib.sq_bus_pan
+_sq_bus_set_pan = lib.sq_bus_set_pan
+_sq_bus_bypassed = lib.sq_bus_bypassed
+_sq_bus_set_bypassed = lib.sq_bus_set_bypassed
+_sq_bus_peak = lib.sq_bus_peak
+_sq_bus_rms = lib.sq_bus_rms
+
 
 class Bus:
     """A summing point with insert chain and routing."""
 
+    __slots__ = ("_engine", "_ptr", "handle", "_hash", "_name", "_chain",
+                 "__weakref__")
+
     def __init__(self, engine: Squeeze, handle: int):
         self._engine = engine
-        self._handle = handle
-
-    @property
-    def handle(self) -> int:
-        return self._handle
+        # Engine pointer held directly; Squeeze.close() clears it.
+        self._ptr = engine._ptr
+        self.handle = handle  # plain slot for cheap reads; don't reassign
+        self._hash = handle  # an int hashes to itself
+        self._name: str | None = None
+        self._chain: Chain | None = None
+        engine._wrappers.add(self)
 
     @property
     def name(self) -> str:
         """Bus name."""
-        return decode_string(lib.sq_bus_name(self._engine._ptr, self._handle))
+        # Names are fixed at creation, so one decode per wrapper suffices.
+        if self._name is None:
+            name = decode_string(lib.sq_bus_name(self._ptr, self.handle))
+            if not name:
+                return name  # unknown handle — don't pin it
+            self._name = name
+        return self._name
 
     # --- Insert chain ---
 
     @property
     def chain(self) -> Chain:
         """The insert effects chain."""
-        return Chain(self._engine, self._handle, "bus")
+        # One per wrapper; the handle cache it reads lives on the engine,
+        # keyed by this handle, so all wrappers' chains agree.
+        if self._chain is None:
+            self._chain = Chain(self._engine, self.handle, "bus")
+        return self._chain
 
     # --- Gain and Pan ---
 
     @property
     def gain(self) -> float:
         """Linear gain (0.0-1.0+). Default 1.0 (unity)."""
-        return lib.sq_bus_gain(self._engine._ptr, self._handle)
+        # Cached per handle on the engine; every setter stores the value the
+        # engine applied, so one read serves all wrappers of this bus.
+        gains = self._engine._gains
+        gain = gains.get(self.handle)
+        if gain is None:
+            gain = gains[self.handle] = _sq_bus_gain(self._ptr, self.handle)
+        return gain
 
     @gain.setter
     def gain(self, value: float) -> None:
-        lib.sq_bus_set_gain(self._engine._ptr, self._handle, value)
+        self._engine._gains[self.handle] = _sq_bus_set_gain(
+            self._ptr, self.handle, value)
 
     @property
     def pan(self) -> float:
         """Stereo pan (-1.0 left to 1.0 right). Default 0.0 (center)."""
-        return lib.sq_bus_pan(self._engine._ptr, self._handle)
+        pans = self._engine._pans
+        pan = pans.get(self.handle)
+        if pan is None:
+            pan = pans[self.handle] = _sq_bus_pan(self._ptr, self.handle)
+        return pan
 
     @pan.setter
     def pan(self, value: float) -> None:
-        lib.sq_bus_set_pan(self._engine._ptr, self._handle, value)
+        self._engine._pans[self.handle] = _sq_bus_set_pan(
+            self._ptr, self.handle, value)
 
     # --- Bypass ---
 
     @property
     def bypassed(self) -> bool:
-        return lib.sq_bus_bypassed(self._engine._ptr, self._handle)
+        return _sq_bus_bypassed(self._ptr, self.handle)
 
     @bypassed.setter
     def bypassed(self, value: bool) -> None:
-        lib.sq_bus_set_bypassed(self._engine._ptr, self._handle, value)
+        _sq_bus_set_bypassed(self._ptr, self.handle, value)
 
     # --- Routing ---
 
     def route_to(self, bus: Bus) -> None:
         """Route this bus's output to another bus."""
-        lib.sq_bus_route(self._engine._ptr, self._handle, bus.handle)
+        lib.sq_bus_route(self._ptr, self.handle, bus.handle)
 
-    def send(self, bus: Bus, *, level: float = 0.0, tap: str = "post") -> Send:
+    def send(self, bus: Bus, *, level: float = 0.0, tap: Tap | str = "post") -> Send:
         """Add a send to a bus. Returns a Send object.
 
-        tap: "pre" (pre-fader) or "post" (post-fader, default).
+        tap: "pre" (pre-fader) or "post" (post-fader, default), or a ``Tap``.
         """
-        pre_fader = 1 if tap == "pre" else 0
+        pre_fader = _pre_fader(tap)
         send_id = lib.sq_bus_send(
-            self._engine._ptr, self._handle, bus.handle, level, pre_fader)
-        return Send(self._engine, self._handle, send_id, "bus",
-                    level=level, tap=tap)
+            self._ptr, self.handle, bus.handle, level, pre_fader)
+        return Send(self._engine, self.handle, send_id, "bus",
+                    level=level, tap=_TAP_NAMES[pre_fader])
 
     # --- Metering ---
 
     @property
     def peak(self) -> float:
         """Current peak level (0.0-1.0+)."""
-        return lib.sq_bus_peak(self._engine._ptr, self._handle)
+        return _sq_bus_peak(self._ptr, self.handle)
 
     @property
     def rms(self) -> float:
         """Current RMS level."""
-        return lib.sq_bus_rms(self._engine._ptr, self._handle)
+        return _sq_bus_rms(self._ptr, self.handle)
 
     # --- Lifecycle ---
 
     def remove(self) -> bool:
         """Remove this bus from the engine. Cannot remove Master."""
-        return lib.sq_remove_bus(self._engine._ptr, self._handle)
+        removed: bool = lib.sq_remove_bus(self._ptr, self.handle)
+        if removed:
+            self._name = None
+            self._chain = None
+            self._engine._forget_node(self.handle)
+        return removed
 
     def __repr__(self) -> str:
         return f"Bus({self.name!r})"
 
     def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
         if isinstance(other, Bus):
-            return self._handle == other._handle
+            return self.handle == other.handle
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self._handle)
+        return self._hash
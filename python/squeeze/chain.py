@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import ctypes
 from typing import TYPE_CHECKING
 
 from squeeze._ffi import lib
@@ -10,58 +11,82 @@ from squeeze.processor import Processor
 if TYPE_CHECKING:
     from squeeze.squeeze import Squeeze
 
+# owner_type -> (append, insert, remove, handles) FFI functions, picked once
+# per Chain so each call doesn't compare the owner type string.
+_CHAIN_FNS = {
+    "source": (lib.sq_source_append_proc, lib.sq_source_insert_proc,
+               lib.sq_source_remove_proc, lib.sq_source_chain_handles),
+    "bus": (lib.sq_bus_append_proc, lib.sq_bus_insert_proc,
+            lib.sq_bus_remove_proc, lib.sq_bus_chain_handles),
+}
+
 
 class Chain:
     """Ordered list of processors — the insert rack."""
 
+    __slots__ = ("_engine", "_owner", "_type", "_append_fn", "_insert_fn",
+                 "_remove_fn", "_handles_fn", "_buf")
+
     def __init__(self, engine: Squeeze, owner_handle: int, owner_type: str):
         """owner_type is 'source' or 'bus'."""
         self._engine = engine
         self._owner = owner_handle
         self._type = owner_type
+        (self._append_fn, self._insert_fn,
+         self._remove_fn, self._handles_fn) = _CHAIN_FNS[owner_type]
+        # Scratch array the engine copies handles into; grown when it
+        # reports more.
+        self._buf = (ctypes.c_int * 16)()
+
+    def _handles(self) -> tuple[int, ...]:
+        """Processor handles in chain order.
+
+        Copied from the engine in one call and cached per owner on the
+        engine, so every Chain of this source/bus shares it until any of
+        them edits the chain or the owner is removed.
+        """
+        cache = self._engine._chain_handles
+        handles = cache.get(self._owner)
+        if handles is None:
+            ptr = self._engine._ptr
+            buf = self._buf
+            n = self._handles_fn(ptr, self._owner, buf, len(buf))
+            if n > len(buf):
+                buf = self._buf = (ctypes.c_int * n)()
+                n = min(n, self._handles_fn(ptr, self._owner, buf, n))
+            handles = cache[self._owner] = tuple(buf[:n])
+        return handles
 
     def append(self, plugin_path: str = "") -> Processor:
         """Append a processor to the end of the chain. Returns a Processor."""
-        if self._type == "source":
-            h = lib.sq_source_append_proc(self._engine._ptr, self._owner)
-        else:
-            h = lib.sq_bus_append_proc(self._engine._ptr, self._owner)
-        return Processor(self._engine, h)
+        h = self._append_fn(self._engine._ptr, self._owner)
+        self._engine._chain_handles.pop(self._owner, None)
+        return self._engine._wrap_processor(h)
 
     def insert(self, index: int, plugin_path: str = "") -> Processor:
         """Insert a processor at the given index. Returns a Processor."""
-        if self._type == "source":
-            h = lib.sq_source_insert_proc(self._engine._ptr, self._owner, index)
-        else:
-            h = lib.sq_bus_insert_proc(self._engine._ptr, self._owner, index)
-        return Processor(self._engine, h)
+        h = self._insert_fn(self._engine._ptr, self._owner, index)
+        self._engine._chain_handles.pop(self._owner, None)
+        return self._engine._wrap_processor(h)
 
     def remove(self, index: int) -> None:
         """Remove the processor at the given index."""
-        if self._type == "source":
-            lib.sq_source_remove_proc(self._engine._ptr, self._owner, index)
-        else:
-            lib.sq_bus_remove_proc(self._engine._ptr, self._owner, index)
+        self._remove_fn(self._engine._ptr, self._owner, index)
+        self._engine._chain_handles.pop(self._owner, None)
 
     def __len__(self) -> int:
         """Number of processors in the chain."""
-        if self._type == "source":
-            return lib.sq_source_chain_size(self._engine._ptr, self._owner)
-        else:
-            return lib.sq_bus_chain_size(self._engine._ptr, self._owner)
+        return len(self._handles())
 
     def __getitem__(self, index: int) -> Processor:
         """Access a processor by index. Raises IndexError if out of range."""
-        size = len(self)
+        handles = self._handles()
+        size = len(handles)
         if index < 0:
             index += size
         if index < 0 or index >= size:
             raise IndexError(f"chain index {index} out of range (size {size})")
-        # Chain doesn't expose proc handles by index yet — use append handle tracking
-        # For now, this is a limitation. Return a Processor with handle -1 as placeholder.
-        raise IndexError(
-            "Chain.__getitem__ requires per-index proc handle query (not yet in FFI)"
-        )
+        return self._engine._wrap_processor(handles[index])
 
     def __repr__(self) -> str:
         return f"Chain({self._type}, size={len(self)})"
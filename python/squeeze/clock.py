@@ -16,6 +16,9 @@ class Clock:
     Created via ``Squeeze.clock()``. Do not instantiate directly.
     """
 
+    __slots__ = ("_py_callback", "_c_callback", "_engine", "_ptr",
+                 "_resolution", "_latency_ms")
+
     def __init__(self, engine: Squeeze, resolution: float, latency_ms: float,
                  callback: Callable[[float], None]):
         # Wrap user callback into a ctypes-compatible function.
@@ -33,20 +36,23 @@ class Clock:
                 f"Failed to create clock (resolution={resolution}, "
                 f"latency_ms={latency_ms})"
             )
+        # Fixed at creation — the C handle stores them verbatim.
+        self._resolution = float(resolution)
+        self._latency_ms = float(latency_ms)
 
     @property
     def resolution(self) -> float:
         """Beat interval (e.g., 0.25 for sixteenth notes)."""
         if not self._ptr:
             return 0.0
-        return lib.sq_clock_get_resolution(self._ptr)
+        return self._resolution
 
     @property
     def latency_ms(self) -> float:
         """Lookahead in milliseconds."""
         if not self._ptr:
             return 0.0
-        return lib.sq_clock_get_latency(self._ptr)
+        return self._latency_ms
 
     def destroy(self) -> None:
         """Unsubscribe and release resources."""
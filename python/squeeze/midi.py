@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from squeeze._ffi import lib
-from squeeze._helpers import SqueezeError, make_error_ptr, check_error, string_list_to_python, encode
+from squeeze._helpers import (
+    SqueezeError, check_error, decode_cstr, string_list_to_python, encode_cached,
+)
 
 if TYPE_CHECKING:
     from squeeze.squeeze import Squeeze
 
+# Seconds a devices enumeration is reused. Listing OS MIDI inputs can take
+# far longer than a render call, and "list, then open" asks twice in a row.
+_DEVICES_TTL = 2.0
 
-@dataclass
+
+@dataclass(slots=True)
 class MidiRouteInfo:
     """Information about an active MIDI route."""
     id: int
@@ -26,20 +33,55 @@ class MidiRouteInfo:
 class Midi:
     """Sub-object for MIDI device management. Accessed via squeeze.midi."""
 
+    __slots__ = ("_engine", "_devices", "_devices_cache", "_devices_expiry",
+                 "_devices_seen_version")
+
     def __init__(self, engine: Squeeze):
         self._engine = engine
+        # One MidiDevice per name, shared by every devices/open_devices call.
+        self._devices: dict[str, MidiDevice] = {}
+        self._devices_cache: list[MidiDevice] = []
+        self._devices_expiry = 0.0  # time.monotonic() deadline; 0 = stale
+        self._devices_seen_version = 0  # devices_version the cache was built at
+
+    def _device(self, name: str) -> MidiDevice:
+        dev = self._devices.get(name)
+        if dev is None:
+            dev = self._devices[name] = MidiDevice(self._engine, name)
+        return dev
 
     @property
     def devices(self) -> list[MidiDevice]:
-        """Available MIDI input devices."""
-        names = string_list_to_python(lib.sq_midi_devices(self._engine._ptr))
-        return [MidiDevice(self._engine, name) for name in names]
+        """Available MIDI input devices.
+
+        The enumeration is reused for a couple of seconds, and refreshed
+        early when a device is opened or closed, or when the OS reports a
+        device plugged in or removed (see devices_version).
+        """
+        now = time.monotonic()
+        version = self.devices_version
+        if now >= self._devices_expiry or version != self._devices_seen_version:
+            names = string_list_to_python(lib.sq_midi_devices(self._engine._ptr))
+            self._devices_cache = [self._device(name) for name in names]
+            self._devices_expiry = now + _DEVICES_TTL
+            self._devices_seen_version = version
+        return list(self._devices_cache)
+
+    @property
+    def devices_version(self) -> int:
+        """Counter bumped each time the OS reports MIDI devices added or
+        removed. Notifications arrive through the message loop, so they
+        need run() or process_events() to be pumping."""
+        return lib.sq_midi_devices_version(self._engine._ptr)
+
+    def _invalidate_devices(self) -> None:
+        self._devices_expiry = 0.0
 
     @property
     def open_devices(self) -> list[MidiDevice]:
         """Currently open MIDI devices."""
         names = string_list_to_python(lib.sq_midi_open_devices(self._engine._ptr))
-        return [MidiDevice(self._engine, name) for name in names]
+        return [self._device(name) for name in names]
 
     def route(self, device: str, source_handle: int, *,
               channel: int = 0, note_range: tuple[int, int] = (0, 127)) -> int:
@@ -51,9 +93,9 @@ class Midi:
             channel: Channel filter (0 = all, 1-16 = specific).
             note_range: (low, high) note range filter.
         """
-        err = make_error_ptr()
+        err = self._engine._reset_err()
         route_id = lib.sq_midi_route(
-            self._engine._ptr, encode(device), source_handle,
+            self._engine._ptr, encode_cached(device), source_handle,
             channel, note_range[0], note_range[1], err
         )
         if route_id < 0:
@@ -73,12 +115,12 @@ class Midi:
         for i in range(route_list.count):
             r = route_list.routes[i]
             result.append(MidiRouteInfo(
-                id=r.id,
-                device=r.device.decode() if r.device else "",
-                target_handle=r.target_handle,
-                channel_filter=r.channel_filter,
-                note_low=r.note_low,
-                note_high=r.note_high,
+                r.id,
+                decode_cstr(r.device),
+                r.target_handle,
+                r.channel_filter,
+                r.note_low,
+                r.note_high,
             ))
         lib.sq_free_midi_route_list(route_list)
         return result
@@ -87,9 +129,12 @@ class Midi:
 class MidiDevice:
     """Represents a MIDI input device."""
 
+    __slots__ = ("_engine", "_name", "_cname")
+
     def __init__(self, engine: Squeeze, name: str):
         self._engine = engine
         self._name = name
+        self._cname = encode_cached(name)  # fixed, so encoded once
 
     @property
     def name(self) -> str:
@@ -97,14 +142,16 @@ class MidiDevice:
 
     def open(self) -> None:
         """Open this MIDI device. Raises SqueezeError on failure."""
-        err = make_error_ptr()
-        ok = lib.sq_midi_open(self._engine._ptr, encode(self._name), err)
+        err = self._engine._reset_err()
+        ok = lib.sq_midi_open(self._engine._ptr, self._cname, err)
+        self._engine.midi._invalidate_devices()
         if not ok:
             check_error(err)
 
     def close(self) -> None:
         """Close this MIDI device. No-op if not open."""
-        lib.sq_midi_close(self._engine._ptr, encode(self._name))
+        lib.sq_midi_close(self._engine._ptr, self._cname)
+        self._engine.midi._invalidate_devices()
 
     def __repr__(self) -> str:
         return f"MidiDevice({self._name!r})"
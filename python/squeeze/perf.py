@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
+import ctypes
+import struct
 from typing import TYPE_CHECKING
 
-from squeeze._ffi import lib
+from squeeze._ffi import lib, SqSlotPerf
+from squeeze.types import PerfSnapshot, SlotPerf
 
 if TYPE_CHECKING:
     from squeeze.squeeze import Squeeze
 
+# Row layout of SqSlotPerf, so slots() can unpack the whole buffer in one
+# pass instead of reading three ctypes fields per row.
+_SLOT_ROW = struct.Struct("@idd")
+assert _SLOT_ROW.size == ctypes.sizeof(SqSlotPerf)
+
 
 class Perf:
     """Performance monitoring. Accessed via ``squeeze.perf``."""
 
+    __slots__ = ("_engine", "_slot_buf")
+
     def __init__(self, engine: Squeeze):
         self._engine = engine
+        # Reused across slots() calls; grown when the engine reports more.
+        self._slot_buf = (SqSlotPerf * 32)()
 
     @property
     def enabled(self) -> bool:
@@ -43,33 +55,29 @@ class Perf:
     def xrun_threshold(self, factor: float) -> None:
         lib.sq_perf_set_xrun_threshold(self._engine._ptr, factor)
 
-    def snapshot(self) -> dict[str, float | int]:
-        """Return the latest performance snapshot as a dict."""
+    def snapshot(self) -> PerfSnapshot:
+        """Return the latest performance snapshot."""
         snap = lib.sq_perf_snapshot(self._engine._ptr)
-        return {
-            "callback_avg_us": snap.callback_avg_us,
-            "callback_peak_us": snap.callback_peak_us,
-            "cpu_load_percent": snap.cpu_load_percent,
-            "xrun_count": snap.xrun_count,
-            "callback_count": snap.callback_count,
-            "sample_rate": snap.sample_rate,
-            "block_size": snap.block_size,
-            "buffer_duration_us": snap.buffer_duration_us,
-        }
-
-    def slots(self) -> list[dict[str, int | float]]:
-        """Return per-slot timing as a list of dicts."""
-        slot_list = lib.sq_perf_slots(self._engine._ptr)
-        result = []
-        for i in range(slot_list.count):
-            item = slot_list.items[i]
-            result.append({
-                "handle": item.handle,
-                "avg_us": item.avg_us,
-                "peak_us": item.peak_us,
-            })
-        lib.sq_free_slot_perf_list(slot_list)
-        return result
+        return PerfSnapshot(
+            snap.callback_avg_us,
+            snap.callback_peak_us,
+            snap.cpu_load_percent,
+            snap.xrun_count,
+            snap.callback_count,
+            snap.sample_rate,
+            snap.block_size,
+            snap.buffer_duration_us,
+        )
+
+    def slots(self) -> list[SlotPerf]:
+        """Return per-slot timing, one ``SlotPerf`` per profiled slot."""
+        buf = self._slot_buf
+        n = lib.sq_perf_slots_into(self._engine._ptr, buf, len(buf))
+        if n > len(buf):
+            buf = self._slot_buf = (SqSlotPerf * n)()
+            n = min(n, lib.sq_perf_slots_into(self._engine._ptr, buf, n))
+        rows = memoryview(buf).cast("B")[:n * _SLOT_ROW.size]
+        return [SlotPerf._make(row) for row in _SLOT_ROW.iter_unpack(rows)]
 
     def reset(self) -> None:
         """Reset cumulative counters (xrun_count, callback_count)."""
@@ -2,66 +2,128 @@
 
 from __future__ import annotations
 
+import ctypes
+from collections.abc import Iterable, Mapping
 from typing import TYPE_CHECKING
 
 from squeeze._ffi import lib
-from squeeze._helpers import SqueezeError, make_error_ptr, check_error, decode_string, encode
+from squeeze._helpers import (
+    SqueezeError, check_error, decode_string, encode_cached,
+)
 from squeeze.types import ParamDescriptor
 
 if TYPE_CHECKING:
     from squeeze.squeeze import Squeeze
 
+# Hot-path FFI functions bound once, so each call skips the lib lookup.
+_sq_get_param = lib.sq_get_param
+_sq_set_param = lib.sq_set_param
+_sq_set_param_many = lib.sq_set_param_many
+_sq_get_param_many = lib.sq_get_param_many
+_sq_param_text = lib.sq_param_text
+_sq_schedule_param_change = lib.sq_schedule_param_change
+
 
 class Processor:
     """Wraps a processor in a Source chain or Bus chain."""
 
+    __slots__ = ("_engine", "_ptr", "handle", "_hash", "_descriptors",
+                 "__weakref__")
+
     def __init__(self, engine: Squeeze, handle: int):
         self._engine = engine
-        self._handle = handle
-
-    @property
-    def handle(self) -> int:
-        return self._handle
+        # Engine pointer held directly; Squeeze.close() clears it.
+        self._ptr = engine._ptr
+        self.handle = handle  # plain slot for cheap reads; don't reassign
+        self._hash = handle  # an int hashes to itself
+        # A processor's parameter set is fixed, so descriptors are read once
+        # and live as long as this wrapper; None = not read yet.
+        self._descriptors: list[ParamDescriptor] | None = None
+        engine._wrappers.add(self)
 
     # --- Parameters ---
 
     def get_param(self, name: str) -> float:
         """Get a parameter value by name."""
-        return lib.sq_get_param(self._engine._ptr, self._handle, encode(name))
+        return _sq_get_param(self._ptr, self.handle, encode_cached(name))
 
     def set_param(self, name: str, value: float) -> None:
         """Set a parameter value by name."""
-        lib.sq_set_param(self._engine._ptr, self._handle, encode(name), value)
+        _sq_set_param(self._ptr, self.handle, encode_cached(name), value)
+
+    def set_params(self, params: Mapping[str, float]) -> int:
+        """Set several parameters in one engine call.
+
+        Returns the number of values applied (0 if the processor is gone).
+        """
+        n = len(params)
+        if n == 0:
+            return 0
+        names = (ctypes.c_char_p * n)(*map(encode_cached, params))
+        values = (ctypes.c_float * n)(*params.values())
+        return _sq_set_param_many(self._ptr, self.handle, n, names, values)
+
+    def get_params(self, names: Iterable[str] | None = None) -> dict[str, float]:
+        """Read several parameters in one engine call.
+
+        Reads *names*, or every parameter when omitted. Returns an empty
+        dict if the processor is gone.
+        """
+        if names is None:
+            keys = [d.name for d in self._cached_descriptors()]
+        else:
+            keys = list(names)
+        n = len(keys)
+        if n == 0:
+            return {}
+        c_names = (ctypes.c_char_p * n)(*map(encode_cached, keys))
+        values = (ctypes.c_float * n)()
+        if not _sq_get_param_many(self._ptr, self.handle, n, c_names, values):
+            return {}
+        return dict(zip(keys, values))
 
     def param_text(self, name: str) -> str:
         """Human-readable display text for a parameter."""
-        return decode_string(lib.sq_param_text(self._engine._ptr, self._handle, encode(name)))
+        return decode_string(_sq_param_text(self._ptr, self.handle, encode_cached(name)))
 
     @property
     def param_descriptors(self) -> list[ParamDescriptor]:
         """Parameter metadata for all parameters."""
-        desc_list = lib.sq_param_descriptors(self._engine._ptr, self._handle)
-        result = []
-        for i in range(desc_list.count):
-            d = desc_list.descriptors[i]
-            result.append(ParamDescriptor(
-                name=d.name.decode() if d.name else "",
-                default_value=d.default_value,
-                min_value=d.min_value,
-                max_value=d.max_value,
-                num_steps=d.num_steps,
-                automatable=d.automatable,
-                boolean=d.boolean_param,
-                label=d.label.decode() if d.label else "",
-                group=d.group.decode() if d.group else "",
-            ))
-        lib.sq_free_param_descriptor_list(desc_list)
-        return result
+        return list(self._cached_descriptors())
 
     @property
     def param_count(self) -> int:
         """Number of parameters."""
-        return len(self.param_descriptors)
+        return len(self._cached_descriptors())
+
+    def _cached_descriptors(self) -> list[ParamDescriptor]:
+        """This wrapper's descriptors, fetched on first use."""
+        if self._descriptors is not None:
+            return self._descriptors
+        block = lib.sq_param_descriptors_packed(self._ptr, self.handle)
+        try:
+            n = block.count
+            if n == 0:
+                # May mean an unknown handle — don't pin an empty result.
+                return []
+            # One decode for every name/label/group, then slice the columns.
+            strings = ctypes.string_at(
+                block.strings, block.strings_size).decode().split("\0")
+            floats = block.floats[:3 * n]
+            ints = block.ints[:3 * n]
+        finally:
+            lib.sq_free_param_descriptor_block(block)
+        descs = [
+            ParamDescriptor(name, default, lo, hi, steps, bool(auto), bool(boolean),
+                            label, group)
+            for name, label, group, default, lo, hi, steps, auto, boolean in zip(
+                strings[0::3], strings[1::3], strings[2::3],
+                floats[0::3], floats[1::3], floats[2::3],
+                ints[0::3], ints[1::3], ints[2::3],
+            )
+        ]
+        self._descriptors = descs
+        return descs
 
     @property
     def latency(self) -> int:
@@ -73,19 +135,19 @@ class Processor:
     @property
     def has_editor(self) -> bool:
         """True if this processor has a native editor window."""
-        return lib.sq_has_editor(self._engine._ptr, self._handle)
+        return lib.sq_has_editor(self._ptr, self.handle)
 
     def open_editor(self) -> None:
         """Open the native plugin editor window."""
-        err = make_error_ptr()
-        ok = lib.sq_open_editor(self._engine._ptr, self._handle, err)
+        err = self._engine._reset_err()
+        ok = lib.sq_open_editor(self._ptr, self.handle, err)
         if not ok:
             check_error(err)
 
     def close_editor(self) -> None:
         """Close the plugin editor window."""
-        err = make_error_ptr()
-        ok = lib.sq_close_editor(self._engine._ptr, self._handle, err)
+        err = self._engine._reset_err()
+        ok = lib.sq_close_editor(self._ptr, self.handle, err)
         if not ok:
             check_error(err)
 
@@ -93,8 +155,8 @@ class Processor:
 
     def automate(self, beat: float, param_name: str, value: float) -> bool:
         """Schedule a parameter change at the given beat time."""
-        return lib.sq_schedule_param_change(
-            self._engine._ptr, self._handle, beat, encode(param_name), value
+        return _sq_schedule_param_change(
+            self._ptr, self.handle, beat, encode_cached(param_name), value
         )
 
     def __getitem__(self, name: str) -> float:
@@ -106,12 +168,14 @@ class Processor:
         self.set_param(name, value)
 
     def __repr__(self) -> str:
-        return f"Processor({self._handle})"
+        return f"Processor({self.handle})"
 
     def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
         if isinstance(other, Processor):
-            return self._handle == other._handle
+            return self.handle == other.handle
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self._handle)
+        return self._hash
@@ -5,10 +5,35 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from squeeze._ffi import lib
+from squeeze.types import Tap
 
 if TYPE_CHECKING:
     from squeeze.squeeze import Squeeze
 
+_TAP_NAMES = ("post", "pre")
+
+
+def _pre_fader(tap: Tap | str) -> int:
+    """The FFI pre_fader flag for a Tap (or 0/1) or "pre"/"post".
+
+    Raises ValueError for anything else, before any engine call is made.
+    """
+    if isinstance(tap, int):
+        if tap in (0, 1):
+            return int(tap)
+    elif tap in _TAP_NAMES:
+        return _TAP_NAMES.index(tap)
+    raise ValueError(f"tap must be 'pre', 'post' or a Tap, not {tap!r}")
+
+
+# owner_type -> (set_level, set_tap, remove) FFI functions, picked once per
+# Send so the setters don't branch on the owner type each call.
+_SEND_FNS = {
+    "source": (lib.sq_set_send_level, lib.sq_set_send_tap, lib.sq_remove_send),
+    "bus": (lib.sq_bus_set_send_level, lib.sq_bus_set_send_tap,
+            lib.sq_bus_remove_send),
+}
+
 
 class Send:
     """A send from a source or bus to a destination bus.
@@ -16,20 +41,19 @@ class Send:
     Returned by ``source.send(bus)`` or ``bus.send(bus)``.
     """
 
+    __slots__ = ("_engine", "_owner", "send_id", "_level", "_tap",
+                 "_set_level_fn", "_set_tap_fn", "_remove_fn")
+
     def __init__(self, engine: Squeeze, owner_handle: int,
                  send_id: int, owner_type: str,
                  level: float, tap: str):
         self._engine = engine
         self._owner = owner_handle
-        self._send_id = send_id
-        self._type = owner_type  # "source" or "bus"
+        self.send_id = send_id  # plain slot for cheap reads; don't reassign
         self._level = level
         self._tap = tap
-
-    @property
-    def send_id(self) -> int:
-        """The send ID."""
-        return self._send_id
+        # owner_type is "source" or "bus"
+        self._set_level_fn, self._set_tap_fn, self._remove_fn = _SEND_FNS[owner_type]
 
     @property
     def level(self) -> float:
@@ -38,36 +62,26 @@ class Send:
 
     @level.setter
     def level(self, value: float) -> None:
-        if self._type == "source":
-            lib.sq_set_send_level(
-                self._engine._ptr, self._owner, self._send_id, value)
-        else:
-            lib.sq_bus_set_send_level(
-                self._engine._ptr, self._owner, self._send_id, value)
+        self._set_level_fn(self._engine._ptr, self._owner, self.send_id, value)
         self._level = value
 
     @property
     def tap(self) -> str:
-        """Tap point: "pre" or "post"."""
+        """Tap point: "pre" or "post". Settable with a string or ``Tap``."""
         return self._tap
 
     @tap.setter
-    def tap(self, value: str) -> None:
-        pre_fader = 1 if value == "pre" else 0
-        if self._type == "source":
-            lib.sq_set_send_tap(
-                self._engine._ptr, self._owner, self._send_id, pre_fader)
-        else:
-            lib.sq_bus_set_send_tap(
-                self._engine._ptr, self._owner, self._send_id, pre_fader)
-        self._tap = value
+    def tap(self, value: Tap | str) -> None:
+        pre_fader = _pre_fader(value)
+        name = _TAP_NAMES[pre_fader]
+        if name == self._tap:
+            return
+        self._set_tap_fn(self._engine._ptr, self._owner, self.send_id, pre_fader)
+        self._tap = name
 
     def remove(self) -> None:
         """Remove this send."""
-        if self._type == "source":
-            lib.sq_remove_send(self._engine._ptr, self._owner, self._send_id)
-        else:
-            lib.sq_bus_remove_send(self._engine._ptr, self._owner, self._send_id)
+        self._remove_fn(self._engine._ptr, self._owner, self.send_id)
 
     def __repr__(self) -> str:
-        return f"Send(id={self._send_id}, level={self._level}, tap={self._tap!r})"
+        return f"Send(id={self.send_id}, level={self._level}, tap={self._tap!r})"
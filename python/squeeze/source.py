@@ -2,97 +2,145 @@
 
 from __future__ import annotations
 
+import ctypes
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from squeeze._ffi import lib
-from squeeze._helpers import decode_string, encode
+from squeeze._helpers import as_c_array, decode_string, encode_cached
 from squeeze.chain import Chain
 from squeeze.processor import Processor
-from squeeze.send import Send
+from squeeze.send import Send, _TAP_NAMES, _pre_fader
+from squeeze.types import Tap
 
 if TYPE_CHECKING:
     from squeeze.bus import Bus
     from squeeze.squeeze import Squeeze
 
+# Hot-path FFI functions bound once, so each call skips the lib lookup.
+_sq_route = lib.sq_route
+_sq_source_gain = lib.sq_source_gain
+_sq_source_set_gain = lib.sq_source_set_gain
+_sq_source_pan = lib.sq_source_pan
+_sq_source_set_pan = lib.sq_source_set_pan
+_sq_source_bypassed = lib.sq_source_bypassed
+_sq_source_set_bypassed = lib.sq_source_set_bypassed
+_sq_schedule_note_on = lib.sq_schedule_note_on
+_sq_schedule_note_off = lib.sq_schedule_note_off
+_sq_schedule_cc = lib.sq_schedule_cc
+_sq_schedule_pitch_bend = lib.sq_schedule_pitch_bend
+
+# Event kinds accepted by Source.schedule_events (mirror SqEventKind).
+_EVENT_KINDS = {"note_on": 0, "note_off": 1, "cc": 2, "pitch_bend": 3}
+
 
 class Source:
     """A sound generator with insert chain, routing, and MIDI assignment."""
 
+    __slots__ = ("_engine", "_ptr", "handle", "_hash", "_name", "_chain",
+                 "__weakref__")
+
     def __init__(self, engine: Squeeze, handle: int):
         self._engine = engine
-        self._handle = handle
-
-    @property
-    def handle(self) -> int:
-        return self._handle
+        # Engine pointer held directly; Squeeze.close() clears it.
+        self._ptr = engine._ptr
+        self.handle = handle  # plain slot for cheap reads; don't reassign
+        self._hash = handle  # an int hashes to itself
+        self._name: str | None = None
+        self._chain: Chain | None = None
+        engine._wrappers.add(self)
 
     @property
     def name(self) -> str:
         """Source name."""
-        return decode_string(lib.sq_source_name(self._engine._ptr, self._handle))
+        # Names are fixed at creation, so one decode per wrapper suffices.
+        if self._name is None:
+            name = decode_string(lib.sq_source_name(self._ptr, self.handle))
+            if not name:
+                return name  # unknown handle — don't pin it
+            self._name = name
+        return self._name
 
     # --- Insert chain ---
 
     @property
     def chain(self) -> Chain:
         """The insert effects chain."""
-        return Chain(self._engine, self._handle, "source")
+        # One per wrapper; the handle cache it reads lives on the engine,
+        # keyed by this handle, so all wrappers' chains agree.
+        if self._chain is None:
+            self._chain = Chain(self._engine, self.handle, "source")
+        return self._chain
 
     # --- Generator ---
 
     @property
     def generator(self) -> Processor:
         """The generator processor (synth, sampler, etc.)."""
-        h = lib.sq_source_generator(self._engine._ptr, self._handle)
-        return Processor(self._engine, h)
+        h = lib.sq_source_generator(self._ptr, self.handle)
+        return self._engine._wrap_processor(h)
 
     # --- Gain and Pan ---
 
     @property
     def gain(self) -> float:
         """Linear gain (0.0-1.0+). Default 1.0 (unity)."""
-        return lib.sq_source_gain(self._engine._ptr, self._handle)
+        # Cached per handle on the engine; every setter stores the value the
+        # engine applied, so one read serves all wrappers of this source.
+        gains = self._engine._gains
+        gain = gains.get(self.handle)
+        if gain is None:
+            gain = gains[self.handle] = _sq_source_gain(self._ptr, self.handle)
+        return gain
 
     @gain.setter
     def gain(self, value: float) -> None:
-        lib.sq_source_set_gain(self._engine._ptr, self._handle, value)
+        self._engine._gains[self.handle] = _sq_source_set_gain(
+            self._ptr, self.handle, value)
 
     @property
     def pan(self) -> float:
         """Stereo pan (-1.0 left to 1.0 right). Default 0.0 (center)."""
-        return lib.sq_source_pan(self._engine._ptr, self._handle)
+        pans = self._engine._pans
+        pan = pans.get(self.handle)
+        if pan is None:
+            pan = pans[self.handle] = _sq_source_pan(self._ptr, self.handle)
+        return pan
 
     @pan.setter
     def pan(self, value: float) -> None:
-        lib.sq_source_set_pan(self._engine._ptr, self._handle, value)
+        self._engine._pans[self.handle] = _sq_source_set_pan(
+            self._ptr, self.handle, value)
 
     # --- Bypass ---
 
     @property
     def bypassed(self) -> bool:
-        return lib.sq_source_bypassed(self._engine._ptr, self._handle)
+        return _sq_source_bypassed(self._ptr, self.handle)
 
     @bypassed.setter
     def bypassed(self, value: bool) -> None:
-        lib.sq_source_set_bypassed(self._engine._ptr, self._handle, value)
+        _sq_source_set_bypassed(self._ptr, self.handle, value)
 
     # --- Routing ---
 
-    def route_to(self, bus: Bus) -> None:
-        """Route this source's output to a bus."""
-        lib.sq_route(self._engine._ptr, self._handle, bus.handle)
+    def route_to(self, bus: Bus | int) -> None:
+        """Route this source's output to a bus (a Bus or its handle)."""
+        h = bus if isinstance(bus, int) else bus.handle
+        _sq_route(self._ptr, self.handle, h)
 
-    def send(self, bus: Bus, *, level: float = 0.0, tap: str = "post") -> Send:
-        """Add a send to a bus. Returns a Send object.
+    def send(self, bus: Bus | int, *, level: float = 0.0,
+             tap: Tap | str = "post") -> Send:
+        """Add a send to a bus (a Bus or its handle). Returns a Send object.
 
         Level is in dB (0.0 = unity).
-        tap: "pre" (pre-fader) or "post" (post-fader, default).
+        tap: "pre" (pre-fader) or "post" (post-fader, default), or a ``Tap``.
         """
-        pre_fader = 1 if tap == "pre" else 0
-        send_id = lib.sq_send(
-            self._engine._ptr, self._handle, bus.handle, level, pre_fader)
-        return Send(self._engine, self._handle, send_id, "source",
-                    level=level, tap=tap)
+        pre_fader = _pre_fader(tap)
+        h = bus if isinstance(bus, int) else bus.handle
+        send_id = lib.sq_send(self._ptr, self.handle, h, level, pre_fader)
+        return Send(self._engine, self.handle, send_id, "source",
+                    level=level, tap=_TAP_NAMES[pre_fader])
 
     # --- Buffer assignment ---
 
@@ -101,7 +149,7 @@ class Source:
 
         Returns False if the buffer ID is not found or the source is not a player.
         """
-        return lib.sq_source_set_buffer(self._engine._ptr, self._handle, buffer_id)
+        return lib.sq_source_set_buffer(self._ptr, self.handle, buffer_id)
 
     # --- MIDI ---
 
@@ -109,8 +157,8 @@ class Source:
                     note_range: tuple[int, int] = (0, 127)) -> None:
         """Assign MIDI input to this source."""
         lib.sq_source_midi_assign(
-            self._engine._ptr, self._handle,
-            encode(device), channel, note_range[0], note_range[1]
+            self._ptr, self.handle,
+            encode_cached(device), channel, note_range[0], note_range[1]
         )
 
     # --- Event scheduling ---
@@ -118,28 +166,92 @@ class Source:
     def note_on(self, beat: float, channel: int, note: int,
                 velocity: float) -> bool:
         """Schedule a note-on event at the given beat time."""
-        return lib.sq_schedule_note_on(
-            self._engine._ptr, self._handle, beat, channel, note, velocity
+        return _sq_schedule_note_on(
+            self._ptr, self.handle, beat, channel, note, velocity
         )
 
     def note_off(self, beat: float, channel: int, note: int) -> bool:
         """Schedule a note-off event at the given beat time."""
-        return lib.sq_schedule_note_off(
-            self._engine._ptr, self._handle, beat, channel, note
+        return _sq_schedule_note_off(
+            self._ptr, self.handle, beat, channel, note
         )
 
     def cc(self, beat: float, channel: int, cc_num: int, cc_val: int) -> bool:
         """Schedule a CC event at the given beat time."""
-        return lib.sq_schedule_cc(
-            self._engine._ptr, self._handle, beat, channel, cc_num, cc_val
+        return _sq_schedule_cc(
+            self._ptr, self.handle, beat, channel, cc_num, cc_val
         )
 
     def pitch_bend(self, beat: float, channel: int, value: int) -> bool:
         """Schedule a pitch bend event at the given beat time.
         value: 14-bit (0-16383, 8192=center).
         """
-        return lib.sq_schedule_pitch_bend(
-            self._engine._ptr, self._handle, beat, channel, value
+        return _sq_schedule_pitch_bend(
+            self._ptr, self.handle, beat, channel, value
+        )
+
+    def schedule_events(
+        self, events: Sequence[tuple[str, float, int, int, float]],
+    ) -> int:
+        """Schedule many MIDI events in a single engine call.
+
+        Each event is ``(kind, beat, channel, data1, value)`` where kind is
+        "note_on", "note_off", "cc", or "pitch_bend"; data1 is the note,
+        CC number, or 14-bit pitch bend value; value is the velocity
+        (note_on) or CC value (cc) and is ignored otherwise.
+
+        Returns the number of events queued.
+        """
+        n = len(events)
+        if n == 0:
+            return 0
+        beats = (ctypes.c_double * n)()
+        kinds = (ctypes.c_int * n)()
+        channels = (ctypes.c_int * n)()
+        data1 = (ctypes.c_int * n)()
+        values = (ctypes.c_float * n)()
+        for i, (kind, beat, channel, d1, value) in enumerate(events):
+            code = _EVENT_KINDS.get(kind)
+            if code is None:
+                raise ValueError(f"unknown event kind: {kind!r}")
+            kinds[i] = code
+            beats[i] = beat
+            channels[i] = channel
+            data1[i] = d1
+            values[i] = value
+        return lib.sq_schedule_events(
+            self._ptr, self.handle, n,
+            beats, kinds, channels, data1, values
+        )
+
+    def schedule_event_columns(self, beats: Sequence[float],
+                               kinds: Sequence[int], channels: Sequence[int],
+                               data1: Sequence[int],
+                               values: Sequence[float]) -> int:
+        """Columnar form of ``schedule_events`` for pre-baked sequences.
+
+        Each argument holds one field for every event. Kinds are integer
+        codes: 0 note_on, 1 note_off, 2 cc, 3 pitch_bend. A column that is
+        a contiguous writable buffer of the C type — ``array.array`` with
+        typecode "d" for beats, "i" for kinds/channels/data1, "f" for
+        values, or the NumPy float64/int32/float32 equivalent — is handed
+        to the engine without copying; anything else is converted.
+
+        Returns the number of events queued; the engine stops at the
+        first unknown kind.
+        """
+        n = len(beats)
+        if not (len(kinds) == len(channels) == len(data1) == len(values) == n):
+            raise ValueError("event columns must all have the same length")
+        if n == 0:
+            return 0
+        return lib.sq_schedule_events(
+            self._ptr, self.handle, n,
+            as_c_array(ctypes.c_double, beats, n),
+            as_c_array(ctypes.c_int, kinds, n),
+            as_c_array(ctypes.c_int, channels, n),
+            as_c_array(ctypes.c_int, data1, n),
+            as_c_array(ctypes.c_float, values, n),
         )
 
     # --- Generator param shortcut ---
@@ -156,15 +268,22 @@ class Source:
 
     def remove(self) -> bool:
         """Remove this source from the engine."""
-        return lib.sq_remove_source(self._engine._ptr, self._handle)
+        removed: bool = lib.sq_remove_source(self._ptr, self.handle)
+        if removed:
+            self._name = None
+            self._chain = None
+            self._engine._forget_node(self.handle)
+        return removed
 
     def __repr__(self) -> str:
         return f"Source({self.name!r})"
 
     def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
         if isinstance(other, Source):
-            return self._handle == other._handle
+            return self.handle == other.handle
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self._handle)
+        return self._hash
@@ -3,27 +3,44 @@
 from __future__ import annotations
 
 import ctypes
+import functools
 import os
 import time
-from collections.abc import Iterator
+import weakref
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from pathlib import Path
 from types import TracebackType
-from typing import Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from squeeze._ffi import lib, SqBufferInfo, SqIdNameList, SqPluginInfoList
 from squeeze._helpers import (
     SqueezeError, make_error_ptr, check_error,
-    decode_string, string_list_to_python, encode,
+    decode_cstr, decode_string, string_list_to_python, encode, encode_cached,
 )
 from squeeze.types import BufferInfo, PluginInfo
-from squeeze.buffer import Buffer
+from squeeze.buffer import Buffer, _Keepalive
 from squeeze.bus import Bus
-from squeeze.clock import Clock
-from squeeze.midi import Midi
-from squeeze.perf import Perf
+from squeeze.processor import Processor
 from squeeze.source import Source
-from squeeze.transport import Transport
+
+# Hot-path FFI functions bound once, so each call skips the lib lookup.
+_sq_render_blocks = lib.sq_render_blocks
+_sq_process_events = lib.sq_process_events
+
+if TYPE_CHECKING:
+    # Sub-object classes are imported where first constructed, so scripts
+    # that never touch them don't pay for loading their modules.
+    from squeeze.clock import Clock
+    from squeeze.midi import Midi
+    from squeeze.perf import Perf
+    from squeeze.transport import Transport
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_dir(path: str) -> Path:
+    """Path(path).resolve(), memoized — resolve() lstat()s every component."""
+    return Path(path).resolve()
 
 
 class Squeeze:
@@ -39,9 +56,12 @@ class Squeeze:
     """
 
     _PLUGIN_CACHE_NAME = "plugin-cache.xml"
+    # cwd -> plugin-cache.xml found from it, so repeated engine construction
+    # in one process skips the upward walk. Only hits are remembered.
+    _plugin_cache_paths: dict[str, str] = {}
 
     def __init__(self, sample_rate: float = 44100.0, block_size: int = 512,
-                 *, plugins: str | bool = True):
+                 *, plugins: str | bool = True, prefetch_midi: bool = False):
         """Create a new Squeeze engine.
 
         Args:
@@ -50,24 +70,92 @@ class Squeeze:
             plugins: Plugin cache loading. ``True`` (default) searches upward
                 from cwd for ``plugin-cache.xml``. A string path loads that
                 file directly (raises on failure). ``False`` skips loading.
+            prefetch_midi: Start enumerating MIDI devices on a background
+                thread now, so the first ``midi.devices`` read doesn't wait
+                on the OS. Off by default: close() waits for an unfinished
+                prefetch.
         """
-        err = make_error_ptr()
-        self._ptr = lib.sq_engine_create(sample_rate, block_size, err)
+        # One error slot, reset before each sq_* call that can fail.
+        self._err = make_error_ptr()
+        self._ptr = lib.sq_engine_create(sample_rate, block_size, self._err)
         if not self._ptr:
-            check_error(err)
+            check_error(self._err)
             raise SqueezeError("Failed to create engine")
+        # Destroys the engine if this object is collected without close();
+        # unlike __del__ it fires once, works in cycles and at shutdown.
+        self._finalizer = weakref.finalize(self, lib.sq_engine_destroy, self._ptr)
         self._init_sample_rate = sample_rate
         self._init_block_size = block_size
         self._transport: Transport | None = None
         self._midi: Midi | None = None
         self._perf: Perf | None = None
+        self._master: Bus | None = None
+        self._version: str | None = None
+        # Plugin list queries, cached until the next load_plugin_cache().
+        self._plugin_names: tuple[str, ...] | None = None
+        self._num_plugins: int | None = None
+        self._plugin_infos: tuple[PluginInfo, ...] | None = None
+        self._batch_depth = 0
+        # Wrappers that cache _ptr; close() nulls it so they can't reach a
+        # destroyed engine.
+        self._wrappers: weakref.WeakSet[Processor | Source | Bus | Transport] = weakref.WeakSet()
+        # Live wrappers interned by handle, so repeat lookups of the same
+        # handle return the same object. Handles are never reused.
+        self._processors: weakref.WeakValueDictionary[int, Processor] = (
+            weakref.WeakValueDictionary())
+        self._sources: weakref.WeakValueDictionary[int, Source] = (
+            weakref.WeakValueDictionary())
+        self._buses: weakref.WeakValueDictionary[int, Bus] = (
+            weakref.WeakValueDictionary())
+        # Gain and pan last applied per source/bus handle. Kept on the engine,
+        # not the wrapper, so every wrapper of a handle sees the same value;
+        # _forget_node() drops them when the node is removed.
+        self._gains: dict[int, float] = {}
+        self._pans: dict[int, float] = {}
+        # Insert-chain processor handles per source/bus handle, shared by
+        # every Chain of that owner; any chain edit or remove drops the entry.
+        self._chain_handles: dict[int, tuple[int, ...]] = {}
+        # Storage behind Buffer.view() results, per buffer ID. Each ctypes
+        # array lives as long as any view (or NumPy alias) of it does, so a
+        # live ref means engine memory is still exposed; see _live_views().
+        self._buffer_views: dict[int, list[weakref.ref[Any]]] = {}
         self._load_plugins(plugins)
+        if prefetch_midi:
+            lib.sq_midi_prefetch_devices(self._ptr)
 
     def close(self) -> None:
-        """Destroy the engine. Safe to call multiple times."""
+        """Destroy the engine. Safe to call multiple times.
+
+        If a ``Buffer.view()`` result is still alive, this object is closed
+        now but the engine itself is destroyed when the last view is dropped.
+        """
         if self._ptr:
-            lib.sq_engine_destroy(self._ptr)
+            views = self._live_views()
+            if views:
+                # Hand the engine's lifetime to the views: they stop
+                # referencing this object and share a token whose finalizer
+                # destroys the engine.
+                detached = self._finalizer.detach()
+                if detached is not None:
+                    _, destroy, args, _ = detached
+                    keepalive = _Keepalive()
+                    weakref.finalize(keepalive, destroy, *args)
+                    for samples in views:
+                        samples._engine = keepalive
+            else:
+                self._finalizer()
             self._ptr = None
+            self._master = None
+            for w in self._wrappers:
+                w._ptr = None
+            self._wrappers.clear()
+            self._processors.clear()
+            self._sources.clear()
+            self._buses.clear()
+            self._gains.clear()
+            self._pans.clear()
+            self._chain_handles.clear()
+            self._buffer_views.clear()
 
     def __enter__(self) -> Squeeze:
         return self
@@ -80,8 +168,69 @@ class Squeeze:
     ) -> None:
         self.close()
 
-    def __del__(self) -> None:
-        self.close()
+    def _reset_err(self) -> ctypes.c_char_p:
+        """Clear the shared error slot and return it for an sq_* call."""
+        self._err.value = None
+        return self._err
+
+    def _wrap_processor(self, handle: int) -> Processor:
+        """The interned Processor for *handle*, created on first use."""
+        proc = self._processors.get(handle)
+        if proc is None:
+            proc = self._processors[handle] = Processor(self, handle)
+        return proc
+
+    def _wrap_source(self, handle: int, name: str | None = None) -> Source:
+        """The interned Source for *handle*, created on first use.
+
+        Pass *name* when the caller just created the source under it, so
+        ``Source.name`` needs no FFI read.
+        """
+        src = self._sources.get(handle)
+        if src is None:
+            src = self._sources[handle] = Source(self, handle)
+        if name is not None and src._name is None:
+            src._name = name
+        return src
+
+    def _wrap_bus(self, handle: int, name: str | None = None) -> Bus:
+        """The interned Bus for *handle*, created on first use.
+
+        *name* seeds ``Bus.name`` as for ``_wrap_source``.
+        """
+        bus = self._buses.get(handle)
+        if bus is None:
+            bus = self._buses[handle] = Bus(self, handle)
+        if name is not None and bus._name is None:
+            bus._name = name
+        return bus
+
+    def _live_views(self, buffer_id: int | None = None) -> list[Any]:
+        """The still-referenced ctypes arrays behind Buffer.view() results,
+        for one buffer or all. Prunes dead entries as it goes."""
+        ids = list(self._buffer_views) if buffer_id is None else [buffer_id]
+        live: list[Any] = []
+        for bid in ids:
+            arrays = [a for a in (r() for r in self._buffer_views.get(bid, ()))
+                      if a is not None]
+            if arrays:
+                self._buffer_views[bid] = [weakref.ref(a) for a in arrays]
+                live.extend(arrays)
+            else:
+                self._buffer_views.pop(bid, None)
+        return live
+
+    def _remove_buffer(self, buffer_id: int) -> bool:
+        """sq_remove_buffer, skipped once this engine is closed."""
+        if not self._ptr:
+            return False
+        return bool(lib.sq_remove_buffer(self._ptr, buffer_id))
+
+    def _forget_node(self, handle: int) -> None:
+        """Drop the cached per-handle state of a removed source or bus."""
+        self._gains.pop(handle, None)
+        self._pans.pop(handle, None)
+        self._chain_handles.pop(handle, None)
 
     def _load_plugins(self, plugins: str | bool) -> None:
         """Handle the ``plugins`` constructor arg."""
@@ -100,20 +249,29 @@ class Squeeze:
     @staticmethod
     def _find_plugin_cache() -> str | None:
         """Search for plugin-cache.xml from cwd up to home directory."""
+        cwd = os.getcwd()
+        cached = Squeeze._plugin_cache_paths.get(cwd)
+        if cached is not None and os.path.isfile(cached):
+            return cached
         home = Path.home()
-        cur = Path.cwd().resolve()
+        cur = _resolve_dir(cwd)
         while True:
             candidate = cur / Squeeze._PLUGIN_CACHE_NAME
             if candidate.is_file():
-                return str(candidate)
+                found = str(candidate)
+                Squeeze._plugin_cache_paths[cwd] = found
+                return found
             if cur == home or cur.parent == cur:
+                Squeeze._plugin_cache_paths.pop(cwd, None)
                 return None
             cur = cur.parent
 
     @property
     def version(self) -> str:
         """Engine version string."""
-        return decode_string(lib.sq_version(self._ptr))
+        if self._version is None:
+            self._version = decode_string(lib.sq_version(self._ptr))
+        return self._version
 
     # --- Sub-objects ---
 
@@ -121,6 +279,7 @@ class Squeeze:
     def transport(self) -> Transport:
         """Transport control (play, stop, tempo, seek, loop)."""
         if self._transport is None:
+            from squeeze.transport import Transport
             self._transport = Transport(self)
         return self._transport
 
@@ -128,6 +287,7 @@ class Squeeze:
     def midi(self) -> Midi:
         """MIDI device management and routing."""
         if self._midi is None:
+            from squeeze.midi import Midi
             self._midi = Midi(self)
         return self._midi
 
@@ -135,6 +295,7 @@ class Squeeze:
     def perf(self) -> Perf:
         """Performance monitoring."""
         if self._perf is None:
+            from squeeze.perf import Perf
             self._perf = Perf(self)
         return self._perf
 
@@ -149,23 +310,48 @@ class Squeeze:
         With player=True, creates a source with a PlayerProcessor generator.
         """
         if plugin is not None:
-            err = make_error_ptr()
-            h = lib.sq_add_plugin(self._ptr, encode(plugin), err)
+            err = self._reset_err()
+            h = lib.sq_add_plugin(self._ptr, encode_cached(plugin), err)
             if h < 0:
                 check_error(err)
                 raise SqueezeError(f"Failed to add plugin source '{plugin}'")
-            return Source(self, h)
+            return self._wrap_source(h)
         if player:
-            err = make_error_ptr()
-            h = lib.sq_add_source_player(self._ptr, encode(name), err)
+            err = self._reset_err()
+            h = lib.sq_add_source_player(self._ptr, encode_cached(name), err)
             if h < 0:
                 check_error(err)
                 raise SqueezeError(f"Failed to add player source '{name}'")
-            return Source(self, h)
-        h = lib.sq_add_source(self._ptr, encode(name))
+            return self._wrap_source(h, name)
+        h = lib.sq_add_source(self._ptr, encode_cached(name))
         if h < 0:
             raise SqueezeError(f"Failed to add source '{name}'")
-        return Source(self, h)
+        return self._wrap_source(h, name)
+
+    def add_sources(self, names: Iterable[str]) -> list[Source]:
+        """Add several GainProcessor sources in one FFI call.
+
+        The engine rebuilds its graph once for the whole set (or leaves
+        it to an enclosing ``batch()``).
+
+        Returns:
+            The new sources, in the same order as names.
+
+        Raises:
+            SqueezeError: If a source cannot be added. Sources before it
+                stay added.
+        """
+        keys = list(names)
+        n = len(keys)
+        if n == 0:
+            return []
+        handles = (ctypes.c_int * n)()
+        added = lib.sq_add_sources(
+            self._ptr, n, (ctypes.c_char_p * n)(*map(encode_cached, keys)), handles
+        )
+        if added < n:
+            raise SqueezeError(f"Failed to add source '{keys[added]}'")
+        return [self._wrap_source(h, name) for h, name in zip(handles, keys)]
 
     # --- Buffers ---
 
@@ -181,13 +367,40 @@ class Squeeze:
         Raises:
             SqueezeError: If the file cannot be loaded.
         """
-        err = make_error_ptr()
+        err = self._reset_err()
         buf_id = lib.sq_load_buffer(self._ptr, encode(path), err)
         if buf_id < 0:
             check_error(err)
             raise SqueezeError(f"Failed to load buffer: {path}")
         return buf_id
 
+    def load_buffer_many(self, paths: Iterable[str]) -> list[int]:
+        """Load several audio files in one FFI call.
+
+        Args:
+            paths: Paths to the audio files.
+
+        Returns:
+            Buffer IDs, in the same order as paths.
+
+        Raises:
+            SqueezeError: If a file cannot be loaded. Loading stops there;
+                files before it stay loaded.
+        """
+        encoded = [encode(p) for p in paths]
+        n = len(encoded)
+        ids = (ctypes.c_int * n)()
+        err = self._reset_err()
+        loaded = lib.sq_load_buffers(
+            self._ptr, n, (ctypes.c_char_p * n)(*encoded), ids, err
+        )
+        if loaded < n:
+            check_error(err)
+            raise SqueezeError(
+                f"Failed to load buffer: {encoded[loaded].decode()}"
+            )
+        return ids[:]
+
     def create_buffer(self, channels: int, length: int,
                       sample_rate: float, name: str = "") -> Buffer:
         """Create an empty audio buffer.
@@ -201,9 +414,9 @@ class Squeeze:
         Returns:
             A Buffer handle.
         """
-        err = make_error_ptr()
+        err = self._reset_err()
         buf_id = lib.sq_create_buffer(
-            self._ptr, channels, length, sample_rate, encode(name), err
+            self._ptr, channels, length, sample_rate, encode_cached(name), err
         )
         if buf_id < 0:
             check_error(err)
@@ -225,8 +438,8 @@ class Squeeze:
             num_channels=info.num_channels,
             length=info.length,
             sample_rate=info.sample_rate,
-            name=info.name.decode("utf-8") if info.name else "",
-            file_path=info.file_path.decode("utf-8") if info.file_path else "",
+            name=decode_cstr(info.name),
+            file_path=decode_cstr(info.file_path),
             length_seconds=info.length_seconds,
             tempo=info.tempo,
         )
@@ -237,12 +450,12 @@ class Squeeze:
     def buffers(self) -> list[tuple[int, str]]:
         """Sorted list of (buffer_id, name) tuples."""
         raw = lib.sq_buffers(self._ptr)
-        result: list[tuple[int, str]] = []
-        for i in range(raw.count):
-            name = raw.names[i].decode("utf-8") if raw.names[i] else ""
-            result.append((raw.ids[i], name))
+        n = raw.count
+        # Slice each column out in one ctypes call rather than indexing per item.
+        ids: list[int] = raw.ids[:n]
+        names: list[bytes | None] = raw.names[:n]
         lib.sq_free_id_name_list(raw)
-        return result
+        return [(bid, decode_cstr(name)) for bid, name in zip(ids, names)]
 
     @property
     def buffer_count(self) -> int:
@@ -253,15 +466,34 @@ class Squeeze:
 
     def add_bus(self, name: str) -> Bus:
         """Add a bus to the engine."""
-        h = lib.sq_add_bus(self._ptr, encode(name))
+        h = lib.sq_add_bus(self._ptr, encode_cached(name))
         if h < 0:
             raise SqueezeError(f"Failed to add bus '{name}'")
-        return Bus(self, h)
+        return self._wrap_bus(h, name)
 
     @property
     def master(self) -> Bus:
-        """The master bus (always exists)."""
-        return Bus(self, lib.sq_master(self._ptr))
+        """The master bus (always exists).
+
+        Its handle is fixed for the engine's lifetime, so the Bus is looked
+        up once and the same object is returned on every access.
+        """
+        if self._master is None:
+            self._master = self._wrap_bus(lib.sq_master(self._ptr))
+        return self._master
+
+    def route_many_to(self, sources: Iterable[Source | int],
+                      bus: Bus | int) -> None:
+        """Route every source (a Source or its handle) to one bus.
+
+        Equivalent to calling ``src.route_to(bus)`` for each source, without
+        a wrapper method call per edge.
+        """
+        fn = lib.sq_route
+        ptr = self._ptr
+        bh = bus if isinstance(bus, int) else bus.handle
+        for src in sources:
+            fn(ptr, src if isinstance(src, int) else src.handle, bh)
 
     # --- Clock dispatch ---
 
@@ -276,6 +508,7 @@ class Squeeze:
             callback: Called with the beat position (float) on the clock
                 dispatch thread.
         """
+        from squeeze.clock import Clock
         return Clock(self, resolution, latency_ms, callback)
 
     # --- Batching ---
@@ -289,18 +522,27 @@ class Squeeze:
                 synth = s.add_source("Lead")
                 synth.route_to(s.master)
             # single snapshot rebuild here
+
+        Nested batches are free: only the outermost one begins and
+        commits, so an inner exit doesn't end the outer batch early.
         """
-        lib.sq_batch_begin(self._ptr)
+        if self._batch_depth == 0:
+            lib.sq_batch_begin(self._ptr)
+        self._batch_depth += 1
         try:
             yield
         finally:
-            lib.sq_batch_commit(self._ptr)
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                lib.sq_batch_commit(self._ptr)
 
     # --- Plugin management ---
 
     def load_plugin_cache(self, path: str) -> None:
         """Load plugin cache from XML file. Raises SqueezeError on failure."""
-        err = make_error_ptr()
+        err = self._reset_err()
+        # The engine replaces its list even when loading fails.
+        self._plugin_names = self._num_plugins = self._plugin_infos = None
         ok = lib.sq_load_plugin_cache(self._ptr, encode(path), err)
         if not ok:
             check_error(err)
@@ -308,29 +550,52 @@ class Squeeze:
     @property
     def available_plugins(self) -> list[str]:
         """Available plugin names (sorted alphabetically)."""
-        return string_list_to_python(lib.sq_available_plugins(self._ptr))
+        if self._plugin_names is None:
+            self._plugin_names = tuple(
+                string_list_to_python(lib.sq_available_plugins(self._ptr))
+            )
+        return list(self._plugin_names)
 
     @property
     def num_plugins(self) -> int:
         """Number of plugins in the loaded cache."""
-        return lib.sq_num_plugins(self._ptr)
+        if self._num_plugins is None:
+            self._num_plugins = lib.sq_num_plugins(self._ptr)
+        return self._num_plugins
 
     @property
     def plugin_infos(self) -> list[PluginInfo]:
         """Metadata for all loaded plugins (sorted by name)."""
+        if self._plugin_infos is None:
+            self._plugin_infos = tuple(self._read_plugin_infos())
+        return list(self._plugin_infos)
+
+    def _read_plugin_infos(self) -> list[PluginInfo]:
         raw = lib.sq_plugin_infos(self._ptr)
-        result: list[PluginInfo] = []
-        for i in range(raw.count):
-            item = raw.items[i]
-            result.append(PluginInfo(
-                name=item.name.decode("utf-8") if item.name else "",
-                manufacturer=item.manufacturer.decode("utf-8") if item.manufacturer else "",
-                category=item.category.decode("utf-8") if item.category else "",
-                version=item.version.decode("utf-8") if item.version else "",
-                is_instrument=item.is_instrument,
-                num_inputs=item.num_inputs,
-                num_outputs=item.num_outputs,
-            ))
+        # Manufacturer, category and version repeat heavily across a plugin
+        # list; decode each distinct value once and share the str.
+        shared: dict[bytes | None, str] = {}
+
+        def dedup(b: bytes | None) -> str:
+            s = shared.get(b)
+            if s is None:
+                s = shared[b] = decode_cstr(b)
+            return s
+
+        # One slice copies every struct out; the strings are decoded before
+        # the C list (which owns them) is freed.
+        result = [
+            PluginInfo(
+                decode_cstr(item.name),
+                dedup(item.manufacturer),
+                dedup(item.category),
+                dedup(item.version),
+                item.is_instrument,
+                item.num_inputs,
+                item.num_outputs,
+            )
+            for item in raw.items[:raw.count]
+        ]
         lib.sq_free_plugin_info_list(raw)
         return result
 
@@ -341,7 +606,7 @@ class Squeeze:
         """Start the audio device. Defaults to constructor args if not specified."""
         sr = sample_rate if sample_rate is not None else self._init_sample_rate
         bs = block_size if block_size is not None else self._init_block_size
-        err = make_error_ptr()
+        err = self._reset_err()
         ok = lib.sq_start(self._ptr, sr, bs, err)
         if not ok:
             check_error(err)
@@ -370,7 +635,7 @@ class Squeeze:
     @staticmethod
     def process_events(timeout_ms: int = 0) -> None:
         """Process pending JUCE GUI/message events."""
-        lib.sq_process_events(timeout_ms)
+        _sq_process_events(timeout_ms)
 
     # --- Event loop ---
 
@@ -386,22 +651,29 @@ class Squeeze:
         Can combine both — stops on whichever comes first.
         """
         deadline = (time.monotonic() + seconds) if seconds is not None else None
+        # The dispatch loop blocks for the whole slice, so there is no
+        # separate sleep. Poll `until` every 10 ms; otherwise 50 ms slices
+        # are plenty for editor windows and keep Ctrl-C responsive.
+        slice_ms = 10 if until is not None else 50
         try:
             while True:
-                if deadline is not None and time.monotonic() >= deadline:
-                    break
                 if until is not None and until():
                     break
-                lib.sq_process_events(10)
-                time.sleep(0.005)
+                timeout_ms = slice_ms
+                if deadline is not None:
+                    remaining_ms = (deadline - time.monotonic()) * 1000.0
+                    if remaining_ms <= 0.0:
+                        break
+                    timeout_ms = max(1, min(slice_ms, int(remaining_ms)))
+                _sq_process_events(timeout_ms)
         except KeyboardInterrupt:
             pass
 
     # --- Testing ---
 
-    def render(self, num_samples: int = 512) -> None:
-        """Render one block in test mode."""
-        lib.sq_render(self._ptr, num_samples)
+    def render(self, num_samples: int = 512, blocks: int = 1) -> None:
+        """Render *blocks* consecutive blocks in test mode, in one FFI call."""
+        _sq_render_blocks(self._ptr, num_samples, blocks)
 
     # --- Query ---
 
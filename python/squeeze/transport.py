@@ -9,73 +9,92 @@ from squeeze._ffi import lib
 if TYPE_CHECKING:
     from squeeze.squeeze import Squeeze
 
+# Hot-path FFI functions bound once, so each call skips the lib lookup
+# (position/tempo/playing are polled from clock callbacks and UI loops).
+_sq_transport_play = lib.sq_transport_play
+_sq_transport_stop = lib.sq_transport_stop
+_sq_transport_tempo = lib.sq_transport_tempo
+_sq_transport_position = lib.sq_transport_position
+_sq_transport_is_playing = lib.sq_transport_is_playing
+
+# seek() dispatch keyed by (beats is None, samples is None); any other
+# combination is a missing or doubled argument.
+_SEEK_FNS = {
+    (False, True): lib.sq_transport_seek_beats,
+    (True, False): lib.sq_transport_seek_samples,
+}
+
 
 class Transport:
     """Sub-object for transport control. Accessed via squeeze.transport."""
 
+    __slots__ = ("_engine", "_ptr", "__weakref__")
+
     def __init__(self, engine: Squeeze):
         self._engine = engine
+        # Engine pointer held directly so each op is one FFI call with no
+        # hop through the engine; close() nulls it like other wrappers.
+        self._ptr = engine._ptr
+        engine._wrappers.add(self)
 
     def play(self) -> None:
         """Start playback."""
-        lib.sq_transport_play(self._engine._ptr)
+        _sq_transport_play(self._ptr)
 
     def stop(self) -> None:
         """Stop playback and reset position."""
-        lib.sq_transport_stop(self._engine._ptr)
+        _sq_transport_stop(self._ptr)
 
     def pause(self) -> None:
         """Pause playback (position preserved)."""
-        lib.sq_transport_pause(self._engine._ptr)
+        lib.sq_transport_pause(self._ptr)
 
     @property
     def tempo(self) -> float:
         """Current tempo in BPM."""
-        return lib.sq_transport_tempo(self._engine._ptr)
+        return _sq_transport_tempo(self._ptr)
 
     @tempo.setter
     def tempo(self, bpm: float) -> None:
-        lib.sq_transport_set_tempo(self._engine._ptr, bpm)
+        lib.sq_transport_set_tempo(self._ptr, bpm)
 
     @property
     def position(self) -> float:
         """Current playback position in beats."""
-        return lib.sq_transport_position(self._engine._ptr)
+        return _sq_transport_position(self._ptr)
 
     @property
     def playing(self) -> bool:
         """True if transport is currently playing."""
-        return lib.sq_transport_is_playing(self._engine._ptr)
+        return _sq_transport_is_playing(self._ptr)
 
     @playing.setter
     def playing(self, value: bool) -> None:
         if value:
-            lib.sq_transport_play(self._engine._ptr)
+            _sq_transport_play(self._ptr)
         else:
-            lib.sq_transport_stop(self._engine._ptr)
+            _sq_transport_stop(self._ptr)
 
     def seek(self, *, beats: float | None = None, samples: int | None = None) -> None:
         """Seek to a position. Specify exactly one of beats or samples."""
-        if (beats is None) == (samples is None):
+        fn = _SEEK_FNS.get((beats is None, samples is None))
+        if fn is None:
             raise ValueError("specify exactly one of beats= or samples=")
-        if beats is not None:
-            lib.sq_transport_seek_beats(self._engine._ptr, beats)
-        else:
-            lib.sq_transport_seek_samples(self._engine._ptr, samples)
+        fn(self._ptr, samples if beats is None else beats)
 
     def set_time_signature(self, numerator: int, denominator: int) -> None:
         """Set the time signature (e.g. 4, 4 for 4/4)."""
-        lib.sq_transport_set_time_signature(self._engine._ptr, numerator, denominator)
+        lib.sq_transport_set_time_signature(self._ptr, numerator, denominator)
 
     def set_loop(self, start: float, end: float) -> None:
         """Set loop points in beats."""
-        lib.sq_transport_set_loop_points(self._engine._ptr, start, end)
+        lib.sq_transport_set_loop_points(self._ptr, start, end)
 
     @property
     def looping(self) -> bool:
         """Whether looping is enabled."""
-        return lib.sq_transport_is_looping(self._engine._ptr)
+        return lib.sq_transport_is_looping(self._ptr)
 
     @looping.setter
     def looping(self, enabled: bool) -> None:
-        lib.sq_transport_set_looping(self._engine._ptr, enabled)
+        lib.sq_transport_set_looping(self._ptr, enabled)
@@ -3,9 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import IntEnum
+from typing import NamedTuple
 
 
-@dataclass(frozen=True)
+class Tap(IntEnum):
+    """Send tap point. The strings "post" and "pre" are also accepted."""
+    POST = 0
+    PRE = 1
+
+
+@dataclass(frozen=True, slots=True)
 class ParamDescriptor:
     """Metadata for a processor parameter."""
     name: str
@@ -19,7 +27,7 @@ class ParamDescriptor:
     group: str              # "" = ungrouped
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PluginInfo:
     """Metadata about an available plugin."""
     name: str
@@ -31,7 +39,7 @@ class PluginInfo:
     num_outputs: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BufferInfo:
     """Metadata about an audio buffer."""
     buffer_id: int
@@ -42,3 +50,22 @@ class BufferInfo:
     file_path: str
     length_seconds: float
     tempo: float
+
+
+class PerfSnapshot(NamedTuple):
+    """Latest performance snapshot. Returned by ``Perf.snapshot()``."""
+    callback_avg_us: float
+    callback_peak_us: float
+    cpu_load_percent: float
+    xrun_count: int
+    callback_count: int
+    sample_rate: float
+    block_size: int
+    buffer_duration_us: float
+
+
+class SlotPerf(NamedTuple):
+    """Per-slot (source/bus) timing. Returned by ``Perf.slots()``."""
+    handle: int
+    avg_us: float
+    peak_us: float
@@ -6,7 +6,14 @@ from squeeze import Squeeze
 
 @pytest.fixture
 def s():
-    """Create a Squeeze engine, destroy it after the test."""
-    engine = Squeeze(44100.0, 512)
+    """Create a Squeeze engine, destroy it after the test.
+
+    plugins=False: no test using this fixture needs a plugin cache, and
+    skipping the upward search and XML parse keeps per-test setup cheap
+    (and independent of any plugin-cache.xml above the checkout).
+    The engine is prepared for 44100 Hz / 512-sample blocks at
+    construction, so tests call render() with no separate prepare step.
+    """
+    engine = Squeeze(44100.0, 512, plugins=False)
     yield engine
     engine.close()
@@ -1,13 +1,16 @@
 """Comprehensive Python API tests for the mixer-centric Squeeze engine."""
 
+import array
+import collections
 import pytest
 import threading
 import time
 
 from squeeze import (
     Buffer, BufferInfo, PluginInfo, Squeeze, Source, Bus, Chain, Clock, Processor,
-    Transport, Midi, MidiDevice, ParamDescriptor, SqueezeError, set_log_level,
-    set_log_callback,
+    Transport, Midi, MidiDevice, ParamDescriptor, PerfSnapshot, SlotPerf,
+    SqueezeError, Tap,
+    set_log_level, set_log_callback,
 )
 
 
@@ -16,18 +19,52 @@ from squeeze import (
 # ═══════════════════════════════════════════════════════════════════
 
 class TestLifecycle:
+    @pytest.fixture
+    def destroyed(self, monkeypatch):
+        """Engine pointers passed to sq_engine_destroy (patched before the
+        engine under test is built, so its finalizer sees the wrapper)."""
+        import squeeze.squeeze as sq_mod
+        calls = []
+        destroy = sq_mod.lib.sq_engine_destroy
+        monkeypatch.setattr(sq_mod.lib, "sq_engine_destroy",
+                            lambda p: (calls.append(p), destroy(p)))
+        return calls
+
     def test_create_and_close(self):
-        s = Squeeze(44100.0, 512)
+        s = Squeeze(44100.0, 512, plugins=False)
         s.close()
 
     def test_context_manager(self):
-        with Squeeze(44100.0, 512) as s:
+        with Squeeze(44100.0, 512, plugins=False) as s:
             assert s.version
 
     def test_double_close_is_safe(self):
-        s = Squeeze(44100.0, 512)
+        s = Squeeze(44100.0, 512, plugins=False)
+        s.close()
+        s.close()
+
+    def test_close_runs_finalizer_once(self, destroyed):
+        s = Squeeze(44100.0, 512, plugins=False)
+        assert destroyed == []
         s.close()
         s.close()
+        assert len(destroyed) == 1
+
+    def test_collected_engine_is_destroyed(self, destroyed):
+        import gc
+        s = Squeeze(44100.0, 512, plugins=False)
+        del s
+        gc.collect()
+        assert len(destroyed) == 1
+
+    def test_plugins_false_skips_plugin_loading(self, monkeypatch):
+        # Every test engine is built this way; a cache search or load here
+        # would slow the whole suite down.
+        def fail(*args):
+            raise AssertionError("plugin cache touched")
+        monkeypatch.setattr(Squeeze, "_find_plugin_cache", staticmethod(fail))
+        monkeypatch.setattr(Squeeze, "load_plugin_cache", fail)
+        Squeeze(44100.0, 512, plugins=False).close()
 
     def test_version(self, s):
         assert s.version == "0.3.0"
@@ -58,6 +95,30 @@ class TestSourceManagement:
         src = s.add_source("Lead")
         assert src.name == "Lead"
 
+    def test_source_name_after_remove(self, s):
+        src = s.add_source("Lead")
+        assert src.name == "Lead"
+        assert src.remove()
+        assert src.name == ""
+
+    def test_source_name_known_at_creation(self, s, monkeypatch):
+        import squeeze.source as src_mod
+        src = s.add_source("Lead")
+        player = s.add_source("Deck", player=True)
+        batch = s.add_sources(["A", "B"])
+        reads = []
+        name = src_mod.lib.sq_source_name
+        monkeypatch.setattr(src_mod.lib, "sq_source_name",
+                            lambda p, h: (reads.append(h), name(p, h))[1])
+        assert src.name == "Lead"
+        assert player.name == "Deck"
+        assert [b.name for b in batch] == ["A", "B"]
+        assert reads == []
+        # A wrapper built from a bare handle reads the name once.
+        fresh = Source(s, src.handle)
+        assert (fresh.name, fresh.name) == ("Lead", "Lead")
+        assert reads == [src.handle]
+
     def test_remove_source(self, s):
         src = s.add_source("Synth")
         assert src.remove()
@@ -69,15 +130,64 @@ class TestSourceManagement:
         assert isinstance(gen, Processor)
         assert gen.handle > 0
 
+    def test_source_generator_is_interned(self, s):
+        src = s.add_source("Synth")
+        assert src.generator is src.generator
+
     def test_source_repr(self, s):
         src = s.add_source("Lead")
         assert repr(src) == "Source('Lead')"
 
+    def test_source_set_membership_uses_interned_wrapper(self, s):
+        src = s.add_source("Synth")
+        sources = {src}
+        assert src in sources
+        assert Source(s, src.handle) in sources  # handle compare
+
     def test_source_equality(self, s):
         a = s.add_source("A")
         b = Source(s, a.handle)
         assert a == b
         assert hash(a) == hash(b)
+        assert hash(a) == hash(a.handle)
+
+    def test_handle_is_plain_attribute(self, s):
+        src = s.add_source("A")
+        assert not isinstance(getattr(Source, "handle"), property)
+        assert isinstance(src.handle, int)
+
+    def test_source_has_no_instance_dict(self, s):
+        src = s.add_source("A")
+        assert not hasattr(src, "__dict__")
+
+    def test_sub_objects_have_no_instance_dict(self, s):
+        clk = s.clock(1.0, 0.0, lambda beat: None)
+        for obj in (s.perf, s.midi, clk):
+            assert not hasattr(obj, "__dict__"), type(obj).__name__
+        clk.destroy()
+
+    def test_close_clears_wrapper_engine_pointers(self, monkeypatch):
+        import squeeze.bus as bus_mod
+        import squeeze.processor as proc_mod
+        import squeeze.source as src_mod
+        import squeeze.transport as transport_mod
+        s = Squeeze(44100.0, 512, plugins=False)
+        src = s.add_source("A")
+        gen = src.generator
+        bus = s.add_bus("FX")
+        t = s.transport
+        s.close()
+        # After close every wrapper hands the engine NULL, never a stale pointer.
+        seen = []
+
+        def record(ptr, *args):
+            seen.append(ptr)
+        monkeypatch.setattr(src_mod, "_sq_source_bypassed", record)
+        monkeypatch.setattr(bus_mod, "_sq_bus_bypassed", record)
+        monkeypatch.setattr(proc_mod, "_sq_get_param", record)
+        monkeypatch.setattr(transport_mod, "_sq_transport_tempo", record)
+        src.bypassed, bus.bypassed, gen.get_param("gain"), t.tempo
+        assert seen == [None, None, None, None]
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -90,6 +200,20 @@ class TestBusManagement:
         assert isinstance(m, Bus)
         assert m.handle > 0
 
+    def test_master_is_cached(self, s):
+        assert s.master is s.master
+
+    def test_master_cache_dropped_on_close(self, monkeypatch):
+        import squeeze.squeeze as sq_mod
+        s = Squeeze(44100.0, 512, plugins=False)
+        old = s.master
+        s.close()
+        lookups = []
+        monkeypatch.setattr(sq_mod.lib, "sq_master",
+                            lambda p: (lookups.append(p), old.handle)[1])
+        assert s.master is not old
+        assert lookups == [None]
+
     def test_bus_count_starts_at_1(self, s):
         assert s.bus_count == 1  # Master
 
@@ -102,6 +226,19 @@ class TestBusManagement:
     def test_bus_name(self, s):
         bus = s.add_bus("Reverb")
         assert bus.name == "Reverb"
+        assert bus.name == "Reverb"
+
+    def test_bus_name_known_at_creation(self, s, monkeypatch):
+        import squeeze.bus as bus_mod
+        bus = s.add_bus("Reverb")
+        reads = []
+        name = bus_mod.lib.sq_bus_name
+        monkeypatch.setattr(bus_mod.lib, "sq_bus_name",
+                            lambda p, h: (reads.append(h), name(p, h))[1])
+        assert bus.name == "Reverb"
+        assert reads == []
+        assert Bus(s, bus.handle).name == "Reverb"
+        assert reads == [bus.handle]
 
     def test_remove_bus(self, s):
         bus = s.add_bus("FX")
@@ -124,38 +261,57 @@ class TestBusManagement:
 # ═══════════════════════════════════════════════════════════════════
 
 class TestRouting:
+    @pytest.fixture
+    def snd(self, s):
+        """A -6 dB post-fader send from a Synth source to an FX bus."""
+        with s.batch():
+            src = s.add_source("Synth")
+            fx = s.add_bus("FX")
+            return src.send(fx, level=-6.0)
+
     def test_route_source_to_bus(self, s):
         src = s.add_source("Synth")
         src.route_to(s.master)
         s.render(512)  # verify no crash
 
-    def test_source_send(self, s):
-        src = s.add_source("Synth")
-        fx = s.add_bus("FX")
-        snd = src.send(fx, level=-6.0)
+    def test_route_source_to_bus_handle(self, s):
+        with s.batch():
+            src = s.add_source("Synth")
+            fx = s.add_bus("FX")
+        src.route_to(fx.handle)
+        s.render(512)
+
+    def test_route_many_to(self, s):
+        with s.batch():
+            a = s.add_source("A")
+            b = s.add_source("B")
+            fx = s.add_bus("FX")
+        s.route_many_to([a, b.handle], fx)
+        s.route_many_to([], fx.handle)
+        s.render(512)
+
+    def test_source_send_to_bus_handle(self, s):
+        with s.batch():
+            src = s.add_source("Synth")
+            fx = s.add_bus("FX")
+        snd = src.send(fx.handle, level=-3.0)
+        assert snd.send_id > 0
+
+    def test_source_send(self, snd):
         assert snd.send_id > 0
         assert snd.level == -6.0
         assert snd.tap == "post"
 
-    def test_source_send_remove(self, s):
-        src = s.add_source("Synth")
-        fx = s.add_bus("FX")
-        snd = src.send(fx, level=-6.0)
+    def test_source_send_remove(self, s, snd):
         snd.remove()
         s.render(512)
 
-    def test_source_send_level(self, s):
-        src = s.add_source("Synth")
-        fx = s.add_bus("FX")
-        snd = src.send(fx, level=-6.0)
+    def test_source_send_level(self, s, snd):
         snd.level = -12.0
         assert snd.level == -12.0
         s.render(512)
 
-    def test_source_send_tap(self, s):
-        src = s.add_source("Synth")
-        fx = s.add_bus("FX")
-        snd = src.send(fx, level=-6.0)
+    def test_source_send_tap(self, s, snd):
         snd.tap = "pre"
         assert snd.tap == "pre"
         snd.tap = "post"
@@ -163,50 +319,81 @@ class TestRouting:
         s.render(512)
 
     def test_source_send_pre_tap(self, s):
-        src = s.add_source("Synth")
-        fx = s.add_bus("FX")
+        with s.batch():
+            src = s.add_source("Synth")
+            fx = s.add_bus("FX")
         snd = src.send(fx, level=-6.0, tap="pre")
         assert snd.send_id > 0
         assert snd.tap == "pre"
         s.render(512)
 
+    @pytest.mark.parametrize("tap", [2, -1, "PRE", "pref"])
+    def test_source_send_rejects_unknown_tap(self, s, tap, monkeypatch):
+        import squeeze.source as src_mod
+        src, fx = s.add_source("Synth"), s.add_bus("FX")
+        calls = []
+        monkeypatch.setattr(src_mod.lib, "sq_send",
+                            lambda *args: calls.append(args))
+        with pytest.raises(ValueError):
+            src.send(fx, tap=tap)
+        assert calls == []  # rejected before a send reached the engine
+
+    @pytest.mark.parametrize("tap", [2, -1, "PRE", "pref"])
+    def test_source_send_tap_setter_rejects_unknown_tap(self, snd, tap):
+        with pytest.raises(ValueError):
+            snd.tap = tap
+        assert snd.tap == "post"
+
+    def test_source_send_tap_enum(self, s):
+        with s.batch():
+            src = s.add_source("Synth")
+            fx = s.add_bus("FX")
+        snd = src.send(fx, tap=Tap.PRE)
+        assert snd.tap == "pre"
+        snd.tap = Tap.POST
+        assert snd.tap == "post"
+        s.render(512)
+
+    def test_send_has_no_instance_dict(self, s):
+        with s.batch():
+            src = s.add_source("Synth")
+            fx = s.add_bus("FX")
+        snd = src.send(fx)
+        assert not hasattr(snd, "__dict__")
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Bus routing
 # ═══════════════════════════════════════════════════════════════════
 
 class TestBusRouting:
+    @pytest.fixture
+    def snd(self, s):
+        """A -6 dB post-fader send from bus A to bus B."""
+        with s.batch():
+            a = s.add_bus("A")
+            b = s.add_bus("B")
+            return a.send(b, level=-6.0)
+
     def test_bus_route(self, s):
         a = s.add_bus("A")
         a.route_to(s.master)
         s.render(512)
 
-    def test_bus_send(self, s):
-        a = s.add_bus("A")
-        b = s.add_bus("B")
-        snd = a.send(b, level=-6.0)
+    def test_bus_send(self, snd):
         assert snd.send_id > 0
         assert snd.level == -6.0
 
-    def test_bus_send_remove(self, s):
-        a = s.add_bus("A")
-        b = s.add_bus("B")
-        snd = a.send(b, level=-6.0)
+    def test_bus_send_remove(self, s, snd):
         snd.remove()
         s.render(512)
 
-    def test_bus_send_level(self, s):
-        a = s.add_bus("A")
-        b = s.add_bus("B")
-        snd = a.send(b, level=-6.0)
+    def test_bus_send_level(self, s, snd):
         snd.level = -12.0
         assert snd.level == -12.0
         s.render(512)
 
-    def test_bus_send_tap(self, s):
-        a = s.add_bus("A")
-        b = s.add_bus("B")
-        snd = a.send(b, level=-6.0)
+    def test_bus_send_tap(self, s, snd):
         snd.tap = "pre"
         assert snd.tap == "pre"
         snd.tap = "post"
@@ -247,6 +434,49 @@ class TestSourceChain:
         src = s.add_source("Synth")
         assert repr(src.chain) == "Chain(source, size=0)"
 
+    def test_chain_is_slotted(self, s):
+        assert not hasattr(s.add_source("Synth").chain, "__dict__")
+
+    def test_chain_cached_per_wrapper(self, s):
+        src = s.add_source("Synth")
+        assert src.chain is src.chain
+        src.chain.append()
+        assert len(src.chain) == 1
+
+    def test_chain_getitem(self, s):
+        chain = s.add_source("Synth").chain
+        a = chain.append()
+        b = chain.insert(0)
+        assert chain[0] is b
+        assert chain[1] is a
+        assert chain[-1] is a
+        assert list(chain) == [b, a]
+        chain.remove(0)
+        assert chain[0] is a
+
+    def test_chain_getitem_out_of_range(self, s):
+        chain = s.add_source("Synth").chain
+        chain.append()
+        with pytest.raises(IndexError):
+            chain[1]
+        with pytest.raises(IndexError):
+            chain[-2]
+
+    def test_chain_grows_past_initial_buffer(self, s):
+        chain = s.add_source("Synth").chain
+        procs = [chain.append() for _ in range(40)]
+        assert len(chain) == 40
+        assert [chain[i] for i in range(40)] == procs
+
+    def test_chain_edits_seen_through_other_wrappers(self, s):
+        src = s.add_source("Synth")
+        assert len(src.chain) == 0
+        proc = Source(s, src.handle).chain.append()
+        assert len(src.chain) == 1
+        assert src.chain[0] is proc
+        assert Source(s, src.handle).remove()
+        assert len(src.chain) == 0
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Bus chain
@@ -266,64 +496,101 @@ class TestBusChain:
         s.master.chain.remove(0)
         assert len(s.master.chain) == 0
 
+    def test_chain_getitem(self, s):
+        proc = s.master.chain.append()
+        assert s.master.chain[0] is proc
+
+    def test_chain_edits_seen_through_other_wrappers(self, s):
+        bus = s.add_bus("FX")
+        assert len(bus.chain) == 0
+        Bus(s, bus.handle).chain.append()
+        assert len(bus.chain) == 1
+        assert Bus(s, bus.handle).remove()
+        assert len(bus.chain) == 0
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Processor params
 # ═══════════════════════════════════════════════════════════════════
 
 class TestProcessorParams:
-    def test_get_set_param(self, s):
-        src = s.add_source("Synth")
-        gen = src.generator
+    @pytest.fixture
+    def gen(self, s):
+        """The Synth source's generator, built once per test."""
+        return s.add_source("Synth").generator
+
+    def test_get_set_param(self, gen):
         assert gen.get_param("gain") == 1.0
         gen.set_param("gain", 0.5)
         assert gen.get_param("gain") == 0.5
 
-    def test_param_text(self, s):
-        src = s.add_source("Synth")
-        gen = src.generator
+    def test_set_params(self, gen):
+        assert gen.set_params({"gain": 0.25}) == 1
+        assert gen.get_param("gain") == 0.25
+        assert gen.set_params({}) == 0
+
+    def test_get_params(self, gen):
+        gen.set_param("gain", 0.25)
+        assert gen.get_params(["gain"]) == {"gain": 0.25}
+        assert gen.get_params() == {"gain": 0.25}
+        assert gen.get_params([]) == {}
+
+    def test_get_params_gone_processor(self, s):
+        assert Processor(s, 9999).get_params(["gain"]) == {}
+
+    def test_param_text(self, gen):
         text = gen.param_text("gain")
         assert isinstance(text, str)
 
-    def test_param_descriptors(self, s):
-        src = s.add_source("Synth")
-        gen = src.generator
+    def test_param_descriptors(self, gen):
         descs = gen.param_descriptors
         assert len(descs) >= 1
         assert isinstance(descs[0], ParamDescriptor)
         assert descs[0].name == "gain"
 
-    def test_param_descriptor_fields(self, s):
-        src = s.add_source("Synth")
-        gen = src.generator
+    def test_param_descriptor_fields(self, gen):
         d = gen.param_descriptors[0]
         assert d.min_value <= d.default_value <= d.max_value
+        assert isinstance(d.automatable, bool)
+        assert isinstance(d.boolean, bool)
+        assert isinstance(d.label, str)
 
-    def test_param_count(self, s):
-        src = s.add_source("Synth")
-        gen = src.generator
+    def test_param_descriptor_is_slotted_and_frozen(self, gen):
+        import dataclasses
+        d = gen.param_descriptors[0]
+        assert not hasattr(d, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            d.name = "other"
+
+    def test_param_descriptors_fetched_once_per_wrapper(self, gen, monkeypatch):
+        import squeeze.processor as proc_mod
+        calls = []
+        packed = proc_mod.lib.sq_param_descriptors_packed
+        monkeypatch.setattr(proc_mod.lib, "sq_param_descriptors_packed",
+                            lambda p, h: (calls.append(h), packed(p, h))[1])
+        first = gen.param_descriptors
+        second = gen.param_descriptors
+        assert gen.param_count == len(first)
+        assert first == second
+        assert first is not second  # callers get their own list
+        assert calls == [gen.handle]
+
+    def test_param_count(self, gen):
         assert gen.param_count >= 1
 
-    def test_processor_latency(self, s):
-        src = s.add_source("Synth")
-        gen = src.generator
+    def test_processor_latency(self, gen):
         assert gen.latency == 0
 
-    def test_processor_repr(self, s):
-        src = s.add_source("Synth")
-        gen = src.generator
+    def test_processor_repr(self, gen):
         assert repr(gen).startswith("Processor(")
 
-    def test_processor_equality(self, s):
-        src = s.add_source("Synth")
-        a = src.generator
+    def test_processor_equality(self, s, gen):
+        a = gen
         b = Processor(s, a.handle)
         assert a == b
         assert hash(a) == hash(b)
 
-    def test_processor_automate(self, s):
-        src = s.add_source("Synth")
-        gen = src.generator
+    def test_processor_automate(self, gen):
         result = gen.automate(0.0, "gain", 0.5)
         assert result is True
 
@@ -332,35 +599,41 @@ class TestProcessorParams:
 # Source gain/pan/bypass
 # ═══════════════════════════════════════════════════════════════════
 
-class TestSourceProperties:
-    def test_gain_default(self, s):
-        src = s.add_source("Synth")
-        assert src.gain == 1.0
-
-    def test_gain_roundtrip(self, s):
-        src = s.add_source("Synth")
-        src.gain = 0.5
-        assert src.gain == 0.5
+# Default / new value per property; each test checks the default, the new
+# value, and restoring the default, on one engine.
+_MIXER_PROPS = [("gain", 1.0, 0.5), ("pan", 0.0, -0.5), ("bypassed", False, True)]
 
-    def test_pan_default(self, s):
-        src = s.add_source("Synth")
-        assert src.pan == 0.0
 
-    def test_pan_roundtrip(self, s):
+class TestSourceProperties:
+    @pytest.mark.parametrize("attr,default,new", _MIXER_PROPS)
+    def test_default_and_roundtrip(self, s, attr, default, new):
         src = s.add_source("Synth")
-        src.pan = -0.5
-        assert src.pan == -0.5
+        assert getattr(src, attr) == default
+        setattr(src, attr, new)
+        assert getattr(src, attr) == new
+        setattr(src, attr, default)
+        assert getattr(src, attr) == default
 
-    def test_bypassed_default(self, s):
+    def test_gain_pan_setters_cache_clamped_value(self, s):
         src = s.add_source("Synth")
-        assert not src.bypassed
-
-    def test_bypassed_roundtrip(self, s):
+        src.gain = -1.0
+        src.pan = 2.0
+        assert src.gain == 0.0
+        assert src.pan == 1.0
+        # A fresh wrapper reads the same values back from the engine.
+        fresh = Source(s, src.handle)
+        assert (fresh.gain, fresh.pan) == (0.0, 1.0)
+
+    def test_gain_pan_edits_shared_across_wrappers(self, s):
         src = s.add_source("Synth")
-        src.bypassed = True
-        assert src.bypassed
-        src.bypassed = False
-        assert not src.bypassed
+        assert (src.gain, src.pan) == (1.0, 0.0)
+        other = Source(s, src.handle)
+        other.gain = 0.5
+        other.pan = 0.5
+        assert (src.gain, src.pan) == (0.5, 0.5)
+        assert other.remove()
+        # Unknown handle: the engine reports 0.0, nothing stale is served.
+        assert (src.gain, src.pan) == (0.0, 0.0)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -368,26 +641,31 @@ class TestSourceProperties:
 # ═══════════════════════════════════════════════════════════════════
 
 class TestBusProperties:
-    def test_gain_default(self, s):
-        assert s.master.gain == 1.0
-
-    def test_gain_roundtrip(self, s):
-        s.master.gain = 0.75
-        assert s.master.gain == 0.75
-
-    def test_pan_default(self, s):
-        assert s.master.pan == 0.0
-
-    def test_pan_roundtrip(self, s):
+    @pytest.mark.parametrize("attr,default,new", _MIXER_PROPS)
+    def test_default_and_roundtrip(self, s, attr, default, new):
+        bus = s.add_bus("FX")
+        for target in (s.master, bus):
+            assert getattr(target, attr) == default
+            setattr(target, attr, new)
+            assert getattr(target, attr) == new
+            setattr(target, attr, default)
+            assert getattr(target, attr) == default
+
+    def test_pan_clamps(self, s):
+        s.master.pan = -3.0
+        assert s.master.pan == -1.0
         s.master.pan = 1.0
         assert s.master.pan == 1.0
 
-    def test_bypassed_default(self, s):
-        assert not s.master.bypassed
-
-    def test_bypassed_roundtrip(self, s):
-        s.master.bypassed = True
-        assert s.master.bypassed
+    def test_gain_pan_edits_shared_across_wrappers(self, s):
+        bus = s.add_bus("FX")
+        assert (bus.gain, bus.pan) == (1.0, 0.0)
+        other = Bus(s, bus.handle)
+        other.gain = 0.5
+        other.pan = 0.5
+        assert (bus.gain, bus.pan) == (0.5, 0.5)
+        assert other.remove()
+        assert (bus.gain, bus.pan) == (0.0, 0.0)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -414,6 +692,63 @@ class TestBatching:
         assert s.source_count == 2
         s.render(512)
 
+    def test_nested_batches(self, s):
+        with s.batch():
+            a = s.add_source("A")
+            with s.batch():
+                b = s.add_source("B")
+            a.route_to(s.master)
+            b.route_to(s.master)
+        assert s.source_count == 2
+        s.render(512)
+
+    def test_batch_depth_restored_on_error(self, s, monkeypatch):
+        import squeeze.squeeze as sq_mod
+        with pytest.raises(RuntimeError):
+            with s.batch():
+                with s.batch():
+                    raise RuntimeError("boom")
+        # Back at depth 0, so the next batch opens and commits its own.
+        calls = []
+        begin, commit = sq_mod.lib.sq_batch_begin, sq_mod.lib.sq_batch_commit
+        monkeypatch.setattr(sq_mod.lib, "sq_batch_begin",
+                            lambda p: (calls.append("begin"), begin(p)))
+        monkeypatch.setattr(sq_mod.lib, "sq_batch_commit",
+                            lambda p: (calls.append("commit"), commit(p)))
+        with s.batch():
+            s.add_source("A")
+        assert calls == ["begin", "commit"]
+        assert s.source_count == 1
+
+    def test_add_sources(self, s):
+        a, b = s.add_sources(["A", "B"])
+        assert s.source_count == 2
+        assert (a.name, b.name) == ("A", "B")
+        assert a != b
+        assert s.add_sources([]) == []
+        s.render(512)
+
+    def test_add_sources_inside_batch(self, s):
+        with s.batch():
+            srcs = s.add_sources(["A", "B"])
+            srcs[0].route_to(s.master)
+        assert s.source_count == 2
+        s.render(512)
+
+    def test_nested_batches_cross_ffi_once(self, s, monkeypatch):
+        import squeeze.squeeze as sq_mod
+        calls = []
+        begin, commit = sq_mod.lib.sq_batch_begin, sq_mod.lib.sq_batch_commit
+        monkeypatch.setattr(sq_mod.lib, "sq_batch_begin",
+                            lambda p: (calls.append("begin"), begin(p)))
+        monkeypatch.setattr(sq_mod.lib, "sq_batch_commit",
+                            lambda p: (calls.append("commit"), commit(p)))
+        with s.batch():
+            with s.batch():
+                with s.batch():
+                    s.add_source("A")
+        assert calls == ["begin", "commit"]
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Transport
@@ -423,12 +758,21 @@ class TestTransport:
     def test_transport_type(self, s):
         assert isinstance(s.transport, Transport)
 
-    def test_play_stop(self, s):
-        s.transport.play()
-        s.transport.stop()
-
-    def test_pause(self, s):
-        s.transport.pause()
+    def test_control_ops(self, s):
+        # Smoke calls with no readback, run in sequence on one engine
+        # rather than one engine per call.
+        t = s.transport
+        t.play()
+        t.stop()
+        t.pause()
+        t.playing = True
+        t.playing = False
+        t.seek(beats=2.0)
+        t.seek(samples=1024)
+        t.set_time_signature(3, 4)
+        t.set_loop(0.0, 4.0)
+        t.looping = True
+        t.looping = False
 
     def test_tempo_default(self, s):
         assert s.transport.tempo == 120.0
@@ -443,32 +787,12 @@ class TestTransport:
     def test_playing_default(self, s):
         assert not s.transport.playing
 
-    def test_playing_setter(self, s):
-        s.transport.playing = True
-        s.transport.playing = False
-
-    def test_seek_beats(self, s):
-        s.transport.seek(beats=2.0)
-
-    def test_seek_samples(self, s):
-        s.transport.seek(samples=1024)
-
     def test_seek_requires_one_arg(self, s):
         with pytest.raises(ValueError):
             s.transport.seek()
         with pytest.raises(ValueError):
             s.transport.seek(beats=1.0, samples=512)
 
-    def test_set_time_signature(self, s):
-        s.transport.set_time_signature(3, 4)
-
-    def test_set_loop(self, s):
-        s.transport.set_loop(0.0, 4.0)
-
-    def test_looping_setter(self, s):
-        s.transport.looping = True
-        s.transport.looping = False
-
 
 # ═══════════════════════════════════════════════════════════════════
 # Event scheduling
@@ -495,6 +819,51 @@ class TestEventScheduling:
         result = src.pitch_bend(0.0, 1, 8192)
         assert result is True
 
+    def test_schedule_events(self, s):
+        src = s.add_source("Synth")
+        queued = src.schedule_events([
+            ("note_on", 0.0, 1, 60, 0.8),
+            ("note_off", 0.5, 1, 60, 0.0),
+            ("cc", 0.0, 1, 7, 100),
+            ("pitch_bend", 0.0, 1, 12000, 0.0),
+        ])
+        assert queued == 4
+        s.transport.play()
+        s.render(512)
+
+    def test_schedule_events_empty(self, s):
+        src = s.add_source("Synth")
+        assert src.schedule_events([]) == 0
+
+    def test_schedule_events_unknown_kind_raises(self, s):
+        src = s.add_source("Synth")
+        with pytest.raises(ValueError):
+            src.schedule_events([("aftertouch", 0.0, 1, 60, 0.5)])
+
+    def test_schedule_event_columns_arrays(self, s):
+        from array import array
+        src = s.add_source("Synth")
+        queued = src.schedule_event_columns(
+            array("d", [0.0, 0.5, 1.0]),
+            array("i", [0, 1, 2]),
+            array("i", [1, 1, 1]),
+            array("i", [60, 60, 7]),
+            array("f", [0.8, 0.0, 100.0]),
+        )
+        assert queued == 3
+        s.transport.play()
+        s.render(512)
+
+    def test_schedule_event_columns_lists(self, s):
+        src = s.add_source("Synth")
+        assert src.schedule_event_columns([0.0], [3], [1], [12000], [0.0]) == 1
+        assert src.schedule_event_columns([], [], [], [], []) == 0
+
+    def test_schedule_event_columns_length_mismatch_raises(self, s):
+        src = s.add_source("Synth")
+        with pytest.raises(ValueError):
+            src.schedule_event_columns([0.0, 1.0], [0], [1], [60], [0.8])
+
     def test_param_change_dispatches(self, s):
         src = s.add_source("Synth")
         gen = src.generator
@@ -518,12 +887,12 @@ class TestClock:
 
     def test_resolution_property(self, s):
         clk = s.clock(0.25, 50.0, lambda beat: None)
-        assert abs(clk.resolution - 0.25) < 1e-9
+        assert clk.resolution == 0.25
         clk.destroy()
 
     def test_latency_ms_property(self, s):
         clk = s.clock(0.25, 50.0, lambda beat: None)
-        assert abs(clk.latency_ms - 50.0) < 1e-9
+        assert clk.latency_ms == 50.0
         clk.destroy()
 
     def test_invalid_resolution_raises(self, s):
@@ -535,29 +904,28 @@ class TestClock:
             s.clock(1.0, -1.0, lambda beat: None)
 
     def test_callback_fires_during_render(self, s):
-        beats = []
-        lock = threading.Lock()
+        beats = collections.deque()  # append is thread-safe; no lock needed
         event = threading.Event()
 
         def on_beat(beat):
-            with lock:
-                beats.append(beat)
-                if len(beats) >= 1:
-                    event.set()
+            beats.append(beat)
+            event.set()
 
         clk = s.clock(1.0, 0.0, on_beat)
         s.transport.play()
         s.render(512)  # process play command
 
-        # Render enough blocks to cross beat 1.0
+        # Render until the beat-1.0 callback lands (~44 blocks at 120 BPM),
+        # at most 50 blocks.
         for _ in range(50):
             s.render(512)
+            if event.is_set():
+                break
 
-        event.wait(timeout=1.0)
+        event.wait(timeout=1.0)  # returns at once if already set
 
-        with lock:
-            assert len(beats) >= 1
-            assert abs(beats[0] - 1.0) < 1e-9
+        assert len(beats) >= 1
+        assert abs(beats[0] - 1.0) < 1e-9
 
         clk.destroy()
 
@@ -585,14 +953,56 @@ class TestPluginManager:
     def test_num_plugins_zero(self, s):
         assert s.num_plugins == 0
 
-    def test_plugin_infos_empty(self):
-        with Squeeze(plugins=False) as s:
-            infos = s.plugin_infos
-            assert isinstance(infos, list)
-            assert len(infos) == 0
-
-    def test_plugin_info_importable(self):
-        assert PluginInfo is not None
+    def test_plugin_infos_empty(self, s):
+        infos = s.plugin_infos
+        assert isinstance(infos, list)
+        assert len(infos) == 0
+
+    def test_plugin_queries_cached_until_reload(self, s, tmp_path):
+        cache = tmp_path / "plugin-cache.xml"
+        cache.write_text(
+            '<KNOWNPLUGINS><PLUGIN name="Synth A" descriptiveName="Synth A"'
+            ' format="VST3" category="Instrument" manufacturer="TestCo"'
+            ' version="1.0" file="/path/to/SynthA.vst3" uid="1234"'
+            ' isInstrument="1" numInputs="0" numOutputs="2"/></KNOWNPLUGINS>'
+        )
+        assert s.num_plugins == 0
+        s.load_plugin_cache(str(cache))
+        names = s.available_plugins
+        assert names == ["Synth A"]
+        names.append("mutated")
+        assert s.available_plugins == ["Synth A"]
+        assert s.num_plugins == 1
+        assert s.plugin_infos[0].manufacturer == "TestCo"
+        with pytest.raises(SqueezeError):
+            s.load_plugin_cache(str(tmp_path / "missing.xml"))
+        assert s.available_plugins == []
+        assert s.num_plugins == 0
+        assert s.plugin_infos == []
+
+    def test_plugin_info_is_slotted(self):
+        info = PluginInfo("Synth", "Acme", "Instrument", "1.0", True, 0, 2)
+        assert not hasattr(info, "__dict__")
+
+    def test_plugin_cache_found_upward_and_revalidated(self, tmp_path, monkeypatch):
+        cache = tmp_path / "plugin-cache.xml"
+        cache.write_text("<KNOWNPLUGINS/>")
+        work = tmp_path / "a" / "b"
+        work.mkdir(parents=True)
+        monkeypatch.chdir(work)
+        loaded = []
+        monkeypatch.setattr(Squeeze, "load_plugin_cache",
+                            lambda self, path: loaded.append(path))
+        Squeeze().close()
+        Squeeze().close()
+        assert loaded == [str(cache.resolve())] * 2
+        # A deleted cache is searched for again, not loaded from memory.
+        cache.unlink()
+        Squeeze().close()
+        assert len(loaded) == 2
+        (tmp_path / "a" / "plugin-cache.xml").write_text("<KNOWNPLUGINS/>")
+        Squeeze().close()
+        assert loaded[2:] == [str((tmp_path / "a" / "plugin-cache.xml").resolve())]
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -600,6 +1010,16 @@ class TestPluginManager:
 # ═══════════════════════════════════════════════════════════════════
 
 class TestMidiDevices:
+    @pytest.fixture
+    def enumerations(self, monkeypatch):
+        """Engine pointers passed to sq_midi_devices, one per enumeration."""
+        import squeeze.midi as midi_mod
+        calls = []
+        devices = midi_mod.lib.sq_midi_devices
+        monkeypatch.setattr(midi_mod.lib, "sq_midi_devices",
+                            lambda p: (calls.append(p), devices(p))[1])
+        return calls
+
     def test_midi_type(self, s):
         assert isinstance(s.midi, Midi)
 
@@ -607,9 +1027,70 @@ class TestMidiDevices:
         devs = s.midi.devices
         assert isinstance(devs, list)
 
+    def test_devices_enumeration_cached(self, s, enumerations):
+        first = s.midi.devices
+        assert first == s.midi.devices
+        assert first is not s.midi.devices  # callers get their own list
+        assert len(enumerations) == 1
+
+    def test_prefetch_midi(self):
+        with Squeeze(plugins=False, prefetch_midi=True) as s:
+            assert isinstance(s.midi.devices, list)
+
+    def test_prefetch_midi_close_before_read(self):
+        Squeeze(plugins=False, prefetch_midi=True).close()
+
+    def test_devices_version_stable_without_hotplug(self, s):
+        v = s.midi.devices_version
+        assert isinstance(v, int)
+        s.midi.devices
+        assert s.midi.devices_version == v
+
+    def test_devices_version_change_refreshes_cache(self, s, enumerations,
+                                                    monkeypatch):
+        import squeeze.midi as midi_mod
+        version = [0]
+        monkeypatch.setattr(midi_mod.lib, "sq_midi_devices_version",
+                            lambda p: version[0])
+        s.midi.devices
+        s.midi.devices
+        version[0] += 1  # as if the OS reported a device plugged in
+        s.midi.devices
+        assert len(enumerations) == 2
+
+    def test_device_close_invalidates_devices_cache(self, s, enumerations):
+        s.midi.devices
+        MidiDevice(s, "Keylab").close()
+        s.midi.devices
+        assert len(enumerations) == 2
+
     def test_open_devices_empty(self, s):
         assert s.midi.open_devices == []
 
+    def test_device_wrappers_are_shared(self, s, monkeypatch):
+        import squeeze.midi as midi_mod
+        # Report one device without touching the OS.
+        monkeypatch.setattr(midi_mod.lib, "sq_midi_devices", lambda p: None)
+        monkeypatch.setattr(midi_mod.lib, "sq_midi_open_devices", lambda p: None)
+        monkeypatch.setattr(midi_mod, "string_list_to_python",
+                            lambda names: ["Keylab"])
+        [dev] = s.midi.devices
+        [opened] = s.midi.open_devices
+        assert opened is dev
+        assert dev.name == "Keylab"
+        assert not hasattr(dev, "__dict__")
+
+    def test_routes_empty(self, s):
+        assert s.midi.routes == []
+
+    def test_route_info_is_slotted_dataclass(self):
+        from squeeze.midi import MidiRouteInfo
+        info = MidiRouteInfo(1, "Keylab", 2, 0, 0, 127)
+        assert not hasattr(info, "__dict__")
+        assert info != (1, "Keylab", 2, 0, 0, 127)
+        info.channel_filter = 10
+        assert info.channel_filter == 10
+
 
 # ═══════════════════════════════════════════════════════════════════
 # MIDI assignment
@@ -643,6 +1124,34 @@ class TestRender:
     def test_render_default_arg(self, s):
         s.render()
 
+    def test_render_blocks_matches_repeated_render(self, s):
+        s.transport.play()
+        s.render(512)  # process play command
+        p0 = s.transport.position
+        s.render(512, blocks=4)
+        p1 = s.transport.position
+        for _ in range(4):
+            s.render(512)
+        p2 = s.transport.position
+        assert p1 > p0
+        assert p2 - p1 == pytest.approx(p1 - p0)
+
+    def test_render_zero_blocks_is_noop(self, s):
+        s.transport.play()
+        s.render(512)
+        pos = s.transport.position
+        s.render(512, blocks=0)
+        assert s.transport.position == pos
+
+    def test_long_running_calls_drop_the_gil(self):
+        import ctypes
+        from squeeze._ffi import lib
+        # PyDLL-style functions would hold the GIL for the whole call.
+        for name in ("sq_render", "sq_render_blocks", "sq_process_events",
+                     "sq_midi_devices", "sq_transport_seek_beats", "sq_load_buffers"):
+            flags = type(getattr(lib, name))._flags_
+            assert not flags & ctypes._FUNCFLAG_PYTHONAPI, name
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Process events
@@ -652,12 +1161,62 @@ class TestProcessEvents:
     def test_process_events(self, s):
         Squeeze.process_events(0)
 
+    def test_process_events_releases_gil(self, s):
+        ticks = []
+        stop = threading.Event()
+
+        def spin():
+            while not stop.is_set():
+                ticks.append(1)
+                time.sleep(0.001)
+
+        t = threading.Thread(target=spin)
+        t.start()
+        try:
+            # A loaded machine may not schedule the spinner inside any one
+            # call, so give it several; with the GIL held it never could.
+            for _ in range(20):
+                before = len(ticks)
+                Squeeze.process_events(100)
+                if len(ticks) > before:
+                    break
+            assert len(ticks) > before
+        finally:
+            stop.set()
+            t.join()
+
+    def test_run_seconds_respects_deadline(self, s):
+        # Only the lower bound is exact; a hang is caught by faulthandler_timeout.
+        calls = []
+        start = time.monotonic()
+        s.run(seconds=0.12, until=lambda: calls.append(1) and False)
+        assert time.monotonic() - start >= 0.12
+        assert calls  # polled until the deadline, which ended the run
+
+    def test_run_until(self, s):
+        calls = []
+        s.run(until=lambda: calls.append(1) or len(calls) >= 3)
+        assert len(calls) == 3
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Performance monitoring
 # ═══════════════════════════════════════════════════════════════════
 
 class TestPerfMonitor:
+    @pytest.fixture
+    def warm(self, s):
+        """An engine with perf enabled and a routed Synth, rendered once.
+
+        callback_count and xrun_count are live counters, and sample_rate /
+        block_size are fixed at prepare time, so one block is enough for
+        tests that read only those fields.
+        """
+        s.perf.enabled = True
+        s.add_source("Synth").route_to(s.master)
+        s.render(512)
+        return s
+
     def test_disabled_by_default(self, s):
         assert not s.perf.enabled
 
@@ -677,11 +1236,11 @@ class TestPerfMonitor:
         assert not s.perf.slot_profiling
 
     def test_xrun_threshold_default(self, s):
-        assert abs(s.perf.xrun_threshold - 1.0) < 1e-6
+        assert s.perf.xrun_threshold == 1.0
 
     def test_xrun_threshold_roundtrip(self, s):
         s.perf.xrun_threshold = 0.5
-        assert abs(s.perf.xrun_threshold - 0.5) < 1e-6
+        assert s.perf.xrun_threshold == 0.5
 
     def test_xrun_threshold_clamped(self, s):
         s.perf.xrun_threshold = 0.01
@@ -691,10 +1250,10 @@ class TestPerfMonitor:
 
     def test_snapshot_when_disabled(self, s):
         snap = s.perf.snapshot()
-        assert isinstance(snap, dict)
-        assert snap["callback_avg_us"] == 0.0
-        assert snap["xrun_count"] == 0
-        assert snap["callback_count"] == 0
+        assert isinstance(snap, PerfSnapshot)
+        assert snap.callback_avg_us == 0.0
+        assert snap.xrun_count == 0
+        assert snap.callback_count == 0
 
     def test_snapshot_fields(self, s):
         snap = s.perf.snapshot()
@@ -703,29 +1262,21 @@ class TestPerfMonitor:
             "xrun_count", "callback_count", "sample_rate", "block_size",
             "buffer_duration_us",
         }
-        assert set(snap.keys()) == expected_keys
-
-    def test_snapshot_after_render(self, s):
-        s.perf.enabled = True
-        src = s.add_source("Synth")
-        src.route_to(s.master)
-        for _ in range(20):
-            s.render(512)
-        snap = s.perf.snapshot()
-        assert snap["callback_count"] >= 1
-        assert snap["sample_rate"] == 44100.0
-        assert snap["block_size"] == 512
-
-    def test_reset(self, s):
-        s.perf.enabled = True
-        for _ in range(20):
-            s.render(512)
-        snap = s.perf.snapshot()
-        assert snap["callback_count"] >= 1
-        s.perf.reset()
-        snap2 = s.perf.snapshot()
-        assert snap2["xrun_count"] == 0
-        assert snap2["callback_count"] == 0
+        assert set(snap._fields) == expected_keys
+
+    def test_snapshot_after_render(self, warm):
+        snap = warm.perf.snapshot()
+        assert snap.callback_count >= 1
+        assert snap.sample_rate == 44100.0
+        assert snap.block_size == 512
+
+    def test_reset(self, warm):
+        snap = warm.perf.snapshot()
+        assert snap.callback_count >= 1
+        warm.perf.reset()
+        snap2 = warm.perf.snapshot()
+        assert snap2.xrun_count == 0
+        assert snap2.callback_count == 0
 
     def test_slots_empty_when_disabled(self, s):
         slots = s.perf.slots()
@@ -737,14 +1288,34 @@ class TestPerfMonitor:
         s.perf.slot_profiling = True
         src = s.add_source("Synth")
         src.route_to(s.master)
-        for _ in range(20):
-            s.render(512)
+        s.render(512, blocks=20)
         slots = s.perf.slots()
         assert len(slots) >= 1
         for slot in slots:
-            assert "handle" in slot
-            assert "avg_us" in slot
-            assert "peak_us" in slot
+            assert isinstance(slot, SlotPerf)
+            assert slot.handle > 0
+            assert slot.avg_us >= 0.0
+            assert slot.peak_us >= 0.0
+
+    def test_slots_repeated_calls_agree(self, s):
+        s.perf.enabled = True
+        s.perf.slot_profiling = True
+        with s.batch():  # one snapshot rebuild for all 40 sources
+            for i in range(40):
+                s.add_source(f"S{i}")
+        s.render(512, blocks=20)
+        first = [slot.handle for slot in s.perf.slots()]
+        second = [slot.handle for slot in s.perf.slots()]
+        assert len(first) > 32  # exceeds the initial reusable buffer
+        assert first == second
+
+    def test_slots_rows_decode_to_source_handles(self, s):
+        s.perf.enabled = True
+        s.perf.slot_profiling = True
+        srcs = s.add_sources(["A", "B", "C"])
+        s.render(512, blocks=20)
+        handles = {slot.handle for slot in s.perf.slots()}
+        assert {src.handle for src in srcs} <= handles
 
     def test_callback_count_increments(self, s):
         s.perf.enabled = True
@@ -752,7 +1323,7 @@ class TestPerfMonitor:
         s.render(512)
         s.render(512)
         snap = s.perf.snapshot()
-        assert snap["callback_count"] >= 3
+        assert snap.callback_count >= 3
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -762,29 +1333,51 @@ class TestPerfMonitor:
 class TestImports:
     def test_public_exports(self):
         import squeeze
-        assert hasattr(squeeze, 'Squeeze')
-        assert hasattr(squeeze, 'Source')
-        assert hasattr(squeeze, 'Bus')
-        assert hasattr(squeeze, 'Chain')
-        assert hasattr(squeeze, 'Clock')
-        assert hasattr(squeeze, 'Perf')
-        assert hasattr(squeeze, 'Processor')
-        assert hasattr(squeeze, 'Send')
-        assert hasattr(squeeze, 'Transport')
-        assert hasattr(squeeze, 'Midi')
-        assert hasattr(squeeze, 'MidiDevice')
-        assert hasattr(squeeze, 'ParamDescriptor')
-        assert hasattr(squeeze, 'SqueezeError')
-        assert hasattr(squeeze, 'set_log_level')
-        assert hasattr(squeeze, 'set_log_callback')
-
-    def test_buffer_exported(self):
+        for name in (
+            'Squeeze', 'Source', 'Bus', 'Chain', 'Clock', 'Perf', 'Processor',
+            'Send', 'Transport', 'Midi', 'MidiDevice', 'ParamDescriptor',
+            'Buffer', 'BufferInfo', 'PluginInfo', 'PerfSnapshot', 'SlotPerf',
+            'SqueezeError', 'set_log_level', 'set_log_callback',
+        ):
+            assert hasattr(squeeze, name), name
+
+    def test_star_import_exports_public_names(self):
         import squeeze
-        assert hasattr(squeeze, 'Buffer')
-
-    def test_plugin_info_exported(self):
+        ns: dict[str, object] = {}
+        exec("from squeeze import *", ns)
+        assert ns["Squeeze"] is squeeze.Squeeze
+        assert ns["SqueezeError"] is squeeze.SqueezeError
+        assert ns["BufferInfo"] is squeeze.BufferInfo
+        assert set(squeeze.__all__) <= set(ns)
+
+    def test_lazy_exports_resolve_to_module_classes(self):
+        import squeeze
+        from squeeze.midi import MidiRouteInfo
+        from squeeze.transport import Transport as T
+        assert squeeze.Transport is T
+        assert squeeze.MidiRouteInfo is MidiRouteInfo
+        assert "Clock" in dir(squeeze)
+
+    def test_import_does_not_load_library(self):
+        import os
+        import subprocess
+        import sys
         import squeeze
-        assert hasattr(squeeze, 'PluginInfo')
+        pkg_root = os.path.dirname(os.path.dirname(squeeze.__file__))
+        code = (
+            "import sys, squeeze\n"
+            "from squeeze import Tap, ParamDescriptor\n"
+            "assert 'squeeze._ffi' not in sys.modules\n"
+            "squeeze.Squeeze\n"
+            "assert 'squeeze._ffi' in sys.modules\n"
+        )
+        env = dict(os.environ, PYTHONPATH=pkg_root)
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+    def test_encode_cached_reuses_bytes(self):
+        from squeeze._helpers import encode_cached
+        assert encode_cached("Lead") is encode_cached("Lead")
+        assert encode_cached("Lead") == b"Lead"
 
     def test_no_old_exports(self):
         import squeeze
@@ -798,126 +1391,172 @@ class TestImports:
 # ═══════════════════════════════════════════════════════════════════
 
 class TestBuffer:
-    def test_create_buffer(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=2, length=44100, sample_rate=44100.0, name="test")
-            assert isinstance(buf, Buffer)
-            assert buf.buffer_id >= 1
-
-    def test_buffer_metadata(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=2, length=44100, sample_rate=44100.0, name="kick")
-            assert buf.num_channels == 2
-            assert buf.length == 44100
-            assert buf.sample_rate == 44100.0
-            assert buf.name == "kick"
-            assert abs(buf.length_seconds - 1.0) < 1e-6
-
-    def test_buffer_count(self):
-        with Squeeze(plugins=False) as s:
-            assert s.buffer_count == 0
-            s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            assert s.buffer_count == 1
-            s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            assert s.buffer_count == 2
-
-    def test_buffer_write_and_read(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            data = [float(i) / 100.0 for i in range(100)]
-            written = buf.write(channel=0, data=data)
-            assert written == 100
-
-            samples = buf.read(channel=0, num_samples=10)
-            assert len(samples) == 10
-            assert abs(samples[0] - 0.0) < 1e-6
-            assert abs(samples[5] - 0.05) < 1e-6
-
-    def test_buffer_read_default_all(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=50, sample_rate=44100.0)
-            data = [0.5] * 50
-            buf.write(channel=0, data=data)
-            samples = buf.read(channel=0)
-            assert len(samples) == 50
-
-    def test_buffer_read_with_offset(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            data = [float(i) for i in range(100)]
-            buf.write(channel=0, data=data)
-            samples = buf.read(channel=0, offset=90, num_samples=10)
-            assert len(samples) == 10
-            assert abs(samples[0] - 90.0) < 1e-4
-
-    def test_buffer_write_position(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            assert buf.write_position == 0
-            buf.write_position = 50
-            assert buf.write_position == 50
-
-    def test_buffer_clear(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            buf.write(channel=0, data=[1.0] * 100)
-            buf.write_position = 100
-            buf.clear()
-            assert buf.write_position == 0
-            samples = buf.read(channel=0, num_samples=1)
-            assert abs(samples[0]) < 1e-6
-
-    def test_buffer_remove(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            assert s.buffer_count == 1
-            assert buf.remove()
-            assert s.buffer_count == 0
-
-    def test_buffer_repr(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0, name="sine")
-            assert "sine" in repr(buf)
-
-    def test_buffer_equality(self):
-        with Squeeze(plugins=False) as s:
-            buf1 = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            buf2 = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            assert buf1 != buf2
-            assert buf1 == Buffer(s, buf1.buffer_id)
-
-    def test_buffer_tempo_default(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            assert buf.tempo == 0.0
-
-    def test_buffer_tempo_set_and_get(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            buf.tempo = 120.0
-            assert buf.tempo == 120.0
-            buf.tempo = 98.5
-            assert buf.tempo == 98.5
-
-    def test_buffer_tempo_reset_to_zero(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            buf.tempo = 140.0
-            buf.tempo = 0.0
-            assert buf.tempo == 0.0
-
-    def test_buffer_info_includes_tempo(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            buf.tempo = 128.0
-            info = s.buffer_info(buf.buffer_id)
-            assert info.tempo == 128.0
-
-    def test_buffer_info_tempo_default(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            info = s.buffer_info(buf.buffer_id)
-            assert info.tempo == 0.0
+    def test_create_buffer(self, s):
+        buf = s.create_buffer(channels=2, length=44100, sample_rate=44100.0, name="test")
+        assert isinstance(buf, Buffer)
+        assert buf.buffer_id >= 1
+
+    def test_buffer_metadata(self, s):
+        buf = s.create_buffer(channels=2, length=44100, sample_rate=44100.0, name="kick")
+        assert buf.num_channels == 2
+        assert buf.length == 44100
+        assert buf.sample_rate == 44100.0
+        assert buf.name == "kick"
+        assert abs(buf.length_seconds - 1.0) < 1e-6
+
+    def test_buffer_info_property(self, s):
+        buf = s.create_buffer(channels=2, length=44100, sample_rate=44100.0, name="kick")
+        info = buf.info
+        assert info == s.buffer_info(buf.buffer_id)
+        assert (info.num_channels, info.length, info.name) == (2, 44100, "kick")
+
+    def test_buffer_count(self, s):
+        assert s.buffer_count == 0
+        s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        assert s.buffer_count == 1
+        s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        assert s.buffer_count == 2
+
+    def test_buffer_write_and_read(self, s):
+        buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        data = [float(i) / 100.0 for i in range(100)]
+        written = buf.write(channel=0, data=data)
+        assert written == 100
+
+        samples = buf.read(channel=0, num_samples=10)
+        assert samples == pytest.approx(data[:10], abs=1e-6)
+
+    def test_buffer_view_is_zero_copy(self, s):
+        buf = s.create_buffer(channels=2, length=100, sample_rate=44100.0)
+        buf.write(channel=1, data=[0.25] * 100)
+        view = buf.view(1)
+        assert len(view) == 100
+        assert view[0] == 0.25
+        view[3] = 0.5
+        assert buf.read(channel=1, offset=3, num_samples=1) == [0.5]
+
+    def test_buffer_view_defers_remove(self, s):
+        buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        view = buf.view(0)
+        part = view[10:20]
+        view.release()
+        # The slice still aliases the samples, so removal waits for it.
+        assert buf.remove()
+        assert s.buffer_count == 1
+        part[0] = 0.5
+        assert buf.read(channel=0, offset=10, num_samples=1) == [0.5]
+        part.release()
+        assert s.buffer_count == 0
+
+    def test_buffer_view_defers_engine_destroy(self, monkeypatch):
+        import squeeze.squeeze as sq_mod
+        destroyed = []
+        destroy = sq_mod.lib.sq_engine_destroy
+        monkeypatch.setattr(sq_mod.lib, "sq_engine_destroy",
+                            lambda p: (destroyed.append(p), destroy(p)))
+        s = Squeeze(44100.0, 512, plugins=False)
+        view = s.create_buffer(channels=1, length=8, sample_rate=44100.0).view(0)
+        s.close()
+        s.close()
+        assert destroyed == []
+        view[7] = 0.5
+        assert view[7] == 0.5
+        del view
+        assert len(destroyed) == 1
+
+    def test_exception_in_with_block_survives_live_view(self):
+        with pytest.raises(RuntimeError, match="boom"):
+            with Squeeze(44100.0, 512, plugins=False) as s:
+                view = s.create_buffer(
+                    channels=1, length=8, sample_rate=44100.0).view(0)
+                raise RuntimeError("boom")
+        assert view[0] == 0.0
+
+    def test_buffer_view_keeps_engine_alive(self):
+        import gc
+        view = Squeeze(44100.0, 512, plugins=False).create_buffer(
+            channels=1, length=8, sample_rate=44100.0).view(0)
+        gc.collect()
+        view[7] = 0.5
+        assert view[7] == 0.5
+
+    def test_buffer_view_unknown_channel_is_empty(self, s):
+        buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        assert len(buf.view(5)) == 0
+
+    def test_buffer_read_default_all(self, s):
+        buf = s.create_buffer(channels=1, length=50, sample_rate=44100.0)
+        buf.write(channel=0, data=array.array("f", [0.5] * 50))
+        samples = buf.read(channel=0)
+        assert len(samples) == 50
+
+    def test_buffer_read_with_offset(self, s):
+        buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        buf.write(channel=0, data=array.array("f", range(100)))
+        samples = buf.read(channel=0, offset=90, num_samples=10)
+        assert samples == pytest.approx([float(i) for i in range(90, 100)], abs=1e-4)
+
+    def test_buffer_write_converts_non_float32_buffers(self, s):
+        buf = s.create_buffer(channels=1, length=4, sample_rate=44100.0)
+        assert buf.write(channel=0, data=array.array("d", [0.5] * 4)) == 4
+        assert buf.read(channel=0) == [0.5] * 4
+
+    def test_buffer_write_all_fills_every_channel(self, s):
+        buf = s.create_buffer(channels=2, length=4, sample_rate=44100.0)
+        assert buf.write_all([[0.25] * 4, array.array("d", [0.5] * 4)], offset=1) == 3
+        assert buf.read(channel=0) == [0.0, 0.25, 0.25, 0.25]
+        assert buf.read(channel=1) == [0.0, 0.5, 0.5, 0.5]
+        with pytest.raises(ValueError):
+            buf.write_all([[0.25] * 4, [0.5] * 3])
+
+    def test_buffer_write_position(self, s):
+        buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        assert buf.write_position == 0
+        buf.write_position = 50
+        assert buf.write_position == 50
+
+    def test_buffer_clear(self, s):
+        buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        buf.write(channel=0, data=[1.0] * 100)
+        buf.write_position = 100
+        buf.clear()
+        assert buf.write_position == 0
+        samples = buf.read(channel=0, num_samples=1)
+        assert abs(samples[0]) < 1e-6
+
+    def test_buffer_remove(self, s):
+        buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        assert s.buffer_count == 1
+        assert buf.remove()
+        assert s.buffer_count == 0
+
+    def test_buffer_repr(self, s):
+        buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0, name="sine")
+        assert "sine" in repr(buf)
+
+    def test_buffer_equality(self, s):
+        buf1 = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        buf2 = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        assert buf1 != buf2
+        assert buf1 == Buffer(s, buf1.buffer_id)
+
+    def test_buffer_tempo_default_set_and_reset(self, s):
+        buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        assert buf.tempo == 0.0
+        for bpm in (120.0, 98.5, 0.0):  # 0.0 resets to "unknown"
+            buf.tempo = bpm
+            assert buf.tempo == bpm
+
+    def test_buffer_info_includes_tempo(self, s):
+        buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        buf.tempo = 128.0
+        info = s.buffer_info(buf.buffer_id)
+        assert info.tempo == 128.0
+
+    def test_buffer_info_tempo_default(self, s):
+        buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
+        info = s.buffer_info(buf.buffer_id)
+        assert info.tempo == 0.0
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -925,49 +1564,72 @@ class TestBuffer:
 # ═══════════════════════════════════════════════════════════════════
 
 class TestBufferLibrary:
-    def test_load_buffer_nonexistent_raises(self):
-        with Squeeze(plugins=False) as s:
-            with pytest.raises(SqueezeError):
-                s.load_buffer("/nonexistent/file.wav")
-
-    def test_buffer_info_metadata(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=2, length=44100, sample_rate=44100.0, name="kick")
-            info = s.buffer_info(buf.buffer_id)
-            assert isinstance(info, BufferInfo)
-            assert info.buffer_id == buf.buffer_id
-            assert info.num_channels == 2
-            assert info.length == 44100
-            assert info.sample_rate == 44100.0
-            assert info.name == "kick"
-            assert abs(info.length_seconds - 1.0) < 1e-6
-
-    def test_buffer_info_unknown_id(self):
-        with Squeeze(plugins=False) as s:
-            info = s.buffer_info(999)
-            assert info.buffer_id == 0
-            assert info.num_channels == 0
-
-    def test_buffers_sorted(self):
-        with Squeeze(plugins=False) as s:
-            b1 = s.create_buffer(channels=1, length=100, sample_rate=44100.0, name="c")
-            b2 = s.create_buffer(channels=1, length=100, sample_rate=44100.0, name="a")
-            b3 = s.create_buffer(channels=1, length=100, sample_rate=44100.0, name="b")
-            bufs = s.buffers
-            assert len(bufs) == 3
-            assert bufs[0] == (b1.buffer_id, "c")
-            assert bufs[1] == (b2.buffer_id, "a")
-            assert bufs[2] == (b3.buffer_id, "b")
-            # Verify sorted by ID
-            assert bufs[0][0] < bufs[1][0] < bufs[2][0]
-
-    def test_buffers_empty(self):
-        with Squeeze(plugins=False) as s:
-            assert s.buffers == []
-
-    def test_buffer_info_exported(self):
-        """BufferInfo is importable from squeeze package."""
-        assert BufferInfo is not None
+    def test_load_buffer_nonexistent_raises(self, s):
+        with pytest.raises(SqueezeError):
+            s.load_buffer("/nonexistent/file.wav")
+
+    def test_error_cleared_between_calls(self, s):
+        with pytest.raises(SqueezeError, match="file.wav"):
+            s.load_buffer("/nonexistent/file.wav")
+        # The shared error slot is reset, so a stale message never leaks
+        # into the next call's error or a later success.
+        with pytest.raises(SqueezeError, match="other.wav"):
+            s.load_buffer("/nonexistent/other.wav")
+        assert s.create_buffer(channels=1, length=8, sample_rate=44100.0)
+
+    def test_load_buffer_many(self, s, tmp_path):
+        import wave
+        paths = []
+        for name in ("kick", "snare"):
+            path = tmp_path / f"{name}.wav"
+            with wave.open(str(path), "wb") as w:
+                w.setnchannels(1)
+                w.setsampwidth(2)
+                w.setframerate(44100)
+                w.writeframes(b"\x00\x00" * 100)
+            paths.append(str(path))
+        ids = s.load_buffer_many(paths)
+        assert len(ids) == 2
+        assert [s.buffer_info(i).name for i in ids] == ["kick", "snare"]
+
+    def test_load_buffer_many_empty(self, s):
+        assert s.load_buffer_many([]) == []
+
+    def test_load_buffer_many_nonexistent_raises(self, s):
+        with pytest.raises(SqueezeError):
+            s.load_buffer_many(["/nonexistent/file.wav"])
+
+    def test_buffer_info_metadata(self, s):
+        buf = s.create_buffer(channels=2, length=44100, sample_rate=44100.0, name="kick")
+        info = s.buffer_info(buf.buffer_id)
+        assert isinstance(info, BufferInfo)
+        assert info.buffer_id == buf.buffer_id
+        assert info.num_channels == 2
+        assert info.length == 44100
+        assert info.sample_rate == 44100.0
+        assert info.name == "kick"
+        assert abs(info.length_seconds - 1.0) < 1e-6
+        assert not hasattr(info, "__dict__")
+
+    def test_buffer_info_unknown_id(self, s):
+        info = s.buffer_info(999)
+        assert info.buffer_id == 0
+        assert info.num_channels == 0
+
+    def test_buffers_sorted(self, s):
+        b1 = s.create_buffer(channels=1, length=100, sample_rate=44100.0, name="c")
+        b2 = s.create_buffer(channels=1, length=100, sample_rate=44100.0, name="a")
+        b3 = s.create_buffer(channels=1, length=100, sample_rate=44100.0, name="b")
+        bufs = s.buffers
+        assert len(bufs) == 3
+        assert bufs[0] == (b1.buffer_id, "c")
+        assert bufs[1] == (b2.buffer_id, "a")
+        assert bufs[2] == (b3.buffer_id, "b")
+        # Verify sorted by ID
+        assert bufs[0][0] < bufs[1][0] < bufs[2][0]
+
+    def test_buffers_empty(self, s):
+        assert s.buffers == []
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -975,96 +1637,60 @@ class TestBufferLibrary:
 # ═══════════════════════════════════════════════════════════════════
 
 class TestPlayerProcessor:
-    def test_add_source_player(self):
-        with Squeeze(plugins=False) as s:
-            src = s.add_source("player1", player=True)
-            assert isinstance(src, Source)
-            assert src.name == "player1"
-
-    def test_player_has_9_params(self):
-        with Squeeze(plugins=False) as s:
-            src = s.add_source("p", player=True)
-            descs = src.generator.param_descriptors
-            assert len(descs) == 9
-
-    def test_player_set_buffer(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=1000, sample_rate=44100.0)
-            src = s.add_source("p", player=True)
-            assert src.set_buffer(buf.buffer_id)
-
-    def test_player_set_buffer_invalid_id(self):
-        with Squeeze(plugins=False) as s:
-            src = s.add_source("p", player=True)
-            assert not src.set_buffer(999)
-
-    def test_player_set_buffer_non_player(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=100, sample_rate=44100.0)
-            src = s.add_source("gain")
-            assert not src.set_buffer(buf.buffer_id)
-
-    def test_player_playback(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=2, length=44100, sample_rate=44100.0)
-            buf.write(channel=0, data=[0.5] * 44100)
-            buf.write(channel=1, data=[0.5] * 44100)
-
-            src = s.add_source("p", player=True)
-            src.set_buffer(buf.buffer_id)
-            src.route_to(s.master)
-            src["fade_ms"] = 0.0
-            src["playing"] = 1.0
-            s.render(512)
+    def test_add_source_player(self, s):
+        src = s.add_source("player1", player=True)
+        assert isinstance(src, Source)
+        assert src.name == "player1"
+
+    def test_player_has_9_params(self, s):
+        src = s.add_source("p", player=True)
+        descs = src.generator.param_descriptors
+        assert len(descs) == 9
+
+    def test_player_set_buffer(self, s):
+        buf = s.create_buffer(channels=1, length=1000, sample_rate=44100.0)
+        player = s.add_source("p", player=True)
+        assert player.set_buffer(buf.buffer_id)
+        assert not player.set_buffer(999)  # unknown buffer id
+        assert not s.add_source("gain").set_buffer(buf.buffer_id)  # not a player
+
+    def test_player_playback_and_auto_stop(self, s):
+        # Two blocks long: the one rendered block never reaches the end.
+        long_buf = s.create_buffer(channels=2, length=1024, sample_rate=44100.0)
+        half = array.array("f", [0.5]) * 1024  # float32, handed over without conversion
+        long_buf.write_all([half, half])
+        # Shorter than one block: a one-shot player stops within the render.
+        short_buf = s.create_buffer(channels=1, length=32, sample_rate=44100.0)
+        short_buf.write(channel=0, data=array.array("f", [0.3]) * 32)
 
-    def test_player_param_shortcuts(self):
-        with Squeeze(plugins=False) as s:
-            src = s.add_source("p", player=True)
-            src["speed"] = 2.0
-            assert src["speed"] == 2.0
-            src["loop_mode"] = 1.0
-            assert src["loop_mode"] == 1.0
-
-    def test_player_auto_stop(self):
-        with Squeeze(plugins=False) as s:
-            buf = s.create_buffer(channels=1, length=32, sample_rate=44100.0)
-            buf.write(channel=0, data=[0.3] * 32)
-            src = s.add_source("p", player=True)
+        with s.batch():
+            playing = s.add_source("playing", player=True)
+            oneshot = s.add_source("oneshot", player=True)
+        for src, buf in ((playing, long_buf), (oneshot, short_buf)):
             src.set_buffer(buf.buffer_id)
             src.route_to(s.master)
             src["fade_ms"] = 0.0
             src["loop_mode"] = 0.0
             src["playing"] = 1.0
-            s.render(512)
-            assert src["playing"] < 0.5
-
-    def test_player_tempo_lock_default(self):
-        with Squeeze(plugins=False) as s:
-            src = s.add_source("p", player=True)
-            assert src["tempo_lock"] == 0.0
-
-    def test_player_tempo_lock_set_get(self):
-        with Squeeze(plugins=False) as s:
-            src = s.add_source("p", player=True)
-            src["tempo_lock"] = 1.0
-            assert src["tempo_lock"] == 1.0
-
-    def test_player_transpose_default(self):
-        with Squeeze(plugins=False) as s:
-            src = s.add_source("p", player=True)
-            assert src["transpose"] == 0.0
-
-    def test_player_transpose_set_get(self):
-        with Squeeze(plugins=False) as s:
-            src = s.add_source("p", player=True)
-            src["transpose"] = 7.0
-            assert src["transpose"] == 7.0
-
-    def test_player_param_descriptors_count(self):
-        with Squeeze(plugins=False) as s:
-            src = s.add_source("p", player=True)
-            descs = src.generator.param_descriptors
-            assert len(descs) == 9
-            names = [d.name for d in descs]
-            assert "tempo_lock" in names
-            assert "transpose" in names
+        s.render(512)
+
+        assert playing["playing"] >= 0.5
+        assert oneshot["playing"] < 0.5
+
+    @pytest.mark.parametrize("param,default,new", [
+        ("speed", 1.0, 2.0), ("loop_mode", 0.0, 1.0),
+        ("tempo_lock", 0.0, 1.0), ("transpose", 0.0, 7.0),
+    ])
+    def test_player_param_shortcuts(self, s, param, default, new):
+        src = s.add_source("p", player=True)
+        assert src[param] == pytest.approx(default)
+        src[param] = new
+        assert src[param] == pytest.approx(new)
+
+    def test_player_param_descriptors_count(self, s):
+        src = s.add_source("p", player=True)
+        descs = src.generator.param_descriptors
+        assert len(descs) == 9
+        names = [d.name for d in descs]
+        assert "tempo_lock" in names
+        assert "transpose" in names
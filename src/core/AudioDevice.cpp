@@ -29,16 +29,36 @@ bool AudioDevice::start(double sampleRate, int blockSize, std::string& error)
         stop();
     }
 
-    juce::AudioDeviceManager::AudioDeviceSetup setup;
-    setup.sampleRate = sampleRate;
-    setup.bufferSize = blockSize;
+    if (initialised_)
+    {
+        // Device types were created and scanned on the first start (JUCE
+        // rescans by itself when the device list changes), so a restart
+        // only reopens the previous device at the requested settings.
+        auto current = deviceManager_.getAudioDeviceSetup();
+        current.sampleRate = sampleRate;
+        current.bufferSize = blockSize;
+        auto err = deviceManager_.setAudioDeviceSetup(current, true);
+        if (err.isNotEmpty() || deviceManager_.getCurrentAudioDevice() == nullptr)
+        {
+            SQ_INFO("AudioDevice::start: reopen failed, re-initialising");
+            initialised_ = false;
+        }
+    }
 
-    auto err = deviceManager_.initialise(0, 2, nullptr, true, {}, &setup);
-    if (err.isNotEmpty())
+    if (!initialised_)
     {
-        error = err.toStdString();
-        SQ_WARN("AudioDevice::start: initialise failed: %s", error.c_str());
-        return false;
+        juce::AudioDeviceManager::AudioDeviceSetup setup;
+        setup.sampleRate = sampleRate;
+        setup.bufferSize = blockSize;
+
+        auto err = deviceManager_.initialise(0, 2, nullptr, true, {}, &setup);
+        if (err.isNotEmpty())
+        {
+            error = err.toStdString();
+            SQ_WARN("AudioDevice::start: initialise failed: %s", error.c_str());
+            return false;
+        }
+        initialised_ = true;
     }
 
     deviceManager_.addAudioCallback(this);
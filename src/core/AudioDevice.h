@@ -40,6 +40,7 @@ private:
     Engine& engine_;
     juce::AudioDeviceManager deviceManager_;
     std::atomic<bool> running_{false};
+    bool initialised_ = false;  // deviceManager_ has created and scanned device types
     double sampleRate_ = 0.0;
     int blockSize_ = 0;
 };
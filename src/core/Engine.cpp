@@ -42,6 +42,7 @@ Engine::Engine(double sampleRate, int blockSize)
     master->setHandle(assignHandle());
     master->prepare(sampleRate_, blockSize_);
     master_ = master.get();
+    busRegistry_[master_->getHandle()] = master_;
     buses_.push_back(std::move(master));
 
     transport_.prepare(sampleRate_, blockSize_);
@@ -148,6 +149,7 @@ Source* Engine::addSource(const std::string& name, std::unique_ptr<Processor> ge
     src->routeTo(master_);
 
     Source* raw = src.get();
+    sourceRegistry_[raw->getHandle()] = raw;
     sources_.push_back(std::move(src));
 
     SQ_DEBUG("Engine::addSource: name=%s handle=%d genHandle=%d",
@@ -189,6 +191,7 @@ bool Engine::removeSource(Source* src)
     // Defer deletion — audio thread may still reference this Source
     auto removed = std::move(*it);
     sources_.erase(it);
+    sourceRegistry_.erase(src->getHandle());
     deferDelete(GarbageItem::wrap(removed.release()));
 
     maybeRebuildSnapshot();
@@ -198,9 +201,8 @@ bool Engine::removeSource(Source* src)
 Source* Engine::getSource(int handle) const
 {
     std::lock_guard<std::mutex> lock(controlMutex_);
-    for (const auto& s : sources_)
-        if (s->getHandle() == handle) return s.get();
-    return nullptr;
+    auto it = sourceRegistry_.find(handle);
+    return it == sourceRegistry_.end() ? nullptr : it->second;
 }
 
 std::vector<Source*> Engine::getSources() const
@@ -234,6 +236,7 @@ Bus* Engine::addBus(const std::string& name)
     bus->routeTo(master_);
 
     Bus* raw = bus.get();
+    busRegistry_[raw->getHandle()] = raw;
     buses_.push_back(std::move(bus));
 
     SQ_DEBUG("Engine::addBus: name=%s handle=%d", name.c_str(), raw->getHandle());
@@ -286,6 +289,7 @@ bool Engine::removeBus(Bus* bus)
     // Defer deletion — audio thread may still reference this Bus
     auto removed = std::move(*it);
     buses_.erase(it);
+    busRegistry_.erase(bus->getHandle());
     deferDelete(GarbageItem::wrap(removed.release()));
 
     maybeRebuildSnapshot();
@@ -295,9 +299,8 @@ bool Engine::removeBus(Bus* bus)
 Bus* Engine::getBus(int handle) const
 {
     std::lock_guard<std::mutex> lock(controlMutex_);
-    for (const auto& b : buses_)
-        if (b->getHandle() == handle) return b.get();
-    return nullptr;
+    auto it = busRegistry_.find(handle);
+    return it == busRegistry_.end() ? nullptr : it->second;
 }
 
 std::vector<Bus*> Engine::getBuses() const
@@ -578,6 +581,23 @@ int Engine::sourceChainSize(Source* src) const
     return src->getChain().size();
 }
 
+// Copies up to `capacity` processor handles; returns the full chain size.
+static int copyChainHandles(const Chain& chain, int* out, int capacity)
+{
+    int total = chain.size();
+    int n = (out && capacity > 0) ? std::min(total, capacity) : 0;
+    for (int i = 0; i < n; ++i)
+        out[i] = chain.at(i)->getHandle();
+    return total;
+}
+
+int Engine::sourceChainHandles(Source* src, int* out, int capacity) const
+{
+    std::lock_guard<std::mutex> lock(controlMutex_);
+    if (!src) return 0;
+    return copyChainHandles(src->getChain(), out, capacity);
+}
+
 Processor* Engine::busAppend(Bus* bus, std::unique_ptr<Processor> p)
 {
     std::lock_guard<std::mutex> lock(controlMutex_);
@@ -640,6 +660,13 @@ int Engine::busChainSize(Bus* bus) const
     return bus->getChain().size();
 }
 
+int Engine::busChainHandles(Bus* bus, int* out, int capacity) const
+{
+    std::lock_guard<std::mutex> lock(controlMutex_);
+    if (!bus) return 0;
+    return copyChainHandles(bus->getChain(), out, capacity);
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // Parameters
 // ═══════════════════════════════════════════════════════════════════
@@ -662,6 +689,33 @@ bool Engine::setParameter(int procHandle, const std::string& name, float value)
     return true;
 }
 
+int Engine::setParameters(int procHandle, const char* const* names, const float* values, int count)
+{
+    if (!names || !values || count <= 0) return 0;
+
+    // One lock and one registry lookup for the whole sweep.
+    std::lock_guard<std::mutex> lock(controlMutex_);
+    auto it = processorRegistry_.find(procHandle);
+    if (it == processorRegistry_.end()) return 0;
+    SQ_DEBUG("Engine::setParameters: proc=%d count=%d", procHandle, count);
+    for (int i = 0; i < count; ++i)
+        it->second->setParameter(names[i] ? names[i] : "", values[i]);
+    return count;
+}
+
+int Engine::getParameters(int procHandle, const char* const* names, float* outValues, int count) const
+{
+    if (!names || !outValues || count <= 0) return 0;
+
+    // One lock and one registry lookup for the whole read.
+    std::lock_guard<std::mutex> lock(controlMutex_);
+    auto it = processorRegistry_.find(procHandle);
+    if (it == processorRegistry_.end()) return 0;
+    for (int i = 0; i < count; ++i)
+        outValues[i] = it->second->getParameter(names[i] ? names[i] : "");
+    return count;
+}
+
 std::string Engine::getParameterText(int procHandle, const std::string& name) const
 {
     std::lock_guard<std::mutex> lock(controlMutex_);
@@ -718,6 +772,12 @@ void Engine::batchCommit()
     }
 }
 
+bool Engine::isBatching() const
+{
+    std::lock_guard<std::mutex> lock(controlMutex_);
+    return batching_;
+}
+
 void Engine::maybeRebuildSnapshot()
 {
     if (batching_)
@@ -1024,6 +1084,21 @@ bool Engine::scheduleParamChange(int procHandle, double beatTime,
     return eventScheduler_.schedule(ev);
 }
 
+int Engine::scheduleEvents(const ScheduledEvent* events, int count)
+{
+    std::lock_guard<std::mutex> lock(controlMutex_);
+    SQ_DEBUG("Engine::scheduleEvents: count=%d", count);
+    int queued = 0;
+    for (; queued < count; ++queued)
+    {
+        if (!eventScheduler_.schedule(events[queued]))
+            break;
+    }
+    if (queued < count)
+        SQ_WARN("Engine::scheduleEvents: queued %d of %d events", queued, count);
+    return queued;
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // MixerSnapshot — build and swap
 // ═══════════════════════════════════════════════════════════════════
@@ -1625,19 +1700,27 @@ PerfMonitor& Engine::getPerfMonitor()
 
 void Engine::render(int numSamples)
 {
-    std::lock_guard<std::mutex> lock(controlMutex_);
+    renderBlocks(numSamples, 1);
+}
 
-    // Drain commands synchronously
-    commandQueue_.processPending([this](const Command& cmd) { handleCommand(cmd); });
+void Engine::renderBlocks(int numSamples, int numBlocks)
+{
+    std::lock_guard<std::mutex> lock(controlMutex_);
 
     juce::AudioBuffer<float> outputBuffer(2, numSamples);
-    outputBuffer.clear();
-
     float* channels[2] = {outputBuffer.getWritePointer(0),
                           outputBuffer.getWritePointer(1)};
-    processBlock(channels, 2, numSamples);
 
-    SQ_TRACE("Engine::render: %d samples", numSamples);
+    for (int i = 0; i < numBlocks; ++i)
+    {
+        // Drain commands synchronously
+        commandQueue_.processPending([this](const Command& cmd) { handleCommand(cmd); });
+
+        outputBuffer.clear();
+        processBlock(channels, 2, numSamples);
+    }
+
+    SQ_TRACE("Engine::renderBlocks: %d x %d samples", numBlocks, numSamples);
 }
 
 } // namespace squeeze
@@ -95,15 +95,19 @@ public:
     Processor* sourceInsert(Source* src, int index, std::unique_ptr<Processor> p);
     void sourceRemove(Source* src, int index);
     int sourceChainSize(Source* src) const;
+    int sourceChainHandles(Source* src, int* out, int capacity) const;
 
     Processor* busAppend(Bus* bus, std::unique_ptr<Processor> p);
     Processor* busInsert(Bus* bus, int index, std::unique_ptr<Processor> p);
     void busRemove(Bus* bus, int index);
     int busChainSize(Bus* bus) const;
+    int busChainHandles(Bus* bus, int* out, int capacity) const;
 
     // --- Parameters (control thread, by processor handle) ---
     float getParameter(int procHandle, const std::string& name) const;
     bool setParameter(int procHandle, const std::string& name, float value);
+    int setParameters(int procHandle, const char* const* names, const float* values, int count);
+    int getParameters(int procHandle, const char* const* names, float* outValues, int count) const;
     std::string getParameterText(int procHandle, const std::string& name) const;
     std::vector<ParamDescriptor> getParameterDescriptors(int procHandle) const;
 
@@ -117,6 +121,7 @@ public:
     // --- Batching (control thread) ---
     void batchBegin();
     void batchCommit();
+    bool isBatching() const;
 
     // --- Transport forwarding (control thread) ---
     void transportPlay();
@@ -146,6 +151,7 @@ public:
     bool scheduleCC(int sourceHandle, double beatTime, int channel, int ccNum, int ccVal);
     bool schedulePitchBend(int sourceHandle, double beatTime, int channel, int value);
     bool scheduleParamChange(int procHandle, double beatTime, const std::string& paramName, float value);
+    int scheduleEvents(const ScheduledEvent* events, int count);
 
     // --- Audio processing (audio thread) ---
     void processBlock(float* const* outputChannels, int numChannels, int numSamples);
@@ -156,6 +162,8 @@ public:
 
     // --- Testing ---
     void render(int numSamples);
+    // Same as numBlocks render() calls, under one lock with one buffer.
+    void renderBlocks(int numSamples, int numBlocks);
 
 private:
     mutable std::mutex controlMutex_;
@@ -166,6 +174,10 @@ private:
 
     int nextHandle_ = 1;
     std::unordered_map<int, Processor*> processorRegistry_;
+    // Handle -> node, kept in step with sources_/buses_ so lookups by
+    // handle (every sq_source_*/sq_bus_* call) don't scan the vectors.
+    std::unordered_map<int, Source*> sourceRegistry_;
+    std::unordered_map<int, Bus*> busRegistry_;
 
     MixerSnapshot* activeSnapshot_ = nullptr;
 
@@ -8,6 +8,10 @@ namespace squeeze {
 
 MidiDeviceManager::MidiDeviceManager(MidiRouter& router)
     : router_(router)
+    , deviceListConnection_(juce::MidiDeviceListConnection::make([this] {
+          devicesVersion_.fetch_add(1, std::memory_order_relaxed);
+          SQ_DEBUG("MidiDeviceManager: device list changed");
+      }))
 {
     SQ_INFO("MidiDeviceManager: created");
 }
@@ -22,18 +26,37 @@ MidiDeviceManager::~MidiDeviceManager()
 // Control thread
 // ═══════════════════════════════════════════════════════════════════
 
-std::vector<std::string> MidiDeviceManager::getAvailableDevices() const
+std::vector<std::string> MidiDeviceManager::enumerateDevices()
 {
     auto devices = juce::MidiInput::getAvailableDevices();
     std::vector<std::string> names;
     names.reserve(static_cast<size_t>(devices.size()));
     for (const auto& d : devices)
         names.push_back(d.name.toStdString());
-    SQ_DEBUG("MidiDeviceManager::getAvailableDevices: %d devices",
-             static_cast<int>(names.size()));
     return names;
 }
 
+std::vector<std::string> MidiDeviceManager::getAvailableDevices() const
+{
+    const bool prefetched = prefetch_.valid();
+    auto names = prefetched ? prefetch_.get() : enumerateDevices();
+    SQ_DEBUG("MidiDeviceManager::getAvailableDevices: %d devices%s",
+             static_cast<int>(names.size()), prefetched ? " (prefetched)" : "");
+    return names;
+}
+
+void MidiDeviceManager::prefetchAvailableDevices()
+{
+    if (prefetch_.valid()) return;
+    SQ_DEBUG("MidiDeviceManager::prefetchAvailableDevices");
+    prefetch_ = std::async(std::launch::async, &MidiDeviceManager::enumerateDevices);
+}
+
+uint64_t MidiDeviceManager::getDevicesVersion() const
+{
+    return devicesVersion_.load(std::memory_order_relaxed);
+}
+
 bool MidiDeviceManager::openDevice(const std::string& name, std::string& error)
 {
     SQ_DEBUG("MidiDeviceManager::openDevice: %s", name.c_str());
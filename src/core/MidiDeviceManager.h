@@ -4,6 +4,9 @@
 
 #include <juce_audio_devices/juce_audio_devices.h>
 
+#include <atomic>
+#include <cstdint>
+#include <future>
 #include <memory>
 #include <string>
 #include <vector>
@@ -21,6 +24,13 @@ public:
 
     // --- Control thread ---
     std::vector<std::string> getAvailableDevices() const;
+    // Start enumerating devices on a background thread; the next
+    // getAvailableDevices() call takes that result (waiting if needed)
+    // instead of enumerating itself. No-op if a prefetch is pending.
+    void prefetchAvailableDevices();
+    // Bumped whenever the OS reports MIDI devices added or removed
+    // (delivered on the message thread). Any thread may read it.
+    uint64_t getDevicesVersion() const;
     bool openDevice(const std::string& name, std::string& error);
     void closeDevice(const std::string& name);
     bool isDeviceOpen(const std::string& name) const;
@@ -38,6 +48,15 @@ private:
         std::string name;
     };
     std::vector<OpenDevice> openDevices_;
+
+    // Pending background enumeration, consumed by getAvailableDevices().
+    // Its destructor waits for the task, which touches no member state.
+    mutable std::future<std::vector<std::string>> prefetch_;
+    static std::vector<std::string> enumerateDevices();
+
+    std::atomic<uint64_t> devicesVersion_{0};
+    // Declared last so it disconnects before devicesVersion_ goes away.
+    juce::MidiDeviceListConnection deviceListConnection_;
 };
 
 } // namespace squeeze
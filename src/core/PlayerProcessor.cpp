@@ -19,6 +19,21 @@ const ParamDescriptor PlayerProcessor::kDescriptors[kParamCount] = {
     {"transpose",  0.0f, -24.0f, 24.0f, 0, true, false, "st", "Playback"},
 };
 
+// Built at static init from kDescriptors (defined above in this file), so
+// no lookup ever allocates on the audio thread.
+const std::unordered_map<std::string, int> PlayerProcessor::kParamIndex = [] {
+    std::unordered_map<std::string, int> index;
+    for (int i = 0; i < kParamCount; ++i)
+        index.emplace(kDescriptors[i].name, i);
+    return index;
+}();
+
+int PlayerProcessor::paramIndex(const std::string& name)
+{
+    auto it = kParamIndex.find(name);
+    return it == kParamIndex.end() ? -1 : it->second;
+}
+
 PlayerProcessor::PlayerProcessor()
     : Processor("Player")
 {
@@ -216,64 +231,63 @@ std::vector<ParamDescriptor> PlayerProcessor::getParameterDescriptors() const
 
 float PlayerProcessor::getParameter(const std::string& name) const
 {
-    if (name == "playing")    return playing_;
-    if (name == "position")
+    switch (paramIndex(name))
     {
-        const Buffer* buf = buffer_.load(std::memory_order_acquire);
-        return static_cast<float>(cursor_.getPosition(buf));
+        case kPlaying:   return playing_;
+        case kPosition:
+        {
+            const Buffer* buf = buffer_.load(std::memory_order_acquire);
+            return static_cast<float>(cursor_.getPosition(buf));
+        }
+        case kSpeed:     return speed_;
+        case kLoopMode:  return loopMode_;
+        case kLoopStart: return loopStart_;
+        case kLoopEnd:   return loopEnd_;
+        case kFadeMs:    return fadeMs_;
+        case kTempoLock: return tempoLock_;
+        case kTranspose: return transpose_;
+        default:         return 0.0f;
     }
-    if (name == "speed")      return speed_;
-    if (name == "loop_mode")  return loopMode_;
-    if (name == "loop_start") return loopStart_;
-    if (name == "loop_end")   return loopEnd_;
-    if (name == "fade_ms")    return fadeMs_;
-    if (name == "tempo_lock") return tempoLock_;
-    if (name == "transpose")  return transpose_;
-    return 0.0f;
 }
 
 void PlayerProcessor::setParameter(const std::string& name, float value)
 {
-    if (name == "playing")
-    {
-        playing_ = value >= 0.5f ? 1.0f : 0.0f;
-        SQ_DEBUG("PlayerProcessor::setParameter: playing=%.0f", static_cast<double>(playing_));
-    }
-    else if (name == "position")
-    {
-        value = std::max(0.0f, std::min(1.0f, value));
-        seekTarget_.store(value, std::memory_order_relaxed);
-        seekPending_.store(true, std::memory_order_release);
-        SQ_DEBUG("PlayerProcessor::setParameter: position=%.3f", static_cast<double>(value));
-    }
-    else if (name == "speed")
-    {
-        speed_ = std::max(-4.0f, std::min(4.0f, value));
-    }
-    else if (name == "loop_mode")
-    {
-        loopMode_ = std::max(0.0f, std::min(2.0f, std::round(value)));
-    }
-    else if (name == "loop_start")
-    {
-        loopStart_ = std::max(0.0f, std::min(1.0f, value));
-    }
-    else if (name == "loop_end")
-    {
-        loopEnd_ = std::max(0.0f, std::min(1.0f, value));
-    }
-    else if (name == "fade_ms")
-    {
-        fadeMs_ = std::max(0.0f, std::min(50.0f, value));
-    }
-    else if (name == "tempo_lock")
-    {
-        tempoLock_ = value >= 0.5f ? 1.0f : 0.0f;
-    }
-    else if (name == "transpose")
+    switch (paramIndex(name))
     {
-        transpose_ = std::max(-24.0f, std::min(24.0f, value));
-        transposeRatio_ = std::exp2(static_cast<double>(transpose_) / 12.0);
+        case kPlaying:
+            playing_ = value >= 0.5f ? 1.0f : 0.0f;
+            SQ_DEBUG("PlayerProcessor::setParameter: playing=%.0f", static_cast<double>(playing_));
+            break;
+        case kPosition:
+            value = std::max(0.0f, std::min(1.0f, value));
+            seekTarget_.store(value, std::memory_order_relaxed);
+            seekPending_.store(true, std::memory_order_release);
+            SQ_DEBUG("PlayerProcessor::setParameter: position=%.3f", static_cast<double>(value));
+            break;
+        case kSpeed:
+            speed_ = std::max(-4.0f, std::min(4.0f, value));
+            break;
+        case kLoopMode:
+            loopMode_ = std::max(0.0f, std::min(2.0f, std::round(value)));
+            break;
+        case kLoopStart:
+            loopStart_ = std::max(0.0f, std::min(1.0f, value));
+            break;
+        case kLoopEnd:
+            loopEnd_ = std::max(0.0f, std::min(1.0f, value));
+            break;
+        case kFadeMs:
+            fadeMs_ = std::max(0.0f, std::min(50.0f, value));
+            break;
+        case kTempoLock:
+            tempoLock_ = value >= 0.5f ? 1.0f : 0.0f;
+            break;
+        case kTranspose:
+            transpose_ = std::max(-24.0f, std::min(24.0f, value));
+            transposeRatio_ = std::exp2(static_cast<double>(transpose_) / 12.0);
+            break;
+        default:
+            break;
     }
 }
 
@@ -281,56 +295,44 @@ std::string PlayerProcessor::getParameterText(const std::string& name) const
 {
     char buf[64];
 
-    if (name == "playing")
-    {
-        return playing_ >= 0.5f ? "Playing" : "Stopped";
-    }
-    if (name == "position")
-    {
-        const Buffer* b = buffer_.load(std::memory_order_acquire);
-        float pos = static_cast<float>(cursor_.getPosition(b)) * 100.0f;
-        std::snprintf(buf, sizeof(buf), "%.1f%%", static_cast<double>(pos));
-        return buf;
-    }
-    if (name == "speed")
-    {
-        std::snprintf(buf, sizeof(buf), "%.1fx", static_cast<double>(speed_));
-        return buf;
-    }
-    if (name == "loop_mode")
-    {
-        if (loopMode_ >= 1.5f) return "Ping-pong";
-        if (loopMode_ >= 0.5f) return "Forward";
-        return "Off";
-    }
-    if (name == "loop_start")
-    {
-        std::snprintf(buf, sizeof(buf), "%.1f%%", static_cast<double>(loopStart_ * 100.0f));
-        return buf;
-    }
-    if (name == "loop_end")
-    {
-        std::snprintf(buf, sizeof(buf), "%.1f%%", static_cast<double>(loopEnd_ * 100.0f));
-        return buf;
-    }
-    if (name == "fade_ms")
-    {
-        std::snprintf(buf, sizeof(buf), "%.1f ms", static_cast<double>(fadeMs_));
-        return buf;
-    }
-    if (name == "tempo_lock")
+    switch (paramIndex(name))
     {
-        return tempoLock_ >= 0.5f ? "On" : "Off";
-    }
-    if (name == "transpose")
-    {
-        if (transpose_ > 0.0f)
-            std::snprintf(buf, sizeof(buf), "+%.1f st", static_cast<double>(transpose_));
-        else
-            std::snprintf(buf, sizeof(buf), "%.1f st", static_cast<double>(transpose_));
-        return buf;
+        case kPlaying:
+            return playing_ >= 0.5f ? "Playing" : "Stopped";
+        case kPosition:
+        {
+            const Buffer* b = buffer_.load(std::memory_order_acquire);
+            float pos = static_cast<float>(cursor_.getPosition(b)) * 100.0f;
+            std::snprintf(buf, sizeof(buf), "%.1f%%", static_cast<double>(pos));
+            return buf;
+        }
+        case kSpeed:
+            std::snprintf(buf, sizeof(buf), "%.1fx", static_cast<double>(speed_));
+            return buf;
+        case kLoopMode:
+            if (loopMode_ >= 1.5f) return "Ping-pong";
+            if (loopMode_ >= 0.5f) return "Forward";
+            return "Off";
+        case kLoopStart:
+            std::snprintf(buf, sizeof(buf), "%.1f%%", static_cast<double>(loopStart_ * 100.0f));
+            return buf;
+        case kLoopEnd:
+            std::snprintf(buf, sizeof(buf), "%.1f%%", static_cast<double>(loopEnd_ * 100.0f));
+            return buf;
+        case kFadeMs:
+            std::snprintf(buf, sizeof(buf), "%.1f ms", static_cast<double>(fadeMs_));
+            return buf;
+        case kTempoLock:
+            return tempoLock_ >= 0.5f ? "On" : "Off";
+        case kTranspose:
+            if (transpose_ > 0.0f)
+                std::snprintf(buf, sizeof(buf), "+%.1f st", static_cast<double>(transpose_));
+            else
+                std::snprintf(buf, sizeof(buf), "%.1f st", static_cast<double>(transpose_));
+            return buf;
+        default:
+            return "";
     }
-    return "";
 }
 
 int PlayerProcessor::getLatencySamples() const
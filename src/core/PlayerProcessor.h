@@ -5,6 +5,7 @@
 
 #include <atomic>
 #include <string>
+#include <unordered_map>
 #include <vector>
 
 namespace squeeze {
@@ -71,8 +72,16 @@ private:
 
     double fadeSamplesFromMs() const;
 
-    static constexpr int kParamCount = 9;
+    // Indices into kDescriptors; keep in the same order.
+    enum Param {
+        kPlaying, kPosition, kSpeed, kLoopMode, kLoopStart, kLoopEnd,
+        kFadeMs, kTempoLock, kTranspose, kParamCount
+    };
     static const ParamDescriptor kDescriptors[kParamCount];
+    // Parameter name -> Param, so each get/set is one hash lookup plus a
+    // switch rather than a chain of string compares.
+    static const std::unordered_map<std::string, int> kParamIndex;
+    static int paramIndex(const std::string& name);
 };
 
 } // namespace squeeze
@@ -3,9 +3,35 @@
 #include "core/PluginProcessor.h"
 
 #include <algorithm>
+#include <map>
+#include <mutex>
 
 namespace squeeze {
 
+namespace {
+
+// Parsed plugin caches shared by every PluginManager in the process, so
+// engines created one after another skip re-parsing an unchanged XML file.
+struct ParsedCache {
+    juce::int64 modified = 0;
+    juce::int64 size = 0;
+    std::vector<juce::PluginDescription> descriptions;
+};
+
+std::mutex& parsedCacheMutex()
+{
+    static std::mutex m;
+    return m;
+}
+
+std::map<std::string, ParsedCache>& parsedCaches()
+{
+    static std::map<std::string, ParsedCache> caches;
+    return caches;
+}
+
+} // namespace
+
 PluginManager::PluginManager()
 {
     formatManager_.addDefaultFormats();
@@ -36,6 +62,22 @@ bool PluginManager::loadCache(const std::string& xmlPath, std::string& error)
         return false;
     }
 
+    const auto key = file.getFullPathName().toStdString();
+    const auto modified = file.getLastModificationTime().toMilliseconds();
+    const auto size = file.getSize();
+    {
+        std::lock_guard<std::mutex> lock(parsedCacheMutex());
+        auto it = parsedCaches().find(key);
+        if (it != parsedCaches().end()
+            && it->second.modified == modified && it->second.size == size)
+        {
+            descriptions_ = it->second.descriptions;
+            SQ_DEBUG("PluginManager::loadCache: reused parsed cache (%d plugins)",
+                     static_cast<int>(descriptions_.size()));
+            return true;
+        }
+    }
+
     auto xmlString = file.loadFileAsString();
     if (xmlString.isEmpty())
     {
@@ -45,7 +87,12 @@ bool PluginManager::loadCache(const std::string& xmlPath, std::string& error)
         return false;
     }
 
-    return loadCacheFromString(xmlString.toStdString(), error);
+    if (!loadCacheFromString(xmlString.toStdString(), error))
+        return false;
+
+    std::lock_guard<std::mutex> lock(parsedCacheMutex());
+    parsedCaches()[key] = ParsedCache{modified, size, descriptions_};
+    return true;
 }
 
 bool PluginManager::loadCacheFromString(const std::string& xmlString, std::string& error)
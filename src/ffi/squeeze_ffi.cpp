@@ -18,6 +18,7 @@
 #include <mutex>
 #include <new>
 #include <unordered_map>
+#include <vector>
 
 // --- EngineHandle ---
 
@@ -113,6 +114,13 @@ void sq_free_param_descriptor_list(SqParamDescriptorList list)
     free(list.descriptors);
 }
 
+void sq_free_param_descriptor_block(SqParamDescriptorBlock block)
+{
+    free(block.strings);
+    free(block.floats);
+    free(block.ints);
+}
+
 void sq_free_midi_route_list(SqMidiRouteList list)
 {
     for (int i = 0; i < list.count; i++)
@@ -172,6 +180,26 @@ int sq_add_source(SqEngine engine, const char* name)
     return src->getHandle();
 }
 
+int sq_add_sources(SqEngine engine, int count, const char* const* names,
+                   int* out_handles)
+{
+    if (!engine || !names || !out_handles || count <= 0) return 0;
+    auto& e = eng(engine);
+    // Inside a caller's batch, leave the commit to it.
+    const bool ownBatch = !e.isBatching();
+    if (ownBatch) e.batchBegin();
+    int added = 0;
+    for (; added < count; ++added)
+    {
+        auto* src = e.addSource(names[added] ? names[added] : "",
+                                std::make_unique<squeeze::GainProcessor>());
+        if (!src) break;
+        out_handles[added] = src->getHandle();
+    }
+    if (ownBatch) e.batchCommit();
+    return added;
+}
+
 bool sq_remove_source(SqEngine engine, int source_handle)
 {
     auto* src = eng(engine).getSource(source_handle);
@@ -207,10 +235,12 @@ float sq_source_gain(SqEngine engine, int source_handle)
     return src->getGain();
 }
 
-void sq_source_set_gain(SqEngine engine, int source_handle, float gain)
+float sq_source_set_gain(SqEngine engine, int source_handle, float gain)
 {
     auto* src = eng(engine).getSource(source_handle);
-    if (src) src->setGain(gain);
+    if (!src) return 0.0f;
+    src->setGain(gain);
+    return src->getGain();
 }
 
 float sq_source_pan(SqEngine engine, int source_handle)
@@ -220,10 +250,12 @@ float sq_source_pan(SqEngine engine, int source_handle)
     return src->getPan();
 }
 
-void sq_source_set_pan(SqEngine engine, int source_handle, float pan)
+float sq_source_set_pan(SqEngine engine, int source_handle, float pan)
 {
     auto* src = eng(engine).getSource(source_handle);
-    if (src) src->setPan(pan);
+    if (!src) return 0.0f;
+    src->setPan(pan);
+    return src->getPan();
 }
 
 bool sq_source_bypassed(SqEngine engine, int source_handle)
@@ -309,10 +341,12 @@ float sq_bus_gain(SqEngine engine, int bus_handle)
     return bus->getGain();
 }
 
-void sq_bus_set_gain(SqEngine engine, int bus_handle, float gain)
+float sq_bus_set_gain(SqEngine engine, int bus_handle, float gain)
 {
     auto* bus = eng(engine).getBus(bus_handle);
-    if (bus) bus->setGain(gain);
+    if (!bus) return 0.0f;
+    bus->setGain(gain);
+    return bus->getGain();
 }
 
 float sq_bus_pan(SqEngine engine, int bus_handle)
@@ -322,10 +356,12 @@ float sq_bus_pan(SqEngine engine, int bus_handle)
     return bus->getPan();
 }
 
-void sq_bus_set_pan(SqEngine engine, int bus_handle, float pan)
+float sq_bus_set_pan(SqEngine engine, int bus_handle, float pan)
 {
     auto* bus = eng(engine).getBus(bus_handle);
-    if (bus) bus->setPan(pan);
+    if (!bus) return 0.0f;
+    bus->setPan(pan);
+    return bus->getPan();
 }
 
 bool sq_bus_bypassed(SqEngine engine, int bus_handle)
@@ -455,6 +491,13 @@ int sq_source_chain_size(SqEngine engine, int source_handle)
     return eng(engine).sourceChainSize(src);
 }
 
+int sq_source_chain_handles(SqEngine engine, int source_handle, int* out, int capacity)
+{
+    auto* src = eng(engine).getSource(source_handle);
+    if (!src) return 0;
+    return eng(engine).sourceChainHandles(src, out, capacity);
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // Bus chain
 // ═══════════════════════════════════════════════════════════════════
@@ -491,6 +534,13 @@ int sq_bus_chain_size(SqEngine engine, int bus_handle)
     return eng(engine).busChainSize(bus);
 }
 
+int sq_bus_chain_handles(SqEngine engine, int bus_handle, int* out, int capacity)
+{
+    auto* bus = eng(engine).getBus(bus_handle);
+    if (!bus) return 0;
+    return eng(engine).busChainHandles(bus, out, capacity);
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // Parameters
 // ═══════════════════════════════════════════════════════════════════
@@ -505,6 +555,20 @@ bool sq_set_param(SqEngine engine, int proc_handle, const char* name, float valu
     return eng(engine).setParameter(proc_handle, name, value);
 }
 
+int sq_set_param_many(SqEngine engine, int proc_handle, int count,
+                      const char* const* names, const float* values)
+{
+    if (!engine) return 0;
+    return eng(engine).setParameters(proc_handle, names, values, count);
+}
+
+int sq_get_param_many(SqEngine engine, int proc_handle, int count,
+                      const char* const* names, float* out_values)
+{
+    if (!engine) return 0;
+    return eng(engine).getParameters(proc_handle, names, out_values, count);
+}
+
 char* sq_param_text(SqEngine engine, int proc_handle, const char* name)
 {
     auto text = eng(engine).getParameterText(proc_handle, name);
@@ -539,6 +603,43 @@ SqParamDescriptorList sq_param_descriptors(SqEngine engine, int proc_handle)
     return result;
 }
 
+SqParamDescriptorBlock sq_param_descriptors_packed(SqEngine engine, int proc_handle)
+{
+    SqParamDescriptorBlock result = {nullptr, 0, nullptr, nullptr, 0};
+    if (!engine) return result;
+    auto descs = eng(engine).getParameterDescriptors(proc_handle);
+    if (descs.empty()) return result;
+
+    size_t stringsSize = 0;
+    for (auto& d : descs)
+        stringsSize += d.name.size() + d.label.size() + d.group.size() + 3;
+
+    result.count = static_cast<int>(descs.size());
+    result.strings_size = static_cast<int>(stringsSize);
+    result.strings = static_cast<char*>(malloc(stringsSize));
+    result.floats = static_cast<float*>(malloc(sizeof(float) * 3 * descs.size()));
+    result.ints = static_cast<int*>(malloc(sizeof(int) * 3 * descs.size()));
+
+    char* out = result.strings;
+    for (int i = 0; i < result.count; i++)
+    {
+        auto& d = descs[static_cast<size_t>(i)];
+        for (const std::string* str : {&d.name, &d.label, &d.group})
+        {
+            std::memcpy(out, str->c_str(), str->size() + 1);
+            out += str->size() + 1;
+        }
+        result.floats[3 * i]     = d.defaultValue;
+        result.floats[3 * i + 1] = d.minValue;
+        result.floats[3 * i + 2] = d.maxValue;
+        result.ints[3 * i]       = d.numSteps;
+        result.ints[3 * i + 1]   = d.automatable ? 1 : 0;
+        result.ints[3 * i + 2]   = d.boolean ? 1 : 0;
+    }
+
+    return result;
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // Metering
 // ═══════════════════════════════════════════════════════════════════
@@ -692,6 +793,48 @@ bool sq_schedule_param_change(SqEngine engine, int proc_handle, double beat_time
     return eng(engine).scheduleParamChange(proc_handle, beat_time, param_name, value);
 }
 
+int sq_schedule_events(SqEngine engine, int source_handle, int count,
+                       const double* beat_times, const int* kinds,
+                       const int* channels, const int* data1,
+                       const float* values)
+{
+    if (!engine || count <= 0) return 0;
+    if (!beat_times || !kinds || !channels || !data1 || !values) return 0;
+
+    std::vector<squeeze::ScheduledEvent> events;
+    events.reserve(static_cast<size_t>(count));
+    for (int i = 0; i < count; i++)
+    {
+        squeeze::ScheduledEvent ev{};
+        ev.beatTime     = beat_times[i];
+        ev.targetHandle = source_handle;
+        ev.channel      = channels[i];
+        ev.data1        = data1[i];
+        switch (kinds[i])
+        {
+            case SQ_EVENT_NOTE_ON:
+                ev.type       = squeeze::ScheduledEvent::Type::noteOn;
+                ev.floatValue = values[i];
+                break;
+            case SQ_EVENT_NOTE_OFF:
+                ev.type = squeeze::ScheduledEvent::Type::noteOff;
+                break;
+            case SQ_EVENT_CC:
+                ev.type  = squeeze::ScheduledEvent::Type::cc;
+                ev.data2 = static_cast<int>(values[i]);
+                break;
+            case SQ_EVENT_PITCH_BEND:
+                ev.type = squeeze::ScheduledEvent::Type::pitchBend;
+                break;
+            default:
+                SQ_WARN("sq_schedule_events: unknown event kind %d at index %d", kinds[i], i);
+                return eng(engine).scheduleEvents(events.data(), static_cast<int>(events.size()));
+        }
+        events.push_back(ev);
+    }
+    return eng(engine).scheduleEvents(events.data(), count);
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // Plugin manager
 // ═══════════════════════════════════════════════════════════════════
@@ -801,6 +944,18 @@ SqStringList sq_midi_devices(SqEngine engine)
     return result;
 }
 
+uint64_t sq_midi_devices_version(SqEngine engine)
+{
+    if (!engine) return 0;
+    return cast(engine)->midiDeviceManager.getDevicesVersion();
+}
+
+void sq_midi_prefetch_devices(SqEngine engine)
+{
+    if (!engine) return;
+    cast(engine)->midiDeviceManager.prefetchAvailableDevices();
+}
+
 bool sq_midi_open(SqEngine engine, const char* name, char** error)
 {
     std::string err;
@@ -1102,6 +1257,24 @@ void sq_free_slot_perf_list(SqSlotPerfList list)
     free(list.items);
 }
 
+int sq_perf_slots_into(SqEngine engine, SqSlotPerf* out, int capacity)
+{
+    if (!engine) return 0;
+
+    auto snap = eng(engine).getPerfMonitor().getSnapshot();
+    int total = static_cast<int>(snap.slots.size());
+    int n = (out && capacity > 0) ? std::min(total, capacity) : 0;
+
+    for (int i = 0; i < n; ++i)
+    {
+        out[i].handle = snap.slots[i].handle;
+        out[i].avg_us = snap.slots[i].avgUs;
+        out[i].peak_us = snap.slots[i].peakUs;
+    }
+
+    return total;
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // Buffer management
 // ═══════════════════════════════════════════════════════════════════
@@ -1132,6 +1305,26 @@ int sq_load_buffer(SqEngine engine, const char* path, char** error)
     return id;
 }
 
+int sq_load_buffers(SqEngine engine, int count, const char* const* paths,
+                    int* out_ids, char** error)
+{
+    if (error) *error = nullptr;
+    if (!paths || !out_ids) return 0;
+    auto* h = cast(engine);
+    std::string err;
+    for (int i = 0; i < count; ++i)
+    {
+        int id = h->bufferLibrary.loadBuffer(paths[i] ? paths[i] : "", err);
+        if (id < 0)
+        {
+            set_error(error, err);
+            return i;
+        }
+        out_ids[i] = id;
+    }
+    return count;
+}
+
 int sq_create_buffer(SqEngine engine, int num_channels, int length_in_samples,
                      double sample_rate, const char* name, char** error)
 {
@@ -1292,6 +1485,34 @@ int sq_buffer_write(SqEngine engine, int buffer_id, int channel,
     return count;
 }
 
+int sq_buffer_write_all(SqEngine engine, int buffer_id, int offset,
+                        const float* src, int num_channels, int num_samples)
+{
+    auto* buf = cast(engine)->bufferLibrary.getBuffer(buffer_id);
+    if (!buf || !src || num_channels <= 0 || num_samples <= 0) return 0;
+
+    int len = buf->getLengthInSamples();
+    if (offset < 0 || offset >= len) return 0;
+    int count = std::min(num_samples, len - offset);
+    int channels = std::min(num_channels, buf->getNumChannels());
+    for (int ch = 0; ch < channels; ++ch)
+        std::memcpy(buf->getWritePointer(ch) + offset,
+                    src + static_cast<size_t>(ch) * static_cast<size_t>(num_samples),
+                    static_cast<size_t>(count) * sizeof(float));
+    return count;
+}
+
+float* sq_buffer_data(SqEngine engine, int buffer_id, int channel, int* length)
+{
+    if (length) *length = 0;
+    auto* buf = cast(engine)->bufferLibrary.getBuffer(buffer_id);
+    if (!buf) return nullptr;
+
+    float* data = buf->getWritePointer(channel);
+    if (data && length) *length = buf->getLengthInSamples();
+    return data;
+}
+
 void sq_buffer_clear(SqEngine engine, int buffer_id)
 {
     auto* buf = cast(engine)->bufferLibrary.getBuffer(buffer_id);
@@ -1340,3 +1561,8 @@ void sq_render(SqEngine engine, int num_samples)
 {
     eng(engine).render(num_samples);
 }
+
+void sq_render_blocks(SqEngine engine, int num_samples, int num_blocks)
+{
+    eng(engine).renderBlocks(num_samples, num_blocks);
+}
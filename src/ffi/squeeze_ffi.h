@@ -53,6 +53,13 @@ int sq_engine_block_size(SqEngine engine);
 /// Returns the source handle (>0), or -1 on failure.
 int sq_add_source(SqEngine engine, const char* name);
 
+/// Add `count` GainProcessor sources in one call, writing each handle to
+/// out_handles[i]. The graph is rebuilt once at the end (or left to the
+/// enclosing batch). Stops at the first failure. Returns the number of
+/// sources added — `count` on full success.
+int sq_add_sources(SqEngine engine, int count, const char* const* names,
+                   int* out_handles);
+
 /// Remove a source by handle. Returns false if not found.
 bool sq_remove_source(SqEngine engine, int source_handle);
 
@@ -68,14 +75,16 @@ char* sq_source_name(SqEngine engine, int source_handle);
 /// Returns the source gain (linear).
 float sq_source_gain(SqEngine engine, int source_handle);
 
-/// Set the source gain (linear).
-void sq_source_set_gain(SqEngine engine, int source_handle, float gain);
+/// Set the source gain (linear). Returns the gain actually applied (negative
+/// values clamp to 0), or 0.0 for an unknown handle.
+float sq_source_set_gain(SqEngine engine, int source_handle, float gain);
 
 /// Returns the source pan (-1.0 to 1.0).
 float sq_source_pan(SqEngine engine, int source_handle);
 
-/// Set the source pan (-1.0 to 1.0).
-void sq_source_set_pan(SqEngine engine, int source_handle, float pan);
+/// Set the source pan (-1.0 to 1.0). Returns the pan actually applied (after
+/// clamping), or 0.0 for an unknown handle.
+float sq_source_set_pan(SqEngine engine, int source_handle, float pan);
 
 /// Returns true if the source is bypassed.
 bool sq_source_bypassed(SqEngine engine, int source_handle);
@@ -108,14 +117,16 @@ char* sq_bus_name(SqEngine engine, int bus_handle);
 /// Returns the bus gain (linear).
 float sq_bus_gain(SqEngine engine, int bus_handle);
 
-/// Set the bus gain (linear).
-void sq_bus_set_gain(SqEngine engine, int bus_handle, float gain);
+/// Set the bus gain (linear). Returns the gain actually applied (negative
+/// values clamp to 0), or 0.0 for an unknown handle.
+float sq_bus_set_gain(SqEngine engine, int bus_handle, float gain);
 
 /// Returns the bus pan (-1.0 to 1.0).
 float sq_bus_pan(SqEngine engine, int bus_handle);
 
-/// Set the bus pan (-1.0 to 1.0).
-void sq_bus_set_pan(SqEngine engine, int bus_handle, float pan);
+/// Set the bus pan (-1.0 to 1.0). Returns the pan actually applied (after
+/// clamping), or 0.0 for an unknown handle.
+float sq_bus_set_pan(SqEngine engine, int bus_handle, float pan);
 
 /// Returns true if the bus is bypassed.
 bool sq_bus_bypassed(SqEngine engine, int bus_handle);
@@ -171,6 +182,12 @@ void sq_source_remove_proc(SqEngine engine, int source_handle, int index);
 /// Returns the number of processors in source's chain.
 int sq_source_chain_size(SqEngine engine, int source_handle);
 
+/// Copy the processor handles of source's chain, in order, into a
+/// caller-owned array of `capacity` entries. Returns the chain size, which
+/// may exceed `capacity` — then only the first `capacity` are written.
+/// Returns 0 for an unknown source. No allocation.
+int sq_source_chain_handles(SqEngine engine, int source_handle, int* out, int capacity);
+
 /* ── Bus chain ─────────────────────────────────────────────────── */
 
 /// Append a GainProcessor to bus's chain. Returns proc handle.
@@ -185,6 +202,9 @@ void sq_bus_remove_proc(SqEngine engine, int bus_handle, int index);
 /// Returns the number of processors in bus's chain.
 int sq_bus_chain_size(SqEngine engine, int bus_handle);
 
+/// Bus counterpart of sq_source_chain_handles().
+int sq_bus_chain_handles(SqEngine engine, int bus_handle, int* out, int capacity);
+
 /* ── Parameters (by processor handle) ─────────────────────────── */
 
 typedef struct {
@@ -210,6 +230,19 @@ float sq_get_param(SqEngine engine, int proc_handle, const char* name);
 /// Set a parameter value by name. Returns false if invalid.
 bool sq_set_param(SqEngine engine, int proc_handle, const char* name, float value);
 
+/// Set `count` parameters on one processor in a single call: names[i] is set
+/// to values[i]. Returns the number of values applied — `count`, or 0 if the
+/// processor handle is unknown or the arrays are NULL.
+int sq_set_param_many(SqEngine engine, int proc_handle, int count,
+                      const char* const* names, const float* values);
+
+/// Read `count` parameters from one processor in a single call: out_values[i]
+/// receives the value of names[i] (0.0f for an unknown name). Returns the
+/// number of values written — `count`, or 0 if the processor handle is
+/// unknown or the arrays are NULL.
+int sq_get_param_many(SqEngine engine, int proc_handle, int count,
+                      const char* const* names, float* out_values);
+
 /// Get parameter display text. Caller must sq_free_string().
 char* sq_param_text(SqEngine engine, int proc_handle, const char* name);
 
@@ -219,6 +252,24 @@ SqParamDescriptorList sq_param_descriptors(SqEngine engine, int proc_handle);
 /// Free a parameter descriptor list.
 void sq_free_param_descriptor_list(SqParamDescriptorList list);
 
+/// All descriptors of a processor packed into flat columns for bulk decoding.
+/// strings holds 3 NUL-terminated UTF-8 strings per descriptor, in order
+/// name, label, group. floats holds default, min, max per descriptor.
+/// ints holds num_steps, automatable, boolean per descriptor.
+typedef struct {
+    char*  strings;
+    int    strings_size;    /* bytes, including every terminating NUL */
+    float* floats;          /* 3 * count */
+    int*   ints;            /* 3 * count */
+    int    count;
+} SqParamDescriptorBlock;
+
+/// Returns packed parameter descriptors. Free with sq_free_param_descriptor_block().
+SqParamDescriptorBlock sq_param_descriptors_packed(SqEngine engine, int proc_handle);
+
+/// Free a packed parameter descriptor block.
+void sq_free_param_descriptor_block(SqParamDescriptorBlock block);
+
 /* ── Metering ──────────────────────────────────────────────────── */
 
 /// Returns peak level for a bus.
@@ -264,6 +315,26 @@ bool sq_schedule_pitch_bend(SqEngine engine, int source_handle, double beat_time
 bool sq_schedule_param_change(SqEngine engine, int proc_handle, double beat_time,
                               const char* param_name, float value);
 
+/// Event kinds for sq_schedule_events().
+typedef enum {
+    SQ_EVENT_NOTE_ON    = 0,
+    SQ_EVENT_NOTE_OFF   = 1,
+    SQ_EVENT_CC         = 2,
+    SQ_EVENT_PITCH_BEND = 3
+} SqEventKind;
+
+/// Schedule `count` MIDI events on a source in a single call.
+/// Arguments are parallel arrays of length `count`:
+///   kinds:    SqEventKind per event
+///   data1:    note (note on/off), CC number (cc), or 14-bit value (pitch bend)
+///   values:   velocity (note on) or CC value (cc); ignored otherwise
+/// Returns the number of events queued. Stops at the first event that is
+/// rejected (unknown kind or full queue).
+int sq_schedule_events(SqEngine engine, int source_handle, int count,
+                       const double* beat_times, const int* kinds,
+                       const int* channels, const int* data1,
+                       const float* values);
+
 /* ── String list ──────────────────────────────────────────────── */
 
 typedef struct {
@@ -331,6 +402,15 @@ void sq_free_midi_route_list(SqMidiRouteList list);
 /* ── MIDI device management ──────────────────────────────────── */
 
 SqStringList sq_midi_devices(SqEngine engine);
+/// Counter bumped each time the OS reports MIDI devices added or removed.
+/// Compare against a previous value to tell whether sq_midi_devices()
+/// would return something new. Changes arrive via the message loop.
+uint64_t sq_midi_devices_version(SqEngine engine);
+/// Start enumerating MIDI devices on a background thread, so a later
+/// sq_midi_devices() returns without waiting on the OS (or waits only for
+/// the remainder). Returns immediately. Destroying the engine waits for a
+/// prefetch still running.
+void sq_midi_prefetch_devices(SqEngine engine);
 bool sq_midi_open(SqEngine engine, const char* name, char** error);
 void sq_midi_close(SqEngine engine, const char* name);
 SqStringList sq_midi_open_devices(SqEngine engine);
@@ -437,6 +517,12 @@ SqSlotPerfList sq_perf_slots(SqEngine engine);
 /// Free a slot perf list. NULL items is safe.
 void sq_free_slot_perf_list(SqSlotPerfList list);
 
+/// Copy per-slot timing into a caller-owned array of `capacity` entries.
+/// Returns the total number of slots, which may exceed `capacity` — in that
+/// case only the first `capacity` are written and the caller should grow
+/// its array and call again. Returns 0 on NULL engine. No allocation.
+int sq_perf_slots_into(SqEngine engine, SqSlotPerf* out, int capacity);
+
 /* ── Buffer management ────────────────────────────────────────── */
 
 typedef struct {
@@ -465,6 +551,12 @@ void sq_free_id_name_list(SqIdNameList list);
 /// Load an audio file into a buffer. Returns buffer ID (>= 1), or -1 on failure (sets *error).
 int sq_load_buffer(SqEngine engine, const char* path, char** error);
 
+/// Load `count` audio files in one call, writing each buffer ID to out_ids[i].
+/// Stops at the first failure (sets *error); buffers loaded before it stay
+/// loaded. Returns the number of files loaded — `count` on full success.
+int sq_load_buffers(SqEngine engine, int count, const char* const* paths,
+                    int* out_ids, char** error);
+
 /// Create an empty buffer. Returns buffer ID (>= 1), or -1 on failure (sets *error).
 int sq_create_buffer(SqEngine engine, int num_channels, int length_in_samples,
                      double sample_rate, const char* name, char** error);
@@ -522,6 +614,18 @@ int sq_buffer_read(SqEngine engine, int buffer_id, int channel,
 int sq_buffer_write(SqEngine engine, int buffer_id, int channel,
                     int offset, const float* src, int num_samples);
 
+/// Write several channels from one channel-major block: src holds num_channels
+/// runs of num_samples floats, one per channel (a C-contiguous
+/// [channels][samples] array). Channels beyond the buffer's are ignored.
+/// Returns number of samples written per channel (0 on error or out-of-range).
+int sq_buffer_write_all(SqEngine engine, int buffer_id, int offset,
+                        const float* src, int num_channels, int num_samples);
+
+/// Pointer to one channel's samples, owned by the engine, with the sample
+/// count written to *length. Valid until the buffer is removed or the engine
+/// destroyed. Returns NULL (and *length = 0) if the buffer or channel is unknown.
+float* sq_buffer_data(SqEngine engine, int buffer_id, int channel, int* length);
+
 /// Zero all samples and reset write position to 0. No-op if buffer not found.
 void sq_buffer_clear(SqEngine engine, int buffer_id);
 
@@ -539,6 +643,10 @@ bool sq_source_set_buffer(SqEngine engine, int source_handle, int buffer_id);
 
 void sq_render(SqEngine engine, int num_samples);
 
+/// Render num_blocks consecutive blocks of num_samples each, as if by
+/// num_blocks sq_render() calls. num_blocks <= 0 renders nothing.
+void sq_render_blocks(SqEngine engine, int num_samples, int num_blocks);
+
 #ifdef __cplusplus
 }
 #endif
@@ -91,6 +91,15 @@ TEST_CASE("getSource returns source by handle")
     CHECK(engine.getSource(9999) == nullptr);
 }
 
+TEST_CASE("getSource returns nullptr once the source is removed")
+{
+    Engine engine(44100.0, 512);
+    auto* s = engine.addSource("src", std::make_unique<GainProcessor>());
+    int handle = s->getHandle();
+    REQUIRE(engine.removeSource(s));
+    CHECK(engine.getSource(handle) == nullptr);
+}
+
 TEST_CASE("getSources returns all sources")
 {
     Engine engine(44100.0, 512);
@@ -136,6 +145,16 @@ TEST_CASE("getBus returns bus by handle")
     auto* bus = engine.addBus("FX");
     CHECK(engine.getBus(bus->getHandle()) == bus);
     CHECK(engine.getBus(9999) == nullptr);
+    CHECK(engine.getBus(engine.getMaster()->getHandle()) == engine.getMaster());
+}
+
+TEST_CASE("getBus returns nullptr once the bus is removed")
+{
+    Engine engine(44100.0, 512);
+    auto* bus = engine.addBus("FX");
+    int handle = bus->getHandle();
+    REQUIRE(engine.removeBus(bus));
+    CHECK(engine.getBus(handle) == nullptr);
 }
 
 TEST_CASE("getMaster returns the Master bus")
@@ -275,6 +294,23 @@ TEST_CASE("sourceRemove removes processor from chain")
     CHECK(engine.sourceChainSize(src) == 0);
 }
 
+TEST_CASE("sourceChainHandles copies handles in chain order")
+{
+    Engine engine(44100.0, 512);
+    auto* src = engine.addSource("src", std::make_unique<GainProcessor>());
+    auto* a = engine.sourceAppend(src, std::make_unique<GainProcessor>());
+    auto* b = engine.sourceInsert(src, 0, std::make_unique<GainProcessor>());
+    int out[2] = {0, 0};
+    CHECK(engine.sourceChainHandles(src, out, 2) == 2);
+    CHECK(out[0] == b->getHandle());
+    CHECK(out[1] == a->getHandle());
+
+    int one[1] = {0};
+    CHECK(engine.sourceChainHandles(src, one, 1) == 2);
+    CHECK(one[0] == b->getHandle());
+    CHECK(engine.sourceChainHandles(src, nullptr, 0) == 2);
+}
+
 TEST_CASE("busAppend adds processor to bus chain")
 {
     Engine engine(44100.0, 512);
@@ -384,6 +420,13 @@ TEST_CASE("render does not crash")
     engine.render(512);
 }
 
+TEST_CASE("renderBlocks renders zero or more blocks")
+{
+    Engine engine(44100.0, 512);
+    engine.renderBlocks(512, 0);
+    engine.renderBlocks(512, 8);
+}
+
 TEST_CASE("processBlock outputs silence with no sources")
 {
     Engine engine(44100.0, 512);
@@ -524,6 +567,16 @@ TEST_CASE("batchBegin/batchCommit defers snapshot rebuild")
     engine.render(512);
 }
 
+TEST_CASE("isBatching reflects batchBegin/batchCommit")
+{
+    Engine engine(44100.0, 512);
+    CHECK_FALSE(engine.isBatching());
+    engine.batchBegin();
+    CHECK(engine.isBatching());
+    engine.batchCommit();
+    CHECK_FALSE(engine.isBatching());
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // Transport stubs
 // ═══════════════════════════════════════════════════════════════════
@@ -57,6 +57,17 @@ TEST_CASE("PlayerProcessor parameter defaults")
     CHECK(pp.getParameter("fade_ms") == 5.0f);
 }
 
+TEST_CASE("PlayerProcessor every descriptor name reads back its default")
+{
+    PlayerProcessor pp;
+    for (const auto& d : pp.getParameterDescriptors())
+    {
+        INFO(d.name);
+        CHECK(pp.getParameter(d.name) == d.defaultValue);
+        CHECK_FALSE(pp.getParameterText(d.name).empty());
+    }
+}
+
 TEST_CASE("PlayerProcessor setParameter and getParameter round-trip")
 {
     PlayerProcessor pp;
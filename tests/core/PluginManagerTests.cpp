@@ -100,6 +100,39 @@ TEST_CASE("PluginManager loadCache with nonexistent file returns false")
     CHECK(pm.getNumPlugins() == 0);
 }
 
+TEST_CASE("PluginManager loadCache shares the parsed file across managers")
+{
+    auto file = juce::File::createTempFile(".xml");
+    REQUIRE(file.replaceWithText(kValidXml));
+
+    std::string error;
+    PluginManager first;
+    REQUIRE(first.loadCache(file.getFullPathName().toStdString(), error));
+    PluginManager second;
+    REQUIRE(second.loadCache(file.getFullPathName().toStdString(), error));
+    CHECK(second.getNumPlugins() == 3);
+    CHECK(second.findByName("Effect B") != nullptr);
+
+    file.deleteFile();
+}
+
+TEST_CASE("PluginManager loadCache re-parses a file that changed")
+{
+    auto file = juce::File::createTempFile(".xml");
+    REQUIRE(file.replaceWithText(kValidXml));
+
+    std::string error;
+    PluginManager pm;
+    REQUIRE(pm.loadCache(file.getFullPathName().toStdString(), error));
+    CHECK(pm.getNumPlugins() == 3);
+
+    REQUIRE(file.replaceWithText("<KNOWNPLUGINS></KNOWNPLUGINS>"));
+    CHECK_FALSE(pm.loadCache(file.getFullPathName().toStdString(), error));
+    CHECK(pm.getNumPlugins() == 0);
+
+    file.deleteFile();
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // Multiple loads replace previous data
 // ═══════════════════════════════════════════════════════════════════
@@ -128,6 +128,31 @@ TEST_CASE("sq_stop resets sample_rate and block_size to 0")
     sq_engine_destroy(engine);
 }
 
+TEST_CASE("sq_start after sq_stop reopens the device")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    REQUIRE(engine != nullptr);
+
+    char* error = nullptr;
+    bool ok = sq_start(engine, 44100.0, 512, &error);
+
+    if (ok)
+    {
+        sq_stop(engine);
+        REQUIRE(sq_start(engine, 48000.0, 256, &error));
+        CHECK(sq_is_running(engine));
+        CHECK(sq_sample_rate(engine) > 0.0);
+        sq_stop(engine);
+    }
+    else
+    {
+        sq_free_string(error);
+        WARN("No audio device — skipping restart test");
+    }
+
+    sq_engine_destroy(engine);
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // Double stop is safe
 // ═══════════════════════════════════════════════════════════════════
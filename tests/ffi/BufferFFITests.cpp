@@ -193,6 +193,29 @@ TEST_CASE("sq_buffer_write and sq_buffer_read round-trip samples")
     sq_engine_destroy(e);
 }
 
+TEST_CASE("sq_buffer_data aliases the channel samples")
+{
+    SqEngine e = sq_engine_create(44100.0, 512, nullptr);
+    int id = sq_create_buffer(e, 2, 100, 44100.0, "x", nullptr);
+
+    int length = -1;
+    float* data = sq_buffer_data(e, id, 1, &length);
+    REQUIRE(data != nullptr);
+    CHECK(length == 100);
+
+    data[7] = 0.75f;
+    float out = 0.0f;
+    CHECK(sq_buffer_read(e, id, 1, 7, &out, 1) == 1);
+    CHECK(out == 0.75f);
+
+    CHECK(sq_buffer_data(e, id, 2, &length) == nullptr);
+    CHECK(length == 0);
+    CHECK(sq_buffer_data(e, 999, 0, &length) == nullptr);
+    CHECK(length == 0);
+
+    sq_engine_destroy(e);
+}
+
 TEST_CASE("sq_buffer_read clamps to buffer length")
 {
     SqEngine e = sq_engine_create(44100.0, 512, nullptr);
@@ -217,6 +240,28 @@ TEST_CASE("sq_buffer_write clamps to buffer length")
     sq_engine_destroy(e);
 }
 
+TEST_CASE("sq_buffer_write_all writes each channel from one channel-major block")
+{
+    SqEngine e = sq_engine_create(44100.0, 512, nullptr);
+    int id = sq_create_buffer(e, 2, 50, 44100.0, "x", nullptr);
+
+    // Three rows of 100: the third channel is ignored, the tail clamped
+    std::vector<float> src(300);
+    for (int i = 0; i < 300; ++i) src[i] = static_cast<float>(i / 100 + 1);
+    CHECK(sq_buffer_write_all(e, id, 0, src.data(), 3, 100) == 50);
+
+    float s0 = 0.0f, s1 = 0.0f;
+    sq_buffer_read(e, id, 0, 49, &s0, 1);
+    sq_buffer_read(e, id, 1, 0, &s1, 1);
+    CHECK(s0 == 1.0f);
+    CHECK(s1 == 2.0f);
+
+    CHECK(sq_buffer_write_all(e, id, 50, src.data(), 2, 100) == 0);
+    CHECK(sq_buffer_write_all(e, 999, 0, src.data(), 2, 100) == 0);
+
+    sq_engine_destroy(e);
+}
+
 TEST_CASE("sq_buffer_read with offset")
 {
     SqEngine e = sq_engine_create(44100.0, 512, nullptr);
@@ -736,6 +781,66 @@ TEST_CASE("sq_load_buffer loaded buffer has correct channels, sample rate, and l
     sq_engine_destroy(e);
 }
 
+TEST_CASE("sq_load_buffers loads every file and returns their IDs")
+{
+    juce::TemporaryFile tmpA(".wav"), tmpB(".wav");
+    for (auto* tmp : {&tmpA, &tmpB})
+    {
+        juce::WavAudioFormat wavFormat;
+        std::unique_ptr<juce::AudioFormatWriter> writer(
+            wavFormat.createWriterFor(
+                new juce::FileOutputStream(tmp->getFile()),
+                44100.0, 1, 16, {}, 0));
+        REQUIRE(writer != nullptr);
+        juce::AudioBuffer<float> data(1, 100);
+        data.clear();
+        writer->writeFromAudioSampleBuffer(data, 0, 100);
+    }
+
+    std::string a = tmpA.getFile().getFullPathName().toStdString();
+    std::string b = tmpB.getFile().getFullPathName().toStdString();
+    const char* paths[] = {a.c_str(), b.c_str()};
+    int ids[2] = {0, 0};
+
+    SqEngine e = sq_engine_create(44100.0, 512, nullptr);
+    char* error = nullptr;
+    CHECK(sq_load_buffers(e, 2, paths, ids, &error) == 2);
+    CHECK(error == nullptr);
+    CHECK(ids[0] >= 1);
+    CHECK(ids[1] > ids[0]);
+    CHECK(sq_buffer_count(e) == 2);
+    sq_engine_destroy(e);
+}
+
+TEST_CASE("sq_load_buffers stops at the first failure and sets error")
+{
+    juce::TemporaryFile tmpFile(".wav");
+    {
+        juce::WavAudioFormat wavFormat;
+        std::unique_ptr<juce::AudioFormatWriter> writer(
+            wavFormat.createWriterFor(
+                new juce::FileOutputStream(tmpFile.getFile()),
+                44100.0, 1, 16, {}, 0));
+        REQUIRE(writer != nullptr);
+        juce::AudioBuffer<float> data(1, 100);
+        data.clear();
+        writer->writeFromAudioSampleBuffer(data, 0, 100);
+    }
+
+    std::string good = tmpFile.getFile().getFullPathName().toStdString();
+    const char* paths[] = {good.c_str(), "/nonexistent/file.wav", good.c_str()};
+    int ids[3] = {0, 0, 0};
+
+    SqEngine e = sq_engine_create(44100.0, 512, nullptr);
+    char* error = nullptr;
+    CHECK(sq_load_buffers(e, 3, paths, ids, &error) == 1);
+    REQUIRE(error != nullptr);
+    sq_free_string(error);
+    CHECK(ids[0] >= 1);
+    CHECK(sq_buffer_count(e) == 1);
+    sq_engine_destroy(e);
+}
+
 TEST_CASE("sq_buffer_info for loaded buffer includes file path")
 {
     juce::TemporaryFile tmpFile(".wav");
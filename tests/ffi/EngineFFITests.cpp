@@ -93,6 +93,51 @@ TEST_CASE("sq_add_source returns positive handle")
     sq_engine_destroy(engine);
 }
 
+TEST_CASE("sq_add_sources adds every named source in one call")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    const char* names[] = {"a", "b", "c"};
+    int handles[3] = {0, 0, 0};
+    CHECK(sq_add_sources(engine, 3, names, handles) == 3);
+    CHECK(sq_source_count(engine) == 3);
+    CHECK(handles[0] > 0);
+    CHECK(handles[1] != handles[0]);
+    CHECK(handles[2] != handles[1]);
+    char* name = sq_source_name(engine, handles[1]);
+    CHECK(std::strcmp(name, "b") == 0);
+    sq_free_string(name);
+    sq_render(engine, 512);
+    sq_engine_destroy(engine);
+}
+
+TEST_CASE("sq_add_sources inside a batch leaves the commit to the caller")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    const char* names[] = {"a"};
+    int handle = 0;
+    sq_batch_begin(engine);
+    CHECK(sq_add_sources(engine, 1, names, &handle) == 1);
+    int later = sq_add_source(engine, "b");  // still inside the batch
+    sq_batch_commit(engine);
+    CHECK(later > 0);
+    CHECK(sq_source_count(engine) == 2);
+    sq_render(engine, 512);
+    sq_engine_destroy(engine);
+}
+
+TEST_CASE("sq_add_sources with NULL or empty input returns 0")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    const char* names[] = {"a"};
+    int handle = 0;
+    CHECK(sq_add_sources(engine, 0, names, &handle) == 0);
+    CHECK(sq_add_sources(engine, 1, nullptr, &handle) == 0);
+    CHECK(sq_add_sources(engine, 1, names, nullptr) == 0);
+    CHECK(sq_add_sources(nullptr, 1, names, &handle) == 0);
+    CHECK(sq_source_count(engine) == 0);
+    sq_engine_destroy(engine);
+}
+
 TEST_CASE("sq_remove_source removes the source")
 {
     SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
@@ -242,6 +287,26 @@ TEST_CASE("sq_source_remove_proc removes from chain")
     sq_engine_destroy(engine);
 }
 
+TEST_CASE("sq_source_chain_handles / sq_bus_chain_handles list handles in order")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    int src = sq_add_source(engine, "synth");
+    int a = sq_source_append_proc(engine, src);
+    int b = sq_source_insert_proc(engine, src, 0);
+    int out[4] = {0, 0, 0, 0};
+    CHECK(sq_source_chain_handles(engine, src, out, 4) == 2);
+    CHECK(out[0] == b);
+    CHECK(out[1] == a);
+    CHECK(sq_source_chain_handles(engine, src, nullptr, 0) == 2);
+    CHECK(sq_source_chain_handles(engine, 9999, out, 4) == 0);
+
+    int master = sq_master(engine);
+    int m = sq_bus_append_proc(engine, master);
+    CHECK(sq_bus_chain_handles(engine, master, out, 4) == 1);
+    CHECK(out[0] == m);
+    sq_engine_destroy(engine);
+}
+
 TEST_CASE("sq_bus_append_proc adds to bus chain")
 {
     SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
@@ -297,6 +362,17 @@ TEST_CASE("sq_source_pan/sq_source_set_pan roundtrip")
     sq_engine_destroy(engine);
 }
 
+TEST_CASE("sq_source_set_gain/sq_source_set_pan return the applied value")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    int src = sq_add_source(engine, "synth");
+    CHECK(sq_source_set_gain(engine, src, 0.25f) == 0.25f);
+    CHECK(sq_source_set_gain(engine, src, -1.0f) == 0.0f);
+    CHECK(sq_source_set_pan(engine, src, 2.0f) == 1.0f);
+    CHECK(sq_source_set_gain(engine, 9999, 0.5f) == 0.0f);
+    sq_engine_destroy(engine);
+}
+
 TEST_CASE("sq_source_bypassed/sq_source_set_bypassed roundtrip")
 {
     SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
@@ -409,6 +485,59 @@ TEST_CASE("sq_get_param/sq_set_param work via proc handle")
     sq_engine_destroy(engine);
 }
 
+TEST_CASE("sq_set_param_many sets every named parameter in one call")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    int src = sq_add_source(engine, "synth");
+    int gen = sq_source_generator(engine, src);
+
+    const char* names[] = {"gain", "gain"};
+    const float values[] = {0.25f, 0.75f};
+    CHECK(sq_set_param_many(engine, gen, 2, names, values) == 2);
+    CHECK(sq_get_param(engine, gen, "gain") == 0.75f);  // applied in order
+
+    sq_engine_destroy(engine);
+}
+
+TEST_CASE("sq_set_param_many with unknown handle or empty input returns 0")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    const char* names[] = {"gain"};
+    const float values[] = {0.5f};
+    CHECK(sq_set_param_many(engine, 9999, 1, names, values) == 0);
+    CHECK(sq_set_param_many(engine, 9999, 0, nullptr, nullptr) == 0);
+    CHECK(sq_set_param_many(nullptr, 1, 1, names, values) == 0);
+    sq_engine_destroy(engine);
+}
+
+TEST_CASE("sq_get_param_many reads every named parameter in one call")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    int src = sq_add_source(engine, "synth");
+    int gen = sq_source_generator(engine, src);
+    REQUIRE(sq_set_param(engine, gen, "gain", 0.25f));
+
+    const char* names[] = {"gain", "nonexistent"};
+    float values[] = {-1.0f, -1.0f};
+    CHECK(sq_get_param_many(engine, gen, 2, names, values) == 2);
+    CHECK(values[0] == 0.25f);
+    CHECK(values[1] == 0.0f);
+
+    sq_engine_destroy(engine);
+}
+
+TEST_CASE("sq_get_param_many with unknown handle or empty input returns 0")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    const char* names[] = {"gain"};
+    float values[] = {0.5f};
+    CHECK(sq_get_param_many(engine, 9999, 1, names, values) == 0);
+    CHECK(values[0] == 0.5f);  // untouched
+    CHECK(sq_get_param_many(engine, 9999, 0, nullptr, nullptr) == 0);
+    CHECK(sq_get_param_many(nullptr, 1, 1, names, values) == 0);
+    sq_engine_destroy(engine);
+}
+
 TEST_CASE("sq_param_descriptors returns descriptors for proc handle")
 {
     SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
@@ -423,6 +552,48 @@ TEST_CASE("sq_param_descriptors returns descriptors for proc handle")
     sq_engine_destroy(engine);
 }
 
+TEST_CASE("sq_param_descriptors_packed matches sq_param_descriptors")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    int src = sq_add_source(engine, "synth");
+    int gen = sq_source_generator(engine, src);
+
+    SqParamDescriptorList list = sq_param_descriptors(engine, gen);
+    SqParamDescriptorBlock block = sq_param_descriptors_packed(engine, gen);
+    REQUIRE(block.count == list.count);
+    REQUIRE(block.count == 1);
+
+    // name, label, group — NUL-separated
+    const char* name = block.strings;
+    const char* label = name + std::strlen(name) + 1;
+    const char* group = label + std::strlen(label) + 1;
+    CHECK(std::string(name) == list.descriptors[0].name);
+    CHECK(std::string(label) == list.descriptors[0].label);
+    CHECK(std::string(group) == list.descriptors[0].group);
+    CHECK(group + std::strlen(group) + 1 == block.strings + block.strings_size);
+
+    CHECK(block.floats[0] == list.descriptors[0].default_value);
+    CHECK(block.floats[1] == list.descriptors[0].min_value);
+    CHECK(block.floats[2] == list.descriptors[0].max_value);
+    CHECK(block.ints[0] == list.descriptors[0].num_steps);
+    CHECK((block.ints[1] != 0) == list.descriptors[0].automatable);
+    CHECK((block.ints[2] != 0) == list.descriptors[0].boolean_param);
+
+    sq_free_param_descriptor_block(block);
+    sq_free_param_descriptor_list(list);
+    sq_engine_destroy(engine);
+}
+
+TEST_CASE("sq_param_descriptors_packed returns an empty block for unknown handle")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    SqParamDescriptorBlock block = sq_param_descriptors_packed(engine, 9999);
+    CHECK(block.count == 0);
+    CHECK(block.strings == nullptr);
+    sq_free_param_descriptor_block(block);
+    sq_engine_destroy(engine);
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // Metering
 // ═══════════════════════════════════════════════════════════════════
@@ -463,6 +634,24 @@ TEST_CASE("sq_render does not crash")
     sq_engine_destroy(engine);
 }
 
+TEST_CASE("sq_render_blocks advances the transport like repeated sq_render")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    sq_transport_play(engine);
+    sq_render(engine, 512);
+    double p0 = sq_transport_position(engine);
+    sq_render_blocks(engine, 512, 4);
+    double p1 = sq_transport_position(engine);
+    for (int i = 0; i < 4; ++i)
+        sq_render(engine, 512);
+    double p2 = sq_transport_position(engine);
+    CHECK(p1 > p0);
+    CHECK(std::abs((p2 - p1) - (p1 - p0)) < 1e-9);
+    sq_render_blocks(engine, 512, 0);
+    CHECK(sq_transport_position(engine) == p2);
+    sq_engine_destroy(engine);
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // Transport stubs
 // ═══════════════════════════════════════════════════════════════════
@@ -82,6 +82,54 @@ TEST_CASE("Scheduled events render without crash")
 }
 
 
+// ═══════════════════════════════════════════════════════════════════
+// Batch scheduling
+// ═══════════════════════════════════════════════════════════════════
+
+TEST_CASE("sq_schedule_events queues every event and returns the count")
+{
+    FFIEngine e;
+    int src = sq_add_source(e, "Synth");
+
+    double beats[]   = {0.0, 0.5, 0.0, 0.0};
+    int    kinds[]   = {SQ_EVENT_NOTE_ON, SQ_EVENT_NOTE_OFF, SQ_EVENT_CC, SQ_EVENT_PITCH_BEND};
+    int    chans[]   = {1, 1, 1, 1};
+    int    data1[]   = {60, 60, 7, 12000};
+    float  values[]  = {0.8f, 0.0f, 100.0f, 0.0f};
+
+    CHECK(sq_schedule_events(e, src, 4, beats, kinds, chans, data1, values) == 4);
+
+    sq_transport_play(e);
+    e.flush();
+}
+
+TEST_CASE("sq_schedule_events stops at an unknown kind")
+{
+    FFIEngine e;
+    int src = sq_add_source(e, "Synth");
+
+    double beats[]   = {0.0, 0.0, 1.0};
+    int    kinds[]   = {SQ_EVENT_NOTE_ON, 99, SQ_EVENT_NOTE_OFF};
+    int    chans[]   = {1, 1, 1};
+    int    data1[]   = {60, 60, 60};
+    float  values[]  = {0.8f, 0.8f, 0.0f};
+
+    CHECK(sq_schedule_events(e, src, 3, beats, kinds, chans, data1, values) == 1);
+}
+
+TEST_CASE("sq_schedule_events with zero count or null arrays returns 0")
+{
+    FFIEngine e;
+    double beat = 0.0;
+    int kind = SQ_EVENT_NOTE_ON, chan = 1, note = 60;
+    float vel = 0.8f;
+
+    CHECK(sq_schedule_events(e, 1, 0, &beat, &kind, &chan, &note, &vel) == 0);
+    CHECK(sq_schedule_events(e, 1, 1, nullptr, &kind, &chan, &note, &vel) == 0);
+    CHECK(sq_schedule_events(nullptr, 1, 1, &beat, &kind, &chan, &note, &vel) == 0);
+}
+
+
 // ═══════════════════════════════════════════════════════════════════
 // param change dispatch — verify via getParameter
 // ═══════════════════════════════════════════════════════════════════
@@ -21,6 +21,47 @@ TEST_CASE("sq_midi_devices returns a list (may be empty in CI)")
     sq_engine_destroy(engine);
 }
 
+TEST_CASE("sq_midi_devices_version is stable without device changes")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    REQUIRE(engine != nullptr);
+
+    uint64_t v = sq_midi_devices_version(engine);
+    SqStringList list = sq_midi_devices(engine);  // enumerating isn't a change
+    sq_free_string_list(list);
+    CHECK(sq_midi_devices_version(engine) == v);
+    CHECK(sq_midi_devices_version(nullptr) == 0);
+
+    sq_engine_destroy(engine);
+}
+
+TEST_CASE("sq_midi_prefetch_devices result matches a direct enumeration")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    REQUIRE(engine != nullptr);
+
+    sq_midi_prefetch_devices(engine);
+    sq_midi_prefetch_devices(engine);  // second call while pending: no-op
+    SqStringList prefetched = sq_midi_devices(engine);
+    SqStringList direct = sq_midi_devices(engine);
+    REQUIRE(prefetched.count == direct.count);
+    for (int i = 0; i < direct.count; ++i)
+        CHECK(std::strcmp(prefetched.items[i], direct.items[i]) == 0);
+    sq_free_string_list(prefetched);
+    sq_free_string_list(direct);
+
+    sq_midi_prefetch_devices(nullptr);  // no crash
+    sq_engine_destroy(engine);
+}
+
+TEST_CASE("Destroying an engine with a prefetch pending is safe")
+{
+    SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
+    REQUIRE(engine != nullptr);
+    sq_midi_prefetch_devices(engine);
+    sq_engine_destroy(engine);
+}
+
 TEST_CASE("sq_midi_open_devices returns empty list initially")
 {
     SqEngine engine = sq_engine_create(44100.0, 512, nullptr);
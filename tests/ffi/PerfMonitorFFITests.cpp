@@ -3,6 +3,7 @@
 #include "ffi/squeeze_ffi.h"
 
 #include <cstring>
+#include <vector>
 
 using Catch::Matchers::WithinRel;
 using Catch::Matchers::WithinAbs;
@@ -246,6 +247,43 @@ TEST_CASE("sq_perf_slots returns entries after slot profiling with sources")
     sq_free_slot_perf_list(slots);
 }
 
+TEST_CASE("sq_perf_slots_into fills a caller array and reports the total")
+{
+    FFIEngine e;
+    sq_perf_enable(e, 1);
+    sq_perf_enable_slots(e, 1);
+    REQUIRE(sq_add_source(e, "Input") > 0);
+    e.renderN(kEnoughBlocks);
+
+    SqSlotPerfList list = sq_perf_slots(e);
+    REQUIRE(list.count >= 2);
+
+    std::vector<SqSlotPerf> buf(static_cast<size_t>(list.count));
+    int total = sq_perf_slots_into(e, buf.data(), list.count);
+    CHECK(total == list.count);
+    for (int i = 0; i < total; ++i)
+        CHECK(buf[static_cast<size_t>(i)].handle == list.items[i].handle);
+    sq_free_slot_perf_list(list);
+}
+
+TEST_CASE("sq_perf_slots_into with a short array writes only capacity entries")
+{
+    FFIEngine e;
+    sq_perf_enable(e, 1);
+    sq_perf_enable_slots(e, 1);
+    REQUIRE(sq_add_source(e, "Input") > 0);
+    e.renderN(kEnoughBlocks);
+
+    SqSlotPerf one[2] = {};
+    one[1].handle = -7;
+    int total = sq_perf_slots_into(e, one, 1);
+    CHECK(total >= 2);
+    CHECK(one[0].handle != 0);
+    CHECK(one[1].handle == -7);
+
+    CHECK(sq_perf_slots_into(e, nullptr, 0) == total);
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // Free functions — edge cases
 // ═══════════════════════════════════════════════════════════════════
@@ -280,6 +318,12 @@ TEST_CASE("sq_perf_slots on NULL engine returns empty list")
     CHECK(slots.count == 0);
 }
 
+TEST_CASE("sq_perf_slots_into on NULL engine returns 0")
+{
+    SqSlotPerf buf[4] = {};
+    CHECK(sq_perf_slots_into(nullptr, buf, 4) == 0);
+}
+
 TEST_CASE("sq_perf_enable on NULL engine does not crash")
 {
     sq_perf_enable(nullptr, 1);